@@ -1,7 +1,11 @@
 import gspread
+from gspread.utils import absolute_range_name, fill_gaps
 import csv
 import os
 import sys
+import time
+
+from cue_common import columnar_snapshot, import_manifest, sheet_source
 
 # --- Configuration (Modify these settings as needed for your environment) ---
 # 1. Google Sheets API and Google Drive API activation, service account creation:
@@ -28,13 +32,71 @@ OUTPUT_DIRECTORY = 'initial_csv_files'
 
 # List of worksheet names to download (based on your screenshot)
 WORKSHEET_NAMES_TO_DOWNLOAD = [
+    "8.13(수)",
+    "8.14(목)",
+    "8.15(금)",
+    "8.16(토)",
+    "8.17(일)",
     "운영위 명단",
     "도우미 명단",
     "도우미 배정용(서기용)"
 ]
 
+# 4. Batched import: fetch every worksheet above with a single values.batchGet request
+#    instead of two API calls (worksheet lookup + get_all_values) per sheet.
+#    Set to False to fall back to the sheet-by-sheet download.
+USE_BATCH_IMPORT = True
+
+# 5. Data source mode is taken from the CUE_SHEET_SOURCE environment variable:
+#    'live' (default) talks to Google Sheets, 'record' also stores the fetched values under
+#    'sheet_snapshots/', and 'replay' serves the stored values back without network or credentials.
+#    e.g. CUE_SHEET_SOURCE=replay python 1_import_all_sheets.py
+
+# 6. Import manifest: each worksheet's Drive modifiedTime and content hash are recorded in
+#    '<OUTPUT_DIRECTORY>_manifest.json'. Unchanged sheets are skipped and their CSV files
+#    (and mtimes) are left untouched. Set to True to re-download and rewrite everything.
+FORCE_REIMPORT = False
+
 # --- Function Definitions ---
 
+def write_sheet_if_changed(manifest, spreadsheet_id, sheet_name, output_csv_filename, all_values, modified_time):
+    """
+    Writes the CSV only if the content differs from the last import and records the sheet
+    in the manifest. Returns True if the CSV file was (re)written.
+    """
+    rows_hash = import_manifest.content_hash(all_values)
+    changed = FORCE_REIMPORT or not import_manifest.is_content_unchanged(
+        manifest, spreadsheet_id, sheet_name, rows_hash, output_csv_filename)
+    if changed:
+        write_rows_to_csv(output_csv_filename, all_values)
+    elif not columnar_snapshot.is_snapshot_fresh(output_csv_filename):
+        # CSV is unchanged (keep its mtime), but the columnar snapshot is missing or stale.
+        columnar_snapshot.write_snapshot(output_csv_filename, all_values)
+    import_manifest.record_sheet(manifest, spreadsheet_id, sheet_name, output_csv_filename,
+                                 rows_hash, modified_time, len(all_values))
+    return changed
+
+def sanitize_title(title, fallback):
+    """Keeps only characters that are safe in a CSV filename."""
+    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '.', '_')).strip()
+    return safe_title or fallback
+
+def build_output_csv_path(output_directory, spreadsheet_title, spreadsheet_id, worksheet_title):
+    """Returns the CSV path used for a worksheet: '<spreadsheet title>_<worksheet title>.csv'."""
+    safe_file_title = sanitize_title(spreadsheet_title, f"untitled_spreadsheet_{spreadsheet_id[:8]}")
+    safe_worksheet_title = sanitize_title(worksheet_title, "sheet_unnamed")
+    return os.path.join(output_directory, f"{safe_file_title}_{safe_worksheet_title}.csv")
+
+def write_rows_to_csv(output_csv_filename, all_values):
+    """
+    Writes the fetched rows of a worksheet to a CSV file, plus a typed columnar snapshot
+    ('.feather', written after the CSV so it is the fresher file) when pyarrow is installed.
+    """
+    with open(output_csv_filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerows(all_values) # Write all fetched rows to the CSV file.
+    columnar_snapshot.write_snapshot(output_csv_filename, all_values)
+
 def download_multiple_sheets_to_csv(spreadsheet_id, output_directory, service_account_file_path, sheet_names):
     """
     Downloads the content of multiple specified worksheets from a Google Spreadsheet
@@ -43,8 +105,8 @@ def download_multiple_sheets_to_csv(spreadsheet_id, output_directory, service_ac
     print(f"Current Python interpreter: {sys.executable}")
     print(f"gspread version: {gspread.__version__}")
 
-    # Validate service account file path
-    if not os.path.exists(service_account_file_path):
+    # Validate service account file path (not needed when replaying recorded sheets)
+    if sheet_source.get_source_mode() != sheet_source.MODE_REPLAY and not os.path.exists(service_account_file_path):
         print(f"Error: Service account JSON file path is incorrect or file does not exist: '{service_account_file_path}'")
         print("Please re-check the path or place the file in the specified location.")
         sys.exit(1) # Exit script
@@ -54,52 +116,52 @@ def download_multiple_sheets_to_csv(spreadsheet_id, output_directory, service_ac
     print(f"Saving CSV files to '{output_directory}' directory.")
 
     try:
-        # Authenticate with Google Sheets API using gspread
-        print(f"Attempting gspread authentication with service account file '{service_account_file_path}'...")
-        gc = gspread.service_account(filename=service_account_file_path)
-        print(f"gspread authentication successful! gc object type: {type(gc)}")
+        def make_client():
+            # Authenticate with Google Sheets API using gspread
+            print(f"Attempting gspread authentication with service account file '{service_account_file_path}'...")
+            gc = gspread.service_account(filename=service_account_file_path)
+            print(f"gspread authentication successful! gc object type: {type(gc)}")
+            return gc
 
-        print(f"Processing spreadsheet ID '{spreadsheet_id}'...")
+        print(f"Processing spreadsheet ID '{spreadsheet_id}' (source mode: {sheet_source.get_source_mode()})...")
 
         try:
             # Open the spreadsheet by its ID
-            current_spreadsheet = gc.open_by_key(spreadsheet_id)
+            current_spreadsheet = sheet_source.open_spreadsheet(spreadsheet_id, make_client)
             print(f"Successfully opened spreadsheet '{current_spreadsheet.title}'.")
 
+            manifest_path = import_manifest.manifest_path_for(output_directory)
+            manifest = import_manifest.load_manifest(manifest_path)
+            modified_time = import_manifest.get_drive_modified_time(current_spreadsheet)
+
             download_count = 0
+            skipped_count = 0
             # Iterate through each sheet name and download
             for sheet_name in sheet_names:
                 print(f"\nAttempting to download sheet '{sheet_name}'...")
+                output_csv_filename = build_output_csv_path(output_directory, current_spreadsheet.title, spreadsheet_id, sheet_name)
+                if not FORCE_REIMPORT and import_manifest.is_revision_unchanged(manifest, spreadsheet_id, sheet_name, modified_time, output_csv_filename):
+                    print(f"  -> Spreadsheet not modified since the last import. Keeping '{output_csv_filename}'.")
+                    skipped_count += 1
+                    continue
                 try:
                     # Get the worksheet by its name
                     worksheet_to_download = current_spreadsheet.worksheet(sheet_name)
                     print(f"  -> Successfully found sheet '{worksheet_to_download.title}' corresponding to the name.")
 
-                    # Sanitize file title for CSV filename
-                    safe_file_title = "".join(c for c in current_spreadsheet.title if c.isalnum() or c in (' ', '.', '_')).strip()
-                    if not safe_file_title: # Use a fallback name if title is empty
-                        safe_file_title = f"untitled_spreadsheet_{spreadsheet_id[:8]}"
-                    
-                    # Sanitize worksheet title for CSV filename
-                    safe_worksheet_title = "".join(c for c in worksheet_to_download.title if c.isalnum() or c in (' ', '.', '_')).strip()
-                    if not safe_worksheet_title:
-                        safe_worksheet_title = "sheet_unnamed" # Fallback if worksheet title is empty
-
-                    output_csv_filename = os.path.join(output_directory, f"{safe_file_title}_{safe_worksheet_title}.csv")
-                    
                     print(f"  -> Getting all data from sheet '{worksheet_to_download.title}'...")
                     all_values = worksheet_to_download.get_all_values()
 
                     if not all_values:
                         print(f"  Warning: Sheet '{worksheet_to_download.title}' has no data. An empty CSV file will be created.")
 
-                    # Write data to CSV file
-                    with open(output_csv_filename, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerows(all_values) # Write all fetched rows to the CSV file.
-
-                    print(f"  -> Content of sheet '{worksheet_to_download.title}' from '{current_spreadsheet.title}' successfully downloaded to '{output_csv_filename}'.")
-                    download_count += 1
+                    # Write data to CSV file (only if the content changed since the last import)
+                    if write_sheet_if_changed(manifest, spreadsheet_id, sheet_name, output_csv_filename, all_values, modified_time):
+                        print(f"  -> Content of sheet '{worksheet_to_download.title}' from '{current_spreadsheet.title}' successfully downloaded to '{output_csv_filename}'.")
+                        download_count += 1
+                    else:
+                        print(f"  -> Content of sheet '{worksheet_to_download.title}' is unchanged. Keeping '{output_csv_filename}'.")
+                        skipped_count += 1
 
                 except gspread.exceptions.WorksheetNotFound:
                     print(f"Warning: Sheet '{sheet_name}' not found. Skipping this sheet.")
@@ -108,7 +170,8 @@ def download_multiple_sheets_to_csv(spreadsheet_id, output_directory, service_ac
                     import traceback
                     traceback.print_exc()
 
-            print(f"\nTotal {download_count} spreadsheet sheets downloaded as individual CSV files.")
+            import_manifest.save_manifest(manifest_path, manifest)
+            print(f"\nTotal {download_count} spreadsheet sheets downloaded as individual CSV files ({skipped_count} unchanged sheets skipped).")
 
         except gspread.exceptions.SpreadsheetNotFound:
             print(f"Error: Spreadsheet ID '{spreadsheet_id}' not found or access denied. Please check the ID or ensure service account has permissions.")
@@ -130,6 +193,117 @@ def download_multiple_sheets_to_csv(spreadsheet_id, output_directory, service_ac
         traceback.print_exc()
         sys.exit(1)
 
+def download_multiple_sheets_batched(spreadsheet_id, output_directory, service_account_file_path, sheet_names):
+    """
+    Downloads the same worksheets as download_multiple_sheets_to_csv, but fetches all of them
+    with a single values.batchGet request and writes the CSV files from that one response.
+    Reports the wall-clock time and the number of Sheets API calls used.
+    """
+    print(f"Current Python interpreter: {sys.executable}")
+    print(f"gspread version: {gspread.__version__}")
+
+    if sheet_source.get_source_mode() != sheet_source.MODE_REPLAY and not os.path.exists(service_account_file_path):
+        print(f"Error: Service account JSON file path is incorrect or file does not exist: '{service_account_file_path}'")
+        print("Please re-check the path or place the file in the specified location.")
+        sys.exit(1)
+
+    os.makedirs(output_directory, exist_ok=True)
+    print(f"Saving CSV files to '{output_directory}' directory.")
+
+    started_at = time.perf_counter()
+    api_call_count = 0
+
+    try:
+        def make_client():
+            print(f"Attempting gspread authentication with service account file '{service_account_file_path}'...")
+            return gspread.service_account(filename=service_account_file_path)
+
+        print(f"Source mode: {sheet_source.get_source_mode()}")
+
+        try:
+            # Opening the spreadsheet fetches its metadata (title, sheet list): 1 API call.
+            current_spreadsheet = sheet_source.open_spreadsheet(spreadsheet_id, make_client)
+            api_call_count += 1
+            print(f"Successfully opened spreadsheet '{current_spreadsheet.title}'.")
+
+            # Drive modifiedTime of the spreadsheet: 1 API call.
+            manifest_path = import_manifest.manifest_path_for(output_directory)
+            manifest = import_manifest.load_manifest(manifest_path)
+            modified_time = import_manifest.get_drive_modified_time(current_spreadsheet)
+            api_call_count += 1
+
+            csv_paths = {
+                sheet_name: build_output_csv_path(output_directory, current_spreadsheet.title, spreadsheet_id, sheet_name)
+                for sheet_name in sheet_names
+            }
+            sheets_to_fetch = [
+                sheet_name for sheet_name in sheet_names
+                if FORCE_REIMPORT or not import_manifest.is_revision_unchanged(
+                    manifest, spreadsheet_id, sheet_name, modified_time, csv_paths[sheet_name])
+            ]
+            skipped_count = len(sheet_names) - len(sheets_to_fetch)
+            if skipped_count:
+                print(f"{skipped_count} sheets not modified since the last import. Keeping their CSV files.")
+
+            response = {'valueRanges': []}
+            if sheets_to_fetch:
+                # Fetch every remaining worksheet in one values.batchGet request: 1 API call.
+                ranges = [absolute_range_name(sheet_name) for sheet_name in sheets_to_fetch]
+                print(f"Fetching {len(ranges)} sheets with a single batchGet request...")
+                response = current_spreadsheet.values_batch_get(ranges)
+                api_call_count += 1
+        except gspread.exceptions.SpreadsheetNotFound:
+            print(f"Error: Spreadsheet ID '{spreadsheet_id}' not found or access denied. Please check the ID or ensure service account has permissions.")
+            sys.exit(1)
+        except (gspread.exceptions.APIError, sheet_source.WorksheetNotFound) as e:
+            # batchGet fails as a whole if any of the ranges does not exist (e.g. a renamed sheet).
+            print(f"Warning: Batched request failed ({e}). Falling back to sheet-by-sheet download.")
+            download_multiple_sheets_to_csv(spreadsheet_id, output_directory, service_account_file_path, sheet_names)
+            return
+
+        download_count = 0
+        # valueRanges are returned in the same order as the requested ranges.
+        for sheet_name, value_range in zip(sheets_to_fetch, response.get('valueRanges', [])):
+            try:
+                # Like get_all_values(), pad every row to the same width.
+                all_values = fill_gaps(value_range.get('values', []))
+                output_csv_filename = csv_paths[sheet_name]
+
+                if not all_values:
+                    print(f"  Warning: Sheet '{sheet_name}' has no data. An empty CSV file will be created.")
+
+                if write_sheet_if_changed(manifest, spreadsheet_id, sheet_name, output_csv_filename, all_values, modified_time):
+                    print(f"  -> Sheet '{sheet_name}' ({len(all_values)} rows) saved to '{output_csv_filename}'.")
+                    download_count += 1
+                else:
+                    print(f"  -> Sheet '{sheet_name}' is unchanged. Keeping '{output_csv_filename}'.")
+                    skipped_count += 1
+            except Exception as e:
+                print(f"Warning: An error occurred while writing sheet '{sheet_name}' ({e}). Skipping this sheet.")
+                import traceback
+                traceback.print_exc()
+
+        import_manifest.save_manifest(manifest_path, manifest)
+
+        elapsed = time.perf_counter() - started_at
+        print(f"\nTotal {download_count} spreadsheet sheets downloaded as individual CSV files ({skipped_count} unchanged sheets skipped).")
+        print(f"Batched import finished in {elapsed:.2f}s using {api_call_count} Sheets/Drive API calls "
+              f"(sheet-by-sheet download would use {1 + 2 * len(sheet_names)}).")
+
+    except gspread.exceptions.APIError as e:
+        print(f"Google API error occurred: {e}")
+        print("Please check service account permissions or Google Sheets API activation status.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        print("Detailed error information:")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
 # --- Script Execution ---
 if __name__ == "__main__":
-    download_multiple_sheets_to_csv(SPECIFIC_SPREADSHEET_ID, OUTPUT_DIRECTORY, SERVICE_ACCOUNT_FILE_PATH, WORKSHEET_NAMES_TO_DOWNLOAD)
\ No newline at end of file
+    if USE_BATCH_IMPORT:
+        download_multiple_sheets_batched(SPECIFIC_SPREADSHEET_ID, OUTPUT_DIRECTORY, SERVICE_ACCOUNT_FILE_PATH, WORKSHEET_NAMES_TO_DOWNLOAD)
+    else:
+        download_multiple_sheets_to_csv(SPECIFIC_SPREADSHEET_ID, OUTPUT_DIRECTORY, SERVICE_ACCOUNT_FILE_PATH, WORKSHEET_NAMES_TO_DOWNLOAD)
\ No newline at end of file
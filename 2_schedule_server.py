@@ -0,0 +1,249 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from cue_common.columnar_snapshot import snapshot_path_for
+from cue_common.schedule_query import ScheduleData, read_assigned_schedules, run_query
+
+# 🛰️ 도우미 일정 검색 서버
+# 배정 일정/도우미 명단을 메모리에 올려 두고, 여러 운영 단말에서 동시에 들어오는 검색을 바로 답합니다.
+# 검색어는 2_schedule_check.py와 같습니다: '이름', '요일 시간', '요일 시작시간 종료시간', '4', '중복'
+#  - HTTP:        curl 'http://127.0.0.1:8765/query?q=금+10:00'   /  상태: curl http://127.0.0.1:8765/status
+#  - Unix 소켓:   한 줄에 검색어 하나 → 한 줄에 JSON 결과 하나 (예: nc -U /tmp/schedule.sock)
+# 두 CSV(와 Feather 스냅샷)의 수정 시간을 주기적으로 확인해서, 바뀌면 다시 읽습니다.
+# 배정 일정만 바뀐 경우에는 배정이 달라진 요일만 색인을 다시 만듭니다. (다시 만드는 일은 모두 다른 스레드에서)
+#
+# 사용법: python 2_schedule_server.py [--host 127.0.0.1] [--port 8765] [--socket 경로] [--poll 2]
+
+SCHEDULE_FILE = '/Users/heeeonlee/2025KYSA/cue_sheet_checker/initial_csv_files/2025 KYSA 운영위원 통합 큐시트_도우미 배정용서기용.csv'
+HELPERS_FILE = '/Users/heeeonlee/2025KYSA/cue_sheet_checker/initial_csv_files/2025 KYSA 운영위원 통합 큐시트_도우미 명단.csv'
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+POLL_SECONDS = 2.0
+MAX_REQUEST_LINE = 8192
+
+
+def _file_signature(path):
+    """CSV와 스냅샷의 (수정 시간, 크기). 둘 중 하나라도 바뀌면 다시 읽습니다."""
+    signature = []
+    for candidate in (path, snapshot_path_for(path)):
+        try:
+            stat = os.stat(candidate)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _reload_schedules(data, schedule_path):
+    """(다른 스레드에서) 배정 일정을 다시 읽어, 달라진 요일만 다시 만든 새 ScheduleData와 그 요일 목록을 반환합니다."""
+    return data.with_schedules(read_assigned_schedules(schedule_path))
+
+
+class ScheduleStore:
+    """현재 ScheduleData와 파일 상태를 들고 있다가, 파일이 바뀌면 다시 읽습니다."""
+
+    def __init__(self, schedule_path, helpers_path):
+        self.schedule_path = schedule_path
+        self.helpers_path = helpers_path
+        self.data = None
+        self.signatures = (None, None)
+        self.loaded_at = None
+        self.reload_count = 0
+        self.last_error = None
+
+    def load(self):
+        self.signatures = (_file_signature(self.schedule_path), _file_signature(self.helpers_path))
+        self.data = ScheduleData.load(self.schedule_path, self.helpers_path)
+        self.loaded_at = time.time()
+        print(f"✅ 일정/명단을 읽었습니다. (배정된 인원 {len(self.data.assigned_schedules)}명, 명단 {len(self.data.all_helpers)}명)")
+
+    async def reload_if_changed(self):
+        """파일이 바뀌었으면 다른 스레드에서 다시 읽고(검색은 계속 응답), 다 읽은 뒤 한 번에 바꿔 끼웁니다."""
+        signatures = (_file_signature(self.schedule_path), _file_signature(self.helpers_path))
+        if signatures == self.signatures:
+            return
+        schedule_changed = signatures[0] != self.signatures[0]
+        helpers_changed = signatures[1] != self.signatures[1]
+        try:
+            if helpers_changed:
+                # 명단이 바뀌면 행렬의 행(사람)이 달라지므로 전부 다시 만듭니다.
+                data = await asyncio.to_thread(ScheduleData.load, self.schedule_path, self.helpers_path)
+                self.data = data
+                print("🔄 도우미 명단이 바뀌어 전체 색인을 다시 만들었습니다.")
+            elif schedule_changed:
+                data, changed_days = await asyncio.to_thread(_reload_schedules, self.data, self.schedule_path)
+                self.data = data
+                print(f"🔄 배정 일정이 바뀌었습니다. 다시 만든 요일: {', '.join(changed_days) if changed_days else '없음'}")
+        except Exception as e:
+            # 가져오기 도중(파일을 쓰는 중)일 수 있으므로 이전 데이터로 계속 응답하고 다음 확인 때 다시 시도합니다.
+            self.last_error = str(e)
+            print(f"⚠️ 다시 읽기 실패 (이전 데이터로 계속 응답합니다): {e}")
+            return
+        self.signatures = signatures
+        self.loaded_at = time.time()
+        self.reload_count += 1
+        self.last_error = None
+
+    def status(self):
+        return {
+            'schedule_path': self.schedule_path,
+            'helpers_path': self.helpers_path,
+            'loaded_at': self.loaded_at,
+            'reload_count': self.reload_count,
+            'last_error': self.last_error,
+            'assigned_helpers': len(self.data.assigned_schedules),
+            'roster_helpers': len(self.data.all_helpers),
+        }
+
+
+async def watch_files(store, poll_seconds):
+    while True:
+        await asyncio.sleep(poll_seconds)
+        await store.reload_if_changed()
+
+
+# --- HTTP ---
+
+def _http_response(writer, status, payload):
+    body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    reason = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+              500: 'Internal Server Error'}[status]
+    writer.write(f"HTTP/1.1 {status} {reason}\r\n"
+                 f"Content-Type: application/json; charset=utf-8\r\n"
+                 f"Content-Length: {len(body)}\r\n"
+                 f"Connection: close\r\n\r\n".encode('ascii') + body)
+
+
+def _route(store, request_line):
+    """요청 줄 → (상태 코드, JSON 본문)"""
+    parts = request_line.split()
+    if len(parts) < 2:
+        return 400, {'ok': False, 'error': "잘못된 요청입니다."}
+    if parts[0] != 'GET':
+        return 405, {'ok': False, 'error': "GET만 지원합니다."}
+    url = urlsplit(parts[1])
+    params = parse_qs(url.query)
+    if url.path == '/status':
+        return 200, store.status()
+    if url.path == '/query' and params.get('q'):
+        return 200, run_query(store.data, params['q'][0])
+    return 404, {'ok': False, 'error': "사용법: /query?q=검색어 또는 /status"}
+
+
+async def handle_http(store, reader, writer):
+    """GET /query?q=검색어, GET /status 만 처리하는 작은 HTTP 서버 (요청 하나 → 응답 하나)."""
+    try:
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass  # 헤더는 쓰지 않습니다.
+        except ValueError:
+            # 요청 줄/헤더가 MAX_REQUEST_LINE보다 길면 readline이 ValueError(LimitOverrunError)를 냅니다.
+            status, payload = 400, {'ok': False, 'error': "요청이 너무 길거나 잘못되었습니다."}
+        else:
+            try:
+                status, payload = _route(store, request_line)
+            except Exception as e:
+                # 검색 중 예상하지 못한 오류: 연결을 그냥 끊지 않고 500과 오류 내용을 돌려줍니다.
+                print(f"⚠️ 요청 처리 중 오류 ({request_line}): {e}")
+                status, payload = 500, {'ok': False, 'error': f"서버 내부 오류: {e}"}
+        _http_response(writer, status, payload)
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+# --- Unix 소켓 (한 줄 검색어 → 한 줄 JSON) ---
+
+async def handle_line_client(store, reader, writer):
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:  # MAX_REQUEST_LINE보다 긴 줄
+                result = {'ok': False, 'error': "검색어가 너무 깁니다."}
+            else:
+                if not line:
+                    break
+                query = line.decode('utf-8', errors='replace').strip()
+                if not query:
+                    continue
+                if query.lower() in ('종료', 'exit'):
+                    break
+                try:
+                    result = store.status() if query == 'status' else run_query(store.data, query)
+                except Exception as e:
+                    print(f"⚠️ 검색 처리 중 오류 ({query}): {e}")
+                    result = {'query': query, 'ok': False, 'error': f"서버 내부 오류: {e}"}
+            writer.write((json.dumps(result, ensure_ascii=False) + "\n").encode('utf-8'))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_http_server(store, host, port):
+    return await asyncio.start_server(lambda r, w: handle_http(store, r, w), host, port, limit=MAX_REQUEST_LINE)
+
+
+async def start_socket_server(store, socket_path):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    return await asyncio.start_unix_server(lambda r, w: handle_line_client(store, r, w), socket_path,
+                                           limit=MAX_REQUEST_LINE)
+
+
+async def serve(store, host, port, socket_path, poll_seconds):
+    servers = []
+    if port:
+        servers.append(await start_http_server(store, host, port))
+        print(f"🌐 HTTP: http://{host}:{port}/query?q=검색어")
+    if socket_path:
+        servers.append(await start_socket_server(store, socket_path))
+        print(f"🔌 Unix 소켓: {socket_path}")
+    if not servers:
+        print("❌ 오류: --port 또는 --socket 중 하나는 지정해야 합니다.")
+        return
+
+    watcher = asyncio.create_task(watch_files(store, poll_seconds))
+    try:
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        watcher.cancel()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="도우미 일정 검색 서버 (파일이 바뀌면 자동으로 다시 읽음)")
+    parser.add_argument('--schedule', default=SCHEDULE_FILE, help="배정 일정 CSV 경로")
+    parser.add_argument('--helpers', default=HELPERS_FILE, help="도우미 명단 CSV 경로")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="HTTP 포트 (0이면 HTTP를 열지 않음)")
+    parser.add_argument('--socket', default=None, metavar='경로', help="Unix 소켓 경로 (지정하면 함께 엽니다)")
+    parser.add_argument('--poll', type=float, default=POLL_SECONDS, help="파일 변경 확인 간격(초)")
+    args = parser.parse_args()
+
+    store = ScheduleStore(args.schedule, args.helpers)
+    try:
+        store.load()
+    except FileNotFoundError as e:
+        print(f"❌ 오류: 파일을 찾을 수 없습니다:\n   {e.filename}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"일정/명단 파일을 읽는 중 오류가 발생했습니다: {e}")
+        sys.exit(1)
+
+    try:
+        asyncio.run(serve(store, args.host, args.port, args.socket, args.poll))
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다.")
@@ -2,6 +2,7 @@ import ssl
 ssl._create_default_https_context = ssl._create_unverified_context
 
 import os
+import inspect
 import gspread
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -9,8 +10,10 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from datetime import datetime
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from queue import Full, Queue
 from threading import Lock
+from reportlab import Version as REPORTLAB_VERSION
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet
@@ -19,6 +22,12 @@ from reportlab.lib.units import inch
 from io import BytesIO
 import csv
 
+from cue_common import columnar_snapshot, fonts, import_manifest, sheet_source
+from cue_common.chunked_render import DEFAULT_CHUNK_ROWS, ChunkedStory, MemoryTracker, format_bytes, rss_cap_bytes
+from cue_common.fill import forward_fill_rows
+from cue_common.participant_table import assemble_participant_table, build_participant_index, slice_group_columns
+from cue_common.render_cache import DEFAULT_CACHE_DIRNAME, RenderCache
+
 # 🔐 인증 설정
 # Google Sheets에서 데이터를 읽어오므로 'spreadsheets' 스코프가 필요합니다.
 SCOPES = [
@@ -62,7 +71,6 @@ day_folder_map = {
     "sun": "1n6zRW-V8XUDUOSucAxecB9ps2jzdSLxF"
 }
 
-print("📋 요청에 따라 수요일 시트만 처리합니다.")
 choice = "1"
 sheet_name = sheet_options[choice]
 csv_filename = sheet_name + ".csv" # 로컬에 저장될 CSV 파일 이름
@@ -75,28 +83,51 @@ folder_id = day_folder_map.get(day_tag)
 if not folder_id:
     raise ValueError(f"❌ 해당 요일에 매핑된 폴더 ID가 없습니다: {day_tag}")
 
-# 🌐 서비스 객체 생성 (Sheets 및 Drive)
-creds = authorize()
-gc = gspread.authorize(creds)
-drive_service = build("drive", "v3", credentials=creds)
+# 🌐 실행 모드
+# CUE_SHEET_SOURCE=replay 이면 인증/네트워크 없이 기록된 시트 데이터로 실행하고,
+# Drive 업로드 대신 REPLAY_OUTPUT_DIR 폴더에 PDF를 저장합니다.
+# 인증, 시트 다운로드 같은 실행 작업은 main()에서 합니다. (렌더링 워커 프로세스가 이 파일을 다시 import해도 반복되지 않도록)
+OFFLINE = sheet_source.is_offline()
+REPLAY_OUTPUT_DIR = os.path.join('replay_output', day_tag)
 
 # 스프레드시트 키
 SPREADSHEET_ID = "1Vu6j1GYGu7_mCLSMfjbxkYDOrXBavnbTNzQOjZiIUgk"
 
+# 가져오기 기록 파일 (1_import_all_sheets.py와 같은 manifest를 쓰지만, CSV 경로가 달라 기록은 따로 남습니다)
+IMPORT_MANIFEST_PATH = import_manifest.manifest_path_for('initial_csv_files')
+
 def download_sheet_as_csv(spreadsheet_id, sheet_name, output_filename, gspread_client):
     """
     Google 스프레드시트의 특정 시트 데이터를 가져와 CSV 파일로 로컬에 저장합니다.
+    지난 가져오기 이후 스프레드시트가 수정되지 않았으면 로컬 CSV를 그대로 사용하고,
+    내려받은 내용이 같으면 CSV 파일을 다시 쓰지 않습니다.
     """
     print(f"\n📥 Google Sheet '{sheet_name}'에서 데이터 추출 중...")
+    manifest = import_manifest.load_manifest(IMPORT_MANIFEST_PATH)
     try:
-        spreadsheet = gspread_client.open_by_key(spreadsheet_id)
+        spreadsheet = sheet_source.open_spreadsheet(spreadsheet_id, lambda: gspread_client)
+        modified_time = import_manifest.get_drive_modified_time(spreadsheet)
+        if import_manifest.is_revision_unchanged(manifest, spreadsheet_id, sheet_name, modified_time, output_filename):
+            with open(output_filename, 'r', newline='', encoding='utf-8') as f:
+                all_values = list(csv.reader(f))
+            print(f"⏭️ '{sheet_name}' 시트는 지난 가져오기 이후 수정되지 않아 '{output_filename}'을 그대로 사용합니다.")
+            return True, all_values
+
         source_sheet = spreadsheet.worksheet(sheet_name)
         all_values = source_sheet.get_all_values()
 
-        with open(output_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerows(all_values)
-        print(f"✅ '{sheet_name}' 시트 데이터가 '{output_filename}'으로 성공적으로 저장되었습니다.")
+        rows_hash = import_manifest.content_hash(all_values)
+        if import_manifest.is_content_unchanged(manifest, spreadsheet_id, sheet_name, rows_hash, output_filename):
+            print(f"⏭️ '{sheet_name}' 시트 내용이 바뀌지 않아 '{output_filename}'을 다시 쓰지 않습니다.")
+        else:
+            with open(output_filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerows(all_values)
+            columnar_snapshot.write_snapshot(output_filename, all_values)
+            print(f"✅ '{sheet_name}' 시트 데이터가 '{output_filename}'으로 성공적으로 저장되었습니다.")
+        import_manifest.record_sheet(manifest, spreadsheet_id, sheet_name, output_filename,
+                                     rows_hash, modified_time, len(all_values))
+        import_manifest.save_manifest(IMPORT_MANIFEST_PATH, manifest)
         return True, all_values
     except gspread.exceptions.SpreadsheetNotFound:
         print(f"❌ 오류: 스프레드시트 ID '{spreadsheet_id}'를 찾을 수 없습니다.")
@@ -108,80 +139,84 @@ def download_sheet_as_csv(spreadsheet_id, sheet_name, output_filename, gspread_c
         print(f"❌ Google Sheet에서 CSV 추출 중 오류 발생: {e}")
         return False, None
 
-# --- [새로 추가된 데이터 전처리 함수: 모든 빈 셀을 위 셀 내용으로 채움] ---
-def fill_data_down_all_columns(data_rows):
-    """
-    주어진 2D 리스트(테이블 데이터)에서 각 열의 빈 셀을 바로 위 행의 같은 열 값으로 채워 넣습니다.
-    스프레드시트의 병합 해제 시뮬레이션에 유용합니다.
-    """
-    if not data_rows:
-        return []
-
-    # 원본 데이터 수정 방지를 위해 깊은 복사 (리스트의 리스트)
-    processed_data = [list(row) for row in data_rows]
-
-    # 모든 행이 동일한 길이를 가지도록 최대 열 수를 기준으로 확장
-    max_cols = max(len(row) for row in processed_data)
-    for r_idx in range(len(processed_data)):
-        while len(processed_data[r_idx]) < max_cols:
-            processed_data[r_idx].append("") # 빈 문자열로 채워 길이 맞춤
-
-    # 각 열별로 마지막으로 채워진 값을 저장할 리스트
-    # 첫 행의 값이 0이거나 빈 문자열인 경우를 대비해 None으로 초기화
-    last_filled_values = [None] * max_cols
-
-    for r_idx, row in enumerate(processed_data):
-        for c_idx in range(max_cols):
-            current_cell_value = row[c_idx].strip() # 현재 셀 값 (공백 제거)
-
-            if current_cell_value: # 현재 셀에 값이 있으면
-                last_filled_values[c_idx] = current_cell_value # 이 값을 '마지막 채워진 값'으로 업데이트
-            elif last_filled_values[c_idx] is not None: # 현재 셀이 비어있고, 이전에 채워진 값이 있다면
-                row[c_idx] = last_filled_values[c_idx] # 이전 값으로 현재 셀을 채움
-            # 만약 현재 셀이 비어있고, 'last_filled_values[c_idx]'도 None이면 (예: 해당 열의 첫 행부터 비어있는 경우),
-            # 해당 셀은 비워둔 채로 유지됩니다.
-
-        processed_data[r_idx] = row # 수정된 행을 다시 할당
-
-    return processed_data
-# --- [새로 추가된 데이터 전처리 함수 끝] ---
-
-
-# 📄 데이터 준비: Google Sheet에서 CSV를 다운로드하고 데이터를 로드합니다.
-success, raw_data = download_sheet_as_csv(SPREADSHEET_ID, sheet_name, csv_filename, gc)
-if not success or not raw_data:
-    print("❌ 데이터 로드에 실패했습니다. 스크립트를 종료합니다.")
-    exit()
-
-# CSV 데이터의 모든 빈 셀을 위 셀 내용으로 채우는 전처리
-print("🔧 CSV 데이터의 모든 빈 셀을 위 셀 내용으로 채우는 중...")
-data = fill_data_down_all_columns(raw_data)
-print("✅ 데이터 전처리 완료.")
-
 
 # 참가자 목록 및 그룹 시작 열 인덱스
 participants = ["남윤범", "안가현", "이희언","김지혜", "최윤영", "장정현", "최현수"]
-# 전처리된 데이터를 기반으로 헤더와 본문 분리
-# CSV로 내보내졌을 때 스프레드시트의 1행부터 데이터가 시작한다고 가정하면,
-# header_rows = data[0:2] (첫 2행), body_rows = data[2:] (나머지 행)가 될 수 있습니다.
-# CSV 파일의 실제 구조를 확인하고 필요에 따라 이 값을 조정하세요.
-header_rows = data[1:3] # 전처리된 데이터의 2번째, 3번째 행을 헤더로 사용 (0-based index)
-body_rows = data[3:]   # 전처리된 데이터의 4번째 행부터 본문으로 사용 (0-based index)
 
 # 그룹 시작 열 (고정된 첫 6개 열 다음부터 시작하는 각 그룹의 첫 열 인덱스)
 group_starts = [6, 9, 12, 15, 18, 21]
 
-# 📦 상태 변수
+# 🚚 렌더링 → 업로드 파이프라인 설정
+RENDER_WORKERS = os.cpu_count() or 1  # PDF 렌더링 프로세스 수 (CPU 작업)
+UPLOAD_WORKERS = 4                    # Drive 업로드 스레드 수 (네트워크 대기)
+UPLOAD_QUEUE_SIZE = 8                 # 렌더링이 끝나고 업로드를 기다리는 PDF 최대 개수
+MAX_RENDER_RSS_MB = 1024              # PDF 하나를 렌더링하는 워커의 최대 메모리(RSS) 상한. 넘으면 그 PDF는 실패 처리 (0: 상한 없음)
+UPLOAD_PUT_TIMEOUT = 5.0              # 큐가 가득 찼을 때 업로드 스레드가 살아 있는지 확인하는 간격(초)
+_UPLOAD_DONE = None                   # 업로드 스레드 종료 신호
+
+# 📦 결과 목록 (출력은 lock으로 묶어서 여러 스레드의 줄이 섞이지 않게 합니다)
 success_list = []
 fail_list = []
 skipped_list = []
 lock = Lock()
-created_count = 0
-moved_count = 0
-start_count = 0
 
-def delete_all_files_in_folder():
+
+class StageMetrics:
+    """파이프라인 단계 하나의 처리 개수, 작업 시간 합계, 처음 시작부터 마지막 완료까지의 구간을 기록합니다."""
+
+    def __init__(self, name):
+        self.name = name
+        self.completed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.first_start = None
+        self.last_end = None
+        self._lock = Lock()
+
+    def start(self):
+        with self._lock:
+            if self.first_start is None:
+                self.first_start = time.perf_counter()
+
+    def record(self, seconds, ok=True):
+        with self._lock:
+            if ok: self.completed += 1
+            else: self.failed += 1
+            self.busy_seconds += seconds
+            self.last_end = time.perf_counter()
+
+    def summary(self):
+        wall = self.last_end - self.first_start if self.first_start is not None and self.last_end is not None else 0.0
+        rate = self.completed / wall if wall > 0 else 0.0
+        return (f"{self.name}: {self.completed}개 완료, {self.failed}개 실패, "
+                f"작업 시간 합계 {self.busy_seconds:.1f}초, 구간 {wall:.1f}초 (초당 {rate:.1f}개)")
+
+
+class QueueMetrics:
+    """업로드 대기 큐의 깊이(넣은 직후 기준)와, 큐가 가득 차서 렌더링 쪽이 기다린 시간을 기록합니다."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.puts = 0
+        self.max_depth = 0
+        self.total_depth = 0
+        self.blocked_seconds = 0.0
+
+    def record(self, depth, blocked_seconds):
+        self.puts += 1
+        self.max_depth = max(self.max_depth, depth)
+        self.total_depth += depth
+        self.blocked_seconds += blocked_seconds
+
+    def summary(self):
+        average = self.total_depth / self.puts if self.puts else 0.0
+        return (f"📦 업로드 대기 큐: 최대 {self.max_depth}/{self.maxsize}, 평균 {average:.1f}, "
+                f"큐가 가득 차 렌더링이 기다린 시간 {self.blocked_seconds:.1f}초")
+
+def delete_all_files_in_folder(creds):
     """지정된 Google Drive 폴더의 모든 파일을 삭제합니다."""
+    if OFFLINE:
+        return
     with lock:
         print("🧹 Google Drive 폴더 내 기존 파일들을 모두 삭제합니다...")
     local_drive_service = build("drive", "v3", credentials=creds)
@@ -204,34 +239,69 @@ def delete_all_files_in_folder():
         with lock:
             print(f"❌ 모든 파일 삭제 실패: {e}")
 
-def create_pdf(data_rows, title):
-    """주어진 데이터를 사용하여 PDF 파일을 메모리상에서 생성합니다."""
+def create_pdf(data_rows, title, font_name=None, memory=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    주어진 데이터를 사용하여 PDF 파일을 메모리상에서 생성합니다. font_name: 등록된 한글 폰트 (cue_common/fonts.py)
+    story는 chunk_rows행씩 그릴 차례가 되었을 때 만듭니다. (긴 표도 한 조각 분량의 flowable만 메모리에 올라감)
+    memory(MemoryTracker)를 주면 조각마다 최대 메모리를 확인합니다.
+    """
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
     styles = getSampleStyleSheet()
-    story = []
-
-    story.append(Paragraph(f"<b>{title}</b>", styles['h1']))
-    story.append(Spacer(1, 0.2 * inch))
-
-    for row_index, row in enumerate(data_rows):
-        row_text = []
-        for cell in row:
-            row_text.append(str(cell).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
-        
-        if row_index == 0:
-            story.append(Paragraph("<b>" + " | ".join(row_text) + "</b>", styles['Normal']))
-        else:
-            story.append(Paragraph(" | ".join(row_text), styles['Normal']))
-        story.append(Spacer(1, 0.05 * inch))
-
-    doc.build(story)
+    if font_name:
+        styles['h1'].fontName = font_name
+        styles['Normal'].fontName = font_name
+
+    def row_flowables(rows, start):
+        flowables = []
+        for row_index, row in enumerate(rows, start):
+            row_text = []
+            for cell in row:
+                row_text.append(str(cell).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
+
+            if row_index == 0:
+                flowables.append(Paragraph("<b>" + " | ".join(row_text) + "</b>", styles['Normal']))
+            else:
+                flowables.append(Paragraph(" | ".join(row_text), styles['Normal']))
+            flowables.append(Spacer(1, 0.05 * inch))
+        return flowables
+
+    def story_chunks():
+        yield [Paragraph(f"<b>{title}</b>", styles['h1']), Spacer(1, 0.2 * inch)]
+        for start in range(0, len(data_rows), chunk_rows):
+            yield row_flowables(data_rows[start:start + chunk_rows], start)
+
+    doc.build(ChunkedStory(story_chunks(), memory.check if memory else None))
     buffer.seek(0)
     return buffer
 
+_render_font_name = None
+
+def _init_render_worker(font_path):
+    """렌더링 워커 프로세스마다 한 번: 한글 폰트(서브셋)를 reportlab에 등록합니다."""
+    global _render_font_name
+    _render_font_name = fonts.register_reportlab_font(font_path)
+
+def render_participant_pdf(job):
+    """렌더링 워커 프로세스에서 실행합니다: job = (순번, 이름, 표, 제목) → (PDF 바이트, 걸린 시간(초), 최대 메모리(바이트))"""
+    _, _, table, title = job
+    started = time.perf_counter()
+    with MemoryTracker(rss_cap_bytes(MAX_RENDER_RSS_MB)) as memory:
+        pdf_bytes = create_pdf(table, title, _render_font_name, memory).getvalue()
+        memory.check(after_write=True)  # 마지막 조각의 레이아웃과 PDF 쓰기까지 상한 안이어야 합니다.
+    return pdf_bytes, time.perf_counter() - started, memory.peak_bytes
+
 def upload_file_to_drive(file_buffer, file_name, mime_type, local_drive_service, index, total, max_retries=3):
     """Google Drive에 파일을 업로드합니다."""
-    global moved_count
+    if OFFLINE:
+        os.makedirs(REPLAY_OUTPUT_DIR, exist_ok=True)
+        local_path = os.path.join(REPLAY_OUTPUT_DIR, file_name)
+        with open(local_path, 'wb') as f:
+            f.write(file_buffer.getvalue())
+        with lock:
+            print(f"💾 ({index}/{total}) '{file_name}' → '{local_path}'에 저장됨 (replay 모드)")
+        return True
+
     file_metadata = {
         'name': file_name,
         'parents': [folder_id],
@@ -249,7 +319,6 @@ def upload_file_to_drive(file_buffer, file_name, mime_type, local_drive_service,
                 fields='id'
             ).execute()
             with lock:
-                moved_count += 1
                 print(f"✅ ({index}/{total}) '{file_name}' → 성공적으로 업로드됨. 파일 ID: {file.get('id')}")
             return True
         except Exception as e:
@@ -260,76 +329,198 @@ def upload_file_to_drive(file_buffer, file_name, mime_type, local_drive_service,
         print(f"🔥 '{file_name}' → {max_retries}번 시도 후 업로드 실패")
     return False
 
-def make_sheet_file(name):
-    """각 참가자별 데이터를 처리하여 PDF를 생성하고 Google Drive에 업로드합니다."""
-    global created_count, moved_count, start_count
-    index = None
-    with lock:
-        start_count += 1
-        index = start_count
-        print(f"\n📝 ({index}/{len(participants)}) '{name}'의 데이터 처리 중...")
-
-    local_drive_service = build("drive", "v3", credentials=creds)
+def upload_worker(upload_queue, creds, total, metrics):
+    """
+    업로드 스레드: 큐에서 PDF를 꺼내 Drive에 올립니다. 종료 신호를 받을 때까지 반복합니다.
+    Drive 연결이나 업로드 하나가 실패해도 스레드는 끝내지 않고 그 PDF만 실패로 기록합니다.
+    (스레드가 먼저 끝나면 큐가 비워지지 않아 렌더링 쪽 put()이 멈춥니다)
+    """
+    try:
+        local_drive_service = None if OFFLINE else build("drive", "v3", credentials=creds)
+        service_error = None
+    except Exception as e:
+        local_drive_service, service_error = None, e
+        with lock:
+            print(f"❌ Drive 서비스 연결 실패, 이 스레드가 받은 PDF는 업로드하지 않습니다: {e}")
+    while True:
+        item = upload_queue.get()
+        if item is _UPLOAD_DONE:
+            return
+        index, name, file_name, pdf_bytes = item
+        metrics.start()
+        started = time.perf_counter()
+        ok = False
+        if service_error is None:
+            try:
+                ok = upload_file_to_drive(BytesIO(pdf_bytes), file_name, 'application/pdf', local_drive_service, index, total)
+            except Exception as e:
+                with lock:
+                    print(f"❌ '{file_name}' 업로드 중 오류 발생: {e}")
+        metrics.record(time.perf_counter() - started, ok)
+        with lock:
+            (success_list if ok else fail_list).append(name)
 
-    active_set_indexes = []
-    for i, s in enumerate(group_starts):
-        for row in body_rows:
-            if len(row) > s + 2 and (name in row[s+1] or name in row[s+2]):
-                active_set_indexes.append(i)
-                break
+def run_pipeline(tables, creds, render_cache, render_workers=RENDER_WORKERS,
+                 upload_workers=UPLOAD_WORKERS, queue_size=UPLOAD_QUEUE_SIZE):
+    """
+    참가자별 표 [(이름, 표), ...]를 렌더링(프로세스 풀) → 업로드 대기 큐(크기 제한) → 업로드(스레드 풀) 순서로 처리합니다.
+    렌더링 작업은 워커 수만큼만 넣어 두고, 끝난 PDF를 큐에 넣은 뒤에야 다음 작업을 넣습니다.
+    큐가 가득 차면 put()에서 기다리므로 업로드가 느려도 렌더링된 PDF가 메모리에 쌓이지 않습니다. (backpressure)
+    기다리는 동안 업로드 스레드가 모두 끝나 버렸으면 멈춰 있지 않고 RuntimeError를 발생시킵니다.
+    """
+    total = len(tables)
+    render_metrics = StageMetrics("🎨 렌더링")
+    upload_metrics = StageMetrics("⬆️ 업로드")
+    upload_queue = Queue(maxsize=queue_size)
+    queue_metrics = QueueMetrics(queue_size)
+
+    uploaders = []
+
+    def put_for_upload(item):
+        """큐에 자리가 날 때까지 기다립니다. 업로드 스레드가 모두 끝나 버렸으면 기다리지 않고 False를 반환합니다."""
+        while True:
+            try:
+                upload_queue.put(item, timeout=UPLOAD_PUT_TIMEOUT)
+                return True
+            except Full:
+                if all(uploader.done() for uploader in uploaders):
+                    return False
+
+    def enqueue(index, name, pdf_bytes):
+        file_name = f"{name}_{day_tag}_{datetime.now().strftime('%H%M%S')}.pdf"
+        started = time.perf_counter()
+        if not put_for_upload((index, name, file_name, pdf_bytes)):
+            errors = [str(error) for error in (uploader.exception() for uploader in uploaders) if error]
+            raise RuntimeError(f"업로드 스레드가 모두 종료되어 '{name}' PDF를 업로드할 수 없습니다: {errors}")
+        queue_metrics.record(upload_queue.qsize(), time.perf_counter() - started)
+
+    with ThreadPoolExecutor(max_workers=upload_workers) as upload_pool:
+        for _ in range(upload_workers):
+            uploaders.append(upload_pool.submit(upload_worker, upload_queue, creds, total, upload_metrics))
+        try:
+            # 표 내용이 지난 실행과 같은 참가자는 렌더링 없이 캐시된 PDF를 바로 업로드 큐에 넣습니다.
+            jobs, cache_keys = [], {}
+            for index, (name, table) in enumerate(tables, 1):
+                cache_keys[index] = render_cache.key([day_tag, name, table])
+                cached_pdf = render_cache.load_bytes(cache_keys[index])
+                if cached_pdf is not None:
+                    with lock:
+                        print(f"♻️  ({index}/{total}) '{name}': 내용 변경 없음, 캐시된 PDF 재사용")
+                    enqueue(index, name, cached_pdf)
+                else:
+                    jobs.append((index, name, table, f"{name} Sheet"))
+
+            largest_peak = (None, None)  # 최대 메모리가 가장 컸던 문서 (이름, 바이트)
+            if jobs:
+                # 이번에 렌더링할 모든 표와 제목에 쓰인 글자만 담은 폰트 서브셋을 한 번 만들어 모든 워커가 함께 씁니다.
+                font_path = fonts.subset_font(fonts.collect_characters([(table, title) for _, _, table, title in jobs]))
+                workers = max(1, min(render_workers, len(jobs)))
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                         initargs=(font_path,)) as render_pool:
+                    pending_jobs = iter(jobs)
+                    in_flight = {}
+
+                    def submit_next():
+                        job = next(pending_jobs, None)
+                        if job is not None:
+                            in_flight[render_pool.submit(render_participant_pdf, job)] = job
+
+                    render_metrics.start()
+                    for _ in range(workers):
+                        submit_next()
+                    while in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            index, name, _, _ = in_flight.pop(future)
+                            try:
+                                pdf_bytes, seconds, peak_bytes = future.result()
+                            except Exception as e:
+                                render_metrics.record(0.0, ok=False)
+                                with lock:
+                                    print(f"❌ '{name}' PDF 생성 중 오류 발생: {e}")
+                                    fail_list.append(name)
+                            else:
+                                render_metrics.record(seconds)
+                                if peak_bytes and peak_bytes > (largest_peak[1] or 0):
+                                    largest_peak = (name, peak_bytes)
+                                render_cache.store_bytes(cache_keys[index], pdf_bytes)
+                                with lock:
+                                    print(f"🛠️  ({index}/{total}) '{name}' PDF 생성 완료 "
+                                          f"({seconds:.2f}초, 최대 메모리 {format_bytes(peak_bytes)})")
+                                enqueue(index, name, pdf_bytes)
+                            submit_next()
+        finally:
+            # 렌더링 중 오류가 나도 업로드 스레드가 끝나야 with 블록을 빠져나갈 수 있습니다.
+            for _ in range(upload_workers):
+                put_for_upload(_UPLOAD_DONE)
+
+    print("\n⏱️ 단계별 처리량")
+    print(render_metrics.summary())
+    print(upload_metrics.summary())
+    print(queue_metrics.summary())
+    if largest_peak[1]:
+        # 워커 수를 정할 때 참고: 워커마다 이 정도 메모리가 필요할 수 있습니다.
+        print(f"🧠 문서별 최대 메모리: 가장 큰 문서 '{largest_peak[0]}' {format_bytes(largest_peak[1])} "
+              f"(렌더링 워커 {workers}개 × {format_bytes(largest_peak[1])} = 약 {format_bytes(workers * largest_peak[1])})")
+
+def main():
+    print("📋 요청에 따라 수요일 시트만 처리합니다.")
+    if OFFLINE:
+        print(f"🔌 replay 모드: 기록된 시트 데이터를 사용하고, PDF는 '{REPLAY_OUTPUT_DIR}' 폴더에 저장합니다.")
+        creds = None
+        gc = None
+    else:
+        creds = authorize()
+        gc = gspread.authorize(creds)
+
+    # 📄 데이터 준비: Google Sheet에서 CSV를 다운로드하고 데이터를 로드합니다.
+    success, raw_data = download_sheet_as_csv(SPREADSHEET_ID, sheet_name, csv_filename, gc)
+    if not success or not raw_data:
+        print("❌ 데이터 로드에 실패했습니다. 스크립트를 종료합니다.")
+        return
 
-    if not active_set_indexes:
-        with lock:
+    # CSV 데이터의 모든 빈 셀을 위 셀 내용으로 채우는 전처리 (스프레드시트의 병합 해제 시뮬레이션, cue_common/fill.py)
+    print("🔧 CSV 데이터의 모든 빈 셀을 위 셀 내용으로 채우는 중...")
+    data = forward_fill_rows(raw_data)
+    print("✅ 데이터 전처리 완료.")
+
+    # 전처리된 데이터를 기반으로 헤더와 본문 분리
+    # CSV로 내보내졌을 때 스프레드시트의 1행부터 데이터가 시작한다고 가정하면,
+    # header_rows = data[0:2] (첫 2행), body_rows = data[2:] (나머지 행)가 될 수 있습니다.
+    # CSV 파일의 실제 구조를 확인하고 필요에 따라 이 값을 조정하세요.
+    header_rows = data[1:3] # 전처리된 데이터의 2번째, 3번째 행을 헤더로 사용 (0-based index)
+    body_rows = data[3:]   # 전처리된 데이터의 4번째 행부터 본문으로 사용 (0-based index)
+
+    # 참가자 → (역할 있는 그룹, 이름이 나온 셀) 색인과 열 조각을 한 번만 만들어 둡니다.
+    participant_index = build_participant_index(body_rows, group_starts, participants)
+    fixed_columns, group_columns = slice_group_columns(header_rows, body_rows, group_starts)
+    tables = []
+    for name in participants:
+        entry = participant_index[name]
+        if not entry['groups']:
             print(f"⚠️ '{name}': 할당된 역할이 없습니다. 건너뜁니다.")
             skipped_list.append(name)
-        return
+            continue
+        tables.append((name, assemble_participant_table(name, entry, fixed_columns, group_columns, len(header_rows))))
 
-    try:
-        result = []
-        for header_row in header_rows:
-            new_header = header_row[:6]
-            for i in active_set_indexes:
-                s = group_starts[i]
-                new_header += header_row[s:s+3]
-            result.append(new_header)
-
-        for row in body_rows:
-            new_row = row[:6]
-            for i in active_set_indexes:
-                s = group_starts[i]
-                def mark(cell): return cell.replace(name, f"[{name}]") if name in cell else cell
-                if len(row) > s + 2:
-                    new_row += [row[s], mark(row[s+1]), mark(row[s+2])]
-                else:
-                    new_row += ["", "", ""]
-            result.append(new_row)
+    # ♻️ PDF 렌더 캐시: 참가자 표 내용이 지난 실행 때와 같으면 create_pdf를 다시 부르지 않습니다.
+    # PDF 모양은 create_pdf와 폰트가 정하므로 create_pdf의 소스, 폰트 파일 내용과 reportlab 버전을 키에 포함합니다.
+    # (이 파일의 다른 부분을 고쳐도 캐시는 그대로) 제목에 생성 시각을 넣지 않으므로 재사용한 PDF의 내용도 새로 렌더링한 PDF와 같습니다.
+    render_cache = RenderCache(DEFAULT_CACHE_DIRNAME, [fonts.FONT_PATH],
+                               salt=f"reportlab {REPORTLAB_VERSION}\n{inspect.getsource(create_pdf)}")
 
-        now_time_str = datetime.now().strftime("%H%M%S")
-        pdf_file_name = f"{name}_{day_tag}_{now_time_str}.pdf"
-        pdf_buffer = create_pdf(result, f"{name} Sheet (생성일: {datetime.now().strftime('%Y-%m-%d %H:%M')})")
+    # ▶️ 렌더링/업로드 시작
+    delete_all_files_in_folder(creds)
+    run_pipeline(tables, creds, render_cache)
 
-        with lock:
-            print(f"🛠️  ({index}/{len(participants)}) PDF 버퍼 생성 완료: '{pdf_file_name}'")
-
-        if upload_file_to_drive(pdf_buffer, pdf_file_name, 'application/pdf', local_drive_service, index, len(participants)):
-            with lock:
-                success_list.append(name)
-        else:
-            with lock:
-                fail_list.append(name)
-    except Exception as e:
-        with lock:
-            print(f"❌ '{name}' 처리 중 오류 발생: {e}")
-            fail_list.append(name)
 
-# ▶️ 스크립트 실행 시작
-delete_all_files_in_folder()
+    # 📊 최종 결과 요약
+    print("\n📊 요약")
+    print(f"✅ 완료: {len(success_list)}명 → {', '.join(success_list) if success_list else '없음'}")
+    print(f"⚠️ 건너뜀 (역할 없음): {len(skipped_list)}명 → {', '.join(skipped_list) if skipped_list else '없음'}")
+    print(f"❌ 실패: {len(fail_list)}명 → {', '.join(fail_list) if fail_list else '없음'}")
+    print(render_cache.summary())
 
-with ThreadPoolExecutor(max_workers=4) as executor:
-    executor.map(make_sheet_file, participants)
 
-# 📊 최종 결과 요약
-print("\n📊 요약")
-print(f"✅ 완료: {len(success_list)}명 → {', '.join(success_list) if success_list else '없음'}")
-print(f"⚠️ 건너뜀 (역할 없음): {len(skipped_list)}명 → {', '.join(skipped_list) if skipped_list else '없음'}")
-print(f"❌ 실패: {len(fail_list)}명 → {', '.join(fail_list) if fail_list else '없음'}")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
\ No newline at end of file
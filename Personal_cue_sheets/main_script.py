@@ -1,14 +1,27 @@
+import argparse
 import pandas as pd
 import os
+import pathlib
 import re
+import sys
 import pickle
-from weasyprint import HTML, CSS
+from concurrent.futures import ProcessPoolExecutor
+from weasyprint import HTML, CSS, __version__ as WEASYPRINT_VERSION
 from weasyprint.text.fonts import FontConfiguration
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common import fonts, sheet_source
+from cue_common.chunked_render import (DEFAULT_CHUNK_ROWS, MemoryTracker, chunk_template, format_bytes, iter_chunks,
+                                       replace_when_done, rss_cap_bytes)
+from cue_common.columnar_snapshot import read_sheet_frame
+from cue_common.name_matcher import NameMatcher
+from cue_common.render_cache import DEFAULT_CACHE_DIRNAME, RenderCache
+from cue_common.timeofday import parse_minutes
+
 # --- 설정 ---
 CUESHEET_FILE = '/Users/heeeonlee/2025KYSA/cue_sheet_checker/initial_csv_files/2025 KYSA 운영위원 통합 큐시트_도우미 배정용서기용.csv'
 HELPERS_FILE = '/Users/heeeonlee/2025KYSA/cue_sheet_checker/initial_csv_files/2025 KYSA 운영위원 통합 큐시트_도우미 명단.csv'
@@ -21,7 +34,13 @@ DAY_MAP = {'목요일': '목', '금요일': '금', '토요일': '토', '일요
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 TEMPLATE_FILE = os.path.join(SCRIPT_DIR, 'template.html')
 CSS_FILE = os.path.join(SCRIPT_DIR, 'style.css')
+FONTS_DIR = os.path.join(SCRIPT_DIR, 'fonts')
+CHUNK_ROWS = DEFAULT_CHUNK_ROWS  # 이보다 긴 표는 이 행 수만큼씩 나눠 레이아웃합니다. (짝수여야 조각이 바뀌어도 행 줄무늬가 이어짐)
+FONT_FILE = 'fonts/NanumGothicLight.ttf'  # style.css의 @font-face 경로 (SCRIPT_DIR 기준)
+RENDER_CACHE_DIR = os.path.join(SCRIPT_DIR, DEFAULT_CACHE_DIRNAME)
 os.makedirs(os.path.join(SCRIPT_DIR, OUTPUT_FOLDER), exist_ok=True)
+# CUE_SHEET_SOURCE=replay 로 실행하면 네트워크 없이 로컬 CSV로 PDF만 생성하고 구글 드라이브 업로드는 건너뜁니다.
+OFFLINE = sheet_source.is_offline()
 
 
 # --- 구글 드라이브 연동 함수 ---
@@ -70,7 +89,7 @@ def upload_to_drive(service, day_to_upload):
 # --- 기존 로직 함수들 ---
 def get_helpers_by_day(selected_day_abbr):
     try:
-        df_full = pd.read_csv(HELPERS_FILE, header=None, on_bad_lines='skip', dtype=str)
+        df_full = read_sheet_frame(HELPERS_FILE, on_bad_lines='skip')
         name_row_idx = df_full[df_full[0] == '이름'].index[0]
         all_helpers = df_full.iloc[name_row_idx].dropna().tolist()[1:]
         day_row_idx = df_full[df_full[0] == selected_day_abbr].index[0]
@@ -90,20 +109,141 @@ def clean_contact_cell(content):
         return f'{n} ({num})'
     return re.sub(r'([가-힣A-Za-z]+)\s+(\d+)', fmt, content).replace('\n', ', ').strip()
 
-def generate_sheets_for_day(selected_day, cuesheet_df):
+class RenderContext:
+    """
+    한 번 실행하는 동안 모든 PDF가 함께 쓰는 템플릿/스타일시트/폰트 설정.
+    template.html 읽기, style.css 해석, @font-face 폰트(fonts/NanumGothicLight.ttf) 등록을 PDF마다 반복하지 않습니다.
+    font_path를 주면 @font-face 폰트 대신 그 파일(이번 실행에 쓰인 글자만 담은 서브셋, cue_common/fonts.py)을 씁니다.
+    max_rss_bytes를 주면 PDF 하나를 렌더링하는 동안 프로세스 메모리(RSS)가 이 값을 넘을 때 그 PDF를 실패 처리합니다.
+    """
+
+    def __init__(self, template_path=TEMPLATE_FILE, css_path=CSS_FILE, base_url=SCRIPT_DIR, font_path=None, max_rss_bytes=None):
+        with open(template_path, 'r', encoding='utf-8') as f:
+            self.template = f.read()
+        # (첫 조각인지, 마지막 조각인지) → 조각용 템플릿. 제목/안내문은 첫 조각에만, 바닥글은 마지막 조각에만 들어갑니다.
+        self.chunk_templates = {(first, last): chunk_template(self.template, first, last)
+                                for first in (True, False) for last in (True, False)}
+        self.base_url = base_url
+        self.max_rss_bytes = max_rss_bytes
+        self.font_config = FontConfiguration()
+        if font_path is None:
+            self.stylesheet = CSS(filename=css_path, font_config=self.font_config)
+        else:
+            with open(css_path, 'r', encoding='utf-8') as f:
+                css_text = f.read().replace(FONT_FILE, pathlib.Path(font_path).resolve().as_uri())
+            self.stylesheet = CSS(string=css_text, base_url=base_url, font_config=self.font_config)
+
+    def render_html(self, name, selected_day, html_table, first=True, last=True):
+        return self.chunk_templates[first, last].replace('{{HELPER_NAME}}', name).replace('{{SELECTED_DAY}}', selected_day).replace('{{SCHEDULE_TABLE}}', html_table)
+
+    def write_pdf(self, html, pdf_path):
+        HTML(string=html, base_url=self.base_url).write_pdf(pdf_path, stylesheets=[self.stylesheet], font_config=self.font_config)
+
+    def write_pdf_chunks(self, name, selected_day, html_tables, pdf_path):
+        """
+        표 조각(html_tables)마다 따로 레이아웃한 뒤 페이지를 이어 붙여 PDF 하나로 저장하고, 렌더링 중 최대 메모리(바이트)를 반환합니다.
+        WeasyPrint의 레이아웃 메모리는 표 길이보다 빠르게 늘어나므로, 긴 표를 한 번에 레이아웃하지 않습니다.
+        조각마다 레이아웃이 끝난 페이지(Page)만 남기고 Document(HTML 트리 포함)는 바로 버린 뒤 메모리 상한을 확인합니다.
+        제목/안내문은 첫 조각에만, 바닥글은 마지막 조각에만 넣으므로 조각 경계에서 페이지가 바뀌는 것 말고는 한 번에 렌더링한 것과 같습니다.
+        PDF는 임시 파일에 쓰고, 저장까지 마친 뒤에도 상한 안이면 pdf_path로 옮깁니다. (중간에 멈추면 pdf_path에 아무것도 남지 않음)
+        """
+        with MemoryTracker(self.max_rss_bytes) as memory, replace_when_done(pdf_path) as tmp_path:
+            if len(html_tables) == 1:
+                self.write_pdf(self.render_html(name, selected_day, html_tables[0]), tmp_path)
+            else:
+                base, pages = None, []
+                for i, html_table in enumerate(html_tables):
+                    html = self.render_html(name, selected_day, html_table, first=i == 0, last=i == len(html_tables) - 1)
+                    document = HTML(string=html, base_url=self.base_url).render(stylesheets=[self.stylesheet], font_config=self.font_config)
+                    pages.extend(document.pages)
+                    if base is None:
+                        base = document.copy([])  # PDF 메타데이터(제목 등)만 첫 조각에서 가져옵니다.
+                    del html, document
+                    memory.check()
+                base.copy(pages).write_pdf(tmp_path)
+            # 페이지를 합쳐 PDF로 쓰는 동안의 메모리도 상한 안이어야 합니다.
+            memory.check(after_write=True)
+        return memory.peak_bytes
+
+# --- PDF 렌더링 (여러 프로세스) ---
+# 워커 프로세스마다 RenderContext를 한 번만 만들어 둡니다. (템플릿/스타일시트/폰트 설정)
+_worker_render_context = None
+
+def _init_render_worker(font_path=None, max_rss_bytes=None):
+    global _worker_render_context
+    _worker_render_context = RenderContext(font_path=font_path, max_rss_bytes=max_rss_bytes)
+
+def render_pdf_job(job, render_context=None):
+    """
+    PDF 하나 렌더링: job = (요일, 이름, html_tables(표 조각들), pdf_path).
+    반환: (job, 오류 메시지 또는 None, 렌더링 중 최대 메모리(바이트) 또는 None)
+    """
+    selected_day, name, html_tables, pdf_path = job
+    context = render_context or _worker_render_context
+    try:
+        return job, None, context.write_pdf_chunks(name, selected_day, html_tables, pdf_path)
+    except Exception as e:
+        return job, str(e), None
+
+def render_pdf_jobs(jobs, workers=None, render_context=None, font_path=None, max_rss_bytes=None):
+    """
+    (요일, 도우미) PDF 작업들을 workers개 프로세스로 렌더링하고, 실패한 [(요일, 이름, 오류), ...]를 반환합니다.
+    진행 상황은 작업을 넣은 순서대로 출력합니다. workers가 1이면 현재 프로세스에서 순서대로 렌더링합니다.
+    PDF마다 렌더링 중 최대 메모리를 출력하고, 마지막에 가장 컸던 문서를 알려 줍니다. (워커 수를 정할 때 참고)
+    """
+    if not jobs: return []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    print(f"\n🎨 PDF {len(jobs)}개를 {workers}개 프로세스로 렌더링합니다.")
+    failures = []
+    largest_peak = (None, None)  # 최대 메모리가 가장 컸던 문서 (요일/이름, 바이트)
+
+    def report(results):
+        nonlocal largest_peak
+        for i, ((selected_day, name, _, pdf_path), error, peak_bytes) in enumerate(results, 1):
+            if error is None:
+                print(f"🎨 ({i}/{len(jobs)}) PDF 생성: {selected_day}/{os.path.basename(pdf_path)} (최대 메모리 {format_bytes(peak_bytes)})")
+                if peak_bytes and peak_bytes > (largest_peak[1] or 0):
+                    largest_peak = (f"{selected_day}/{name}", peak_bytes)
+            else:
+                print(f"❗ ({i}/{len(jobs)}) PDF 생성 실패: {selected_day}/{name}")
+                failures.append((selected_day, name, error))
+
+    if workers == 1:
+        render_context = render_context or RenderContext(font_path=font_path, max_rss_bytes=max_rss_bytes)
+        report(render_pdf_job(job, render_context) for job in jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(font_path, max_rss_bytes)) as executor:
+            # map()은 넣은 순서대로 결과를 돌려주므로 진행 상황도 요일/도우미 순서대로 출력됩니다.
+            report(executor.map(render_pdf_job, jobs))
+    if largest_peak[1]:
+        print(f"🧠 문서별 최대 메모리: 가장 큰 문서 '{largest_peak[0]}' {format_bytes(largest_peak[1])} "
+              f"(워커 {workers}개 × {format_bytes(largest_peak[1])} = 약 {format_bytes(workers * largest_peak[1])})")
+    return failures
+
+def prepare_sheets_for_day(selected_day, cuesheet_df):
+    """
+    그날 도우미별 CSV를 저장하고, PDF 렌더링 작업 목록 [(요일, 이름, html_tables, pdf_path), ...]과
+    표를 만드는 중에 실패한 [(요일, 이름, 오류), ...]를 반환합니다.
+    """
     print(f"\n✅ '{selected_day}'의 큐시트 생성을 시작합니다.")
+    jobs, failures = [], []
     selected_day_abbr = DAY_MAP[selected_day]
     available_helpers = get_helpers_by_day(selected_day_abbr)
-    if not available_helpers: print(f"'{selected_day}'에 참석 가능한 도우미가 없습니다."); return
+    if not available_helpers: print(f"'{selected_day}'에 참석 가능한 도우미가 없습니다."); return jobs, failures
     day_df = cuesheet_df[cuesheet_df['요일'] == selected_day].copy()
-    if day_df.empty: print(f"'{selected_day}'에 해당하는 일정이 없습니다."); return
+    if day_df.empty: print(f"'{selected_day}'에 해당하는 일정이 없습니다."); return jobs, failures
     day_output_folder = os.path.join(SCRIPT_DIR, OUTPUT_FOLDER, selected_day)
     os.makedirs(day_output_folder, exist_ok=True)
+    # 그날 일정표를 한 번만 훑어서 도우미 → 행 번호 역색인을 만듭니다. (이름 앞뒤가 다른 글자와 붙어 있으면 다른 사람으로 봄)
+    # 빈 칸도 예전처럼 str()로 'nan'이 되게 합니다. (pandas 3에서는 astype(str)이 빈 칸을 NaN으로 남겨 join이 실패함)
+    row_texts = day_df.map(str).agg(" ".join, axis=1)
+    rows_by_helper = NameMatcher(available_helpers).index_rows(row_texts)
     print("\n" + "="*40)
     for name in available_helpers:
-        indices = [i for i, row in day_df.iterrows() if name in " ".join([str(c) for c in row.values])]
-        if not indices: continue
-        pdf = day_df.loc[list(set(indices))].copy().sort_values(by=['시작시간_정렬용']).drop(columns=['시작시간_정렬용'])
+        positions = rows_by_helper.get(name)
+        if not positions: continue
+        pdf = day_df.iloc[positions].copy().sort_values(by=['시작시간_정렬용']).drop(columns=['시작시간_정렬용'])
         csv_path = os.path.join(day_output_folder, f"{name}_큐시트.csv")
         pdf.to_csv(csv_path, index=False, encoding='utf-8-sig', na_rep='')
         print(f"📄 CSV 생성: {selected_day}/{os.path.basename(csv_path)}")
@@ -114,19 +254,82 @@ def generate_sheets_for_day(selected_day, cuesheet_df):
                     if col in ['담당자\n(프로그램 팀원 명)', '담당자 연락처']: pdf_df[col] = pdf_df[col].apply(clean_contact_cell)
                     else: pdf_df[col] = pdf_df[col].astype(str).str.replace('\n', '<br>', regex=False)
             pdf_path = os.path.join(day_output_folder, f"{name}_큐시트.pdf")
-            html_table = pdf_df.to_html(index=False, na_rep='', escape=False).replace('<th>', '<th style="text-align: center;">')
-            with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f: template = f.read()
-            final_html = template.replace('{{HELPER_NAME}}', name).replace('{{SELECTED_DAY}}', selected_day).replace('{{SCHEDULE_TABLE}}', html_table)
-            HTML(string=final_html, base_url=SCRIPT_DIR).write_pdf(pdf_path, stylesheets=[CSS(filename=CSS_FILE)])
-            print(f"🎨 PDF 생성: {selected_day}/{os.path.basename(pdf_path)}")
-        except Exception as e: print(f"❗ PDF 생성 실패: {e}")
-        print("-"*40)
+            # 긴 표는 CHUNK_ROWS행씩 나눈 표 조각으로 렌더링합니다. (RenderContext.write_pdf_chunks)
+            html_tables = tuple(chunk.to_html(index=False, na_rep='', escape=False).replace('<th>', '<th style="text-align: center;">')
+                                for chunk in iter_chunks(pdf_df, CHUNK_ROWS))
+            jobs.append((selected_day, name, html_tables, pdf_path))
+        except Exception as e: failures.append((selected_day, name, str(e)))
+    return jobs, failures
+
+def open_render_cache():
+    """템플릿/CSS/폰트 파일과 WeasyPrint 버전을 키에 포함하는 PDF 렌더 캐시. (하나라도 바뀌면 모두 다시 렌더링)"""
+    font_files = [os.path.join(FONTS_DIR, f) for f in os.listdir(FONTS_DIR)] if os.path.isdir(FONTS_DIR) else []
+    return RenderCache(RENDER_CACHE_DIR, [TEMPLATE_FILE, CSS_FILE, *font_files], salt=f"weasyprint {WEASYPRINT_VERSION}")
+
+def generate_sheets(days_to_process, cuesheet_df, workers=None, render_cache=None, max_rss_bytes=None):
+    """
+    여러 요일의 CSV를 만든 뒤 모든 (요일, 도우미) PDF를 한 번에 렌더링하고, 실패한 작업을 요약합니다.
+    render_cache가 있으면 표 내용이 지난번과 같은 도우미의 PDF는 캐시에서 복사하고, 나머지만 렌더링합니다.
+    """
+    jobs, failures = [], []
+    for day in days_to_process:
+        day_jobs, day_failures = prepare_sheets_for_day(day, cuesheet_df)
+        jobs += day_jobs
+        failures += day_failures
+    keys = {}
+    if render_cache is not None:
+        pending = []
+        for job in jobs:
+            selected_day, name, html_tables, pdf_path = job
+            keys[pdf_path] = render_cache.key([selected_day, name, html_tables])
+            if render_cache.load_to(keys[pdf_path], pdf_path):
+                print(f"♻️ PDF 재사용 (내용 변경 없음): {selected_day}/{os.path.basename(pdf_path)}")
+            else:
+                pending.append(job)
+        jobs = pending
+    font_path = None
+    if jobs:
+        # 템플릿과 이번에 렌더링할 모든 표에 쓰인 글자만 담은 폰트 서브셋을 한 번 만들어 모든 PDF가 함께 씁니다.
+        with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+            template_text = f.read()
+        font_path = fonts.subset_font(fonts.collect_characters(template_text, jobs), font_path=os.path.join(SCRIPT_DIR, FONT_FILE))
+    render_failures = render_pdf_jobs(jobs, workers, font_path=font_path, max_rss_bytes=max_rss_bytes)
+    if render_cache is not None:
+        failed = {(selected_day, name) for selected_day, name, _ in render_failures}
+        for selected_day, name, _, pdf_path in jobs:
+            if (selected_day, name) not in failed:
+                render_cache.store_file(keys[pdf_path], pdf_path)
+        print(f"\n{render_cache.summary()}")
+    failures += render_failures
+    if failures:
+        print(f"\n❗ PDF 생성 실패 {len(failures)}건:")
+        for selected_day, name, error in failures:
+            print(f"  - {selected_day} {name}: {error}")
+    return failures
+
+def load_cuesheet(days):
+    """배정용 큐시트를 읽고 요일 순서(categorical)와 정렬용 시작시간 열을 추가합니다."""
+    cuesheet_df = read_sheet_frame(CUESHEET_FILE, header=0)
+    cuesheet_df['요일'] = cuesheet_df['요일'].astype(pd.api.types.CategoricalDtype(categories=days, ordered=True))
+    cuesheet_df['시작시간_정렬용'] = pd.array(cuesheet_df['시작시간'].map(parse_minutes), dtype='Int16')
+    return cuesheet_df
 
 # --- 메인 실행 로직 ---
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="개인별 큐시트(CSV/PDF) 생성 및 구글 드라이브 업로드")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="PDF 렌더링에 쓸 프로세스 수 (기본값: CPU 코어 수, 1이면 한 프로세스에서 순서대로)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="렌더 캐시를 쓰지 않고 모든 PDF를 새로 렌더링합니다.")
+    parser.add_argument('--max-rss-mb', type=int, default=1024,
+                        help="PDF 하나를 렌더링할 때 프로세스 메모리(RSS) 상한, MB (기본값 1024, 0: 상한 없음)")
+    args = parser.parse_args()
+
     # 1. 기존 파일 확인 및 업로드 여부 질문
     existing_days = [d for d in DAY_MAP.keys() if os.path.isdir(os.path.join(SCRIPT_DIR, OUTPUT_FOLDER, d)) and any(f.endswith('.pdf') for f in os.listdir(os.path.join(SCRIPT_DIR, OUTPUT_FOLDER, d)))]
-    if existing_days:
+    if OFFLINE:
+        print("\n🔌 replay 모드: 구글 드라이브 업로드 없이 로컬에서만 큐시트를 생성합니다.")
+    if existing_days and not OFFLINE:
         print("\n🔎 기존에 생성된 PDF 파일이 있습니다.")
         if input("📤 기존 파일들을 구글 드라이브에 업로드하시겠습니까? (y/n): ").lower().strip() == 'y':
             print("\n어떤 요일을 업로드하시겠습니까?")
@@ -152,18 +355,17 @@ if __name__ == '__main__':
         try:
             choice = int(input(">> 번호를 입력하세요: ")) - 1
             if 0 <= choice <= len(days):
-                cuesheet_df = pd.read_csv(CUESHEET_FILE, dtype=str)
-                cuesheet_df['요일'] = cuesheet_df['요일'].astype(pd.api.types.CategoricalDtype(categories=days, ordered=True))
-                cuesheet_df['시작시간_정렬용'] = pd.to_datetime(cuesheet_df['시작시간'], format='%H:%M', errors='coerce').dt.time
-                
+                cuesheet_df = load_cuesheet(days)
+
                 days_to_process = days if choice == len(days) else [days[choice]]
-                for day in days_to_process:
-                    generate_sheets_for_day(day, cuesheet_df)
+                render_cache = None if args.no_cache else open_render_cache()
+                generate_sheets(days_to_process, cuesheet_df, workers=args.workers, render_cache=render_cache,
+                                max_rss_bytes=rss_cap_bytes(args.max_rss_mb))
                 
                 print("\n✨ 모든 파일 생성이 완료되었습니다!")
                 
                 # 3. 새로 생성된 파일 업로드 여부 질문
-                if input("\n📤 방금 생성된 PDF 파일들을 구글 드라이브에 업로드하시겠습니까? (y/n): ").lower().strip() == 'y':
+                if not OFFLINE and input("\n📤 방금 생성된 PDF 파일들을 구글 드라이브에 업로드하시겠습니까? (y/n): ").lower().strip() == 'y':
                     service = get_gdrive_service()
                     for day in days_to_process:
                         upload_to_drive(service, day)
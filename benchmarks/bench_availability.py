@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.availability import AvailabilityMatrix
+from cue_common.interval_index import build_day_index
+
+# 가용 인원 검색 벤치마크: 도우미 5,000명 × 14일 가상 명단/배정으로
+# 예전 전체 스캔, 요일별 구간 색인(IntervalIndex), 가용 행렬(AvailabilityMatrix)을 비교합니다.
+# 사용법: python benchmarks/bench_availability.py [도우미 수] [일 수]
+
+NUM_HELPERS = 5000
+NUM_DAYS = 14
+TASKS_PER_DAY = 6
+NUM_TEAMS = 20
+
+
+def make_synthetic_roster(num_helpers, num_days, seed=0):
+    rng = random.Random(seed)
+    days = [f"{i + 1}일차" for i in range(num_days)]
+    all_helpers = {}
+    assigned_schedules = defaultdict(list)
+    for h in range(num_helpers):
+        name = f"도우미{h:05d}"
+        all_helpers[name] = {'team': f"{h % NUM_TEAMS}팀", 'days': [d for d in days if rng.random() < 0.8]}
+        for day in all_helpers[name]['days']:
+            for _ in range(rng.randint(0, TASKS_PER_DAY)):
+                start = rng.randrange(6 * 60, 23 * 60, 15)
+                end = min(start + rng.choice([15, 30, 60, 90, 180]), 24 * 60)
+                assigned_schedules[name].append((day, start, end, ''))
+    return days, all_helpers, assigned_schedules
+
+
+def legacy_free_names(target_day, start, end, all_helpers, assigned_schedules):
+    """비교용: 예전 find_available_helpers의 전체 스캔."""
+    available_on_day = {name for name, data in all_helpers.items() if target_day in data['days']}
+    unavailable = set()
+    for helper, schedules in assigned_schedules.items():
+        for day, start_assigned, end_assigned, _ in schedules:
+            if day == target_day and start_assigned < end and start < end_assigned:
+                unavailable.add(helper)
+    return sorted(available_on_day - unavailable)
+
+
+def _time_queries(func, queries):
+    started = time.perf_counter()
+    results = [func(*query) for query in queries]
+    return (time.perf_counter() - started) / len(queries), results
+
+
+if __name__ == '__main__':
+    num_helpers = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_HELPERS
+    num_days = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_DAYS
+    days, all_helpers, assigned_schedules = make_synthetic_roster(num_helpers, num_days)
+    num_intervals = sum(len(s) for s in assigned_schedules.values())
+    print(f"가상 명단: 도우미 {num_helpers}명 × {num_days}일, 배정 {num_intervals}건")
+
+    started = time.perf_counter()
+    day_index = build_day_index(assigned_schedules)
+    index_build = time.perf_counter() - started
+    started = time.perf_counter()
+    matrix = AvailabilityMatrix.from_schedules(all_helpers, assigned_schedules, days, slot_minutes=15)
+    matrix_build = time.perf_counter() - started
+    print(f"  - 색인 만들기:   구간 색인 {index_build * 1000:8.1f} ms, 가용 행렬 {matrix_build * 1000:8.1f} ms")
+
+    rng = random.Random(1)
+    queries = []
+    for _ in range(200):
+        start = rng.randrange(6 * 60, 22 * 60, 15)
+        queries.append((rng.choice(days), start, start + rng.choice([15, 60, 150])))
+
+    def index_free_names(day, start, end):
+        available_on_day = {name for name, data in all_helpers.items() if day in data['days']}
+        index = day_index.get(day)
+        return sorted(available_on_day - (index.busy_names(start, end) if index else set()))
+
+    legacy_time, legacy_results = _time_queries(
+        lambda d, s, e: legacy_free_names(d, s, e, all_helpers, assigned_schedules), queries[:10])
+    index_time, index_results = _time_queries(index_free_names, queries)
+    matrix_time, matrix_results = _time_queries(matrix.free_names, queries)
+    assert legacy_results == index_results[:10] == matrix_results[:10]
+    assert index_results == matrix_results
+    print(f"  - 결과 일치: 검색 {len(queries)}건")
+    print(f"  - 검색 1건당:    전체 스캔 {legacy_time * 1000:8.2f} ms")
+    print(f"                   구간 색인 {index_time * 1000:8.2f} ms")
+    print(f"                   가용 행렬 {matrix_time * 1000:8.2f} ms ({legacy_time / matrix_time:.0f}배)")
+
+    day, start, end = queries[0]
+    started = time.perf_counter()
+    counts = matrix.team_counts(matrix.free_mask(day, start, end))
+    print(f"  - 팀별 가능 인원 집계: {(time.perf_counter() - started) * 1000:.2f} ms ({len(counts)}개 팀)")
@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.conflicts import find_overlap_clusters
+
+# 중복 배정 검사 벤치마크: 배정 100,000행 가상 데이터로 sweep-line 묶음 검사 시간을 재고,
+# 작은 데이터에서 모든 쌍을 비교한 결과(겹침으로 이어진 연결 요소)와 같은지 확인합니다.
+# 사용법: python benchmarks/bench_conflicts.py [행 수]
+
+NUM_ROWS = 100_000
+DAYS = ['수요일', '목요일', '금요일', '토요일', '일요일']
+
+
+def make_rows(num_rows, num_helpers, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(num_rows):
+        start = rng.randrange(6 * 60, 23 * 60, 15)
+        rows.append((f"도우미{rng.randrange(num_helpers)}", rng.choice(DAYS), start,
+                     start + rng.choice([15, 30, 60, 120])))
+    return rows
+
+
+def brute_force_clusters(rows):
+    """비교용: 같은 도우미·요일 안에서 겹치는 모든 쌍을 이어 만든 연결 요소 (2행 이상)."""
+    parent = list(range(len(rows)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, (h1, d1, s1, e1) in enumerate(rows):
+        for j in range(i + 1, len(rows)):
+            h2, d2, s2, e2 = rows[j]
+            if h1 == h2 and d1 == d2 and s1 < e2 and s2 < e1:
+                parent[find(i)] = find(j)
+    groups = {}
+    for i in range(len(rows)):
+        groups.setdefault(find(i), set()).add(i)
+    return sorted(sorted(g) for g in groups.values() if len(g) > 1)
+
+
+def run(rows):
+    return find_overlap_clusters([r[0] for r in rows], [r[1] for r in rows],
+                                 [r[2] for r in rows], [r[3] for r in rows])
+
+
+if __name__ == '__main__':
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ROWS
+
+    small = make_rows(2000, 150, seed=1)
+    assert sorted(sorted(c.tolist()) for c in run(small)) == brute_force_clusters(small)
+    print("  - 결과 일치: 2,000행에서 모든 쌍 비교 결과와 같음")
+
+    rows = make_rows(num_rows, num_rows // 20)
+    started = time.perf_counter()
+    clusters = run(rows)
+    elapsed = time.perf_counter() - started
+    print(f"  - 배정 {num_rows}행: 겹침 묶음 {len(clusters)}개, {sum(len(c) for c in clusters)}행 ({elapsed * 1000:.1f} ms)")
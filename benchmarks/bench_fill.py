@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.fill import forward_fill_frame, forward_fill_rows
+
+# 병합 셀 채우기 벤치마크: 행 5,000개 × 열 30개 가상 시트(빈칸 70%)로
+# 예전 3_personal_cue.py의 fill_data_down_all_columns(셀마다 파이썬 루프)와 cue_common/fill.py를 비교합니다.
+# 사용법: python benchmarks/bench_fill.py [행 수] [열 수]
+
+NUM_ROWS = 5000
+NUM_COLS = 30
+CELL_CHOICES = ['', '', '', '', '', '', '', '  ', ' 입소 세팅 ', '김철수, 이영희', '대강당\n로비', '-']
+
+
+def legacy_fill_data_down_all_columns(data_rows):
+    """비교용: 예전 3_personal_cue.py의 fill_data_down_all_columns."""
+    if not data_rows:
+        return []
+    processed_data = [list(row) for row in data_rows]
+    max_cols = max(len(row) for row in processed_data)
+    for r_idx in range(len(processed_data)):
+        while len(processed_data[r_idx]) < max_cols:
+            processed_data[r_idx].append("")
+    last_filled_values = [None] * max_cols
+    for r_idx, row in enumerate(processed_data):
+        for c_idx in range(max_cols):
+            current_cell_value = row[c_idx].strip()
+            if current_cell_value:
+                last_filled_values[c_idx] = current_cell_value
+            elif last_filled_values[c_idx] is not None:
+                row[c_idx] = last_filled_values[c_idx]
+        processed_data[r_idx] = row
+    return processed_data
+
+
+def make_synthetic_rows(num_rows, num_cols, seed=0):
+    """CSV에서 읽은 것처럼 길이가 제각각인 문자열 행들."""
+    rng = random.Random(seed)
+    return [[rng.choice(CELL_CHOICES) for _ in range(rng.randint(num_cols - 5, num_cols))] for _ in range(num_rows)]
+
+
+def _time(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+if __name__ == '__main__':
+    num_rows = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_ROWS
+    num_cols = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_COLS
+    rows = make_synthetic_rows(num_rows, num_cols)
+    print(f"가상 시트: {num_rows}행 × 최대 {num_cols}열")
+
+    legacy_time, legacy_result = _time(legacy_fill_data_down_all_columns, rows)
+    fill_time, fill_result = _time(forward_fill_rows, rows)
+    assert legacy_result == fill_result
+    print(f"  - 결과 일치: {len(fill_result)}행")
+    print(f"  - 예전 셀 단위 루프:   {legacy_time * 1000:8.1f} ms")
+    print(f"  - forward_fill_rows:   {fill_time * 1000:8.1f} ms ({legacy_time / fill_time:.1f}배)")
+
+    # DataFrame 경로: 빈 문자열 대신 NaN인 셀(read_csv 결과)도 같은 규칙으로 채워지는지 확인합니다.
+    df = pd.DataFrame([[cell or None for cell in row + [''] * (num_cols - len(row))] for row in rows])
+    ffill_time, _ = _time(df.ffill)
+    frame_time, filled_frame = _time(lambda: forward_fill_frame(df, strip_filled=True))
+    assert filled_frame.fillna('').values.tolist() == fill_result
+    print(f"  - DataFrame.ffill:     {ffill_time * 1000:8.1f} ms (NaN만 채움, 공백 셀은 그대로)")
+    print(f"  - forward_fill_frame:  {frame_time * 1000:8.1f} ms (같은 규칙, 같은 결과)")
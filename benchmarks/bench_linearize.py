@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sheets_bots'))
+from cue_stages import linearize_cue_sheet
+
+# 4단계(linearize) 벤치마크: 블록 30개 × 시간대 2,000개짜리 가상 큐시트로
+# 예전 행 단위(iterrows) 구현과 블록 단위 벡터화 구현을 비교합니다.
+# 사용법: python benchmarks/bench_linearize.py [블록 수] [시간대 수]
+
+NUM_BLOCKS = 30
+NUM_SLOTS = 2000
+
+
+def make_synthetic_sheet(num_blocks, num_slots, seed=0):
+    """as_linearize_input() 결과와 같은 모양(시간 인덱스 + '일정.i' 블록 열들)의 가상 큐시트를 만듭니다."""
+    rng = np.random.default_rng(seed)
+    times = [f"{'AM' if (m // 60) % 24 < 12 else 'PM'} {((m // 60) % 12) or 12}:{m % 60:02d}"
+             for m in (360 + 15 * np.arange(num_slots))]
+    columns = {'전체 일정': rng.choice(['-', '아침 식사', '개회 예배'], num_slots)}
+    for i in range(num_blocks):
+        suffix = f'.{i}' if i > 0 else ''
+        # 블록마다 담당자 열 이름 표기가 두 가지 섞여 있습니다.
+        manager_col = f'담당자\n(프로그램 팀원 명){suffix}' if i % 2 == 0 else f'담당자 \n(프로그램 팀원 명){suffix}'
+        columns[f'일정{suffix}'] = rng.choice(['-', f'프로그램 {i}', f'세팅 {i}', np.nan], num_slots)
+        columns[f'장소{suffix}'] = rng.choice(['대강당', '소강당', '-', np.nan], num_slots)
+        columns[f'세부 내용{suffix}'] = rng.choice(['-', '세부 내용', np.nan], num_slots)
+        columns[f'재료{suffix}'] = rng.choice(['-', '마이크'], num_slots)
+        columns[manager_col] = rng.choice(['홍길동', '김철수, 이영희', np.nan], num_slots)
+        columns[f'필요 도우미 수{suffix}'] = rng.choice(['-', '0', '2', '3', ' 5 ', np.nan], num_slots)
+        columns[f'도우미 역할\n(최대한 구체적으로){suffix}'] = rng.choice(['-', '안내'], num_slots)
+        columns[f'배정된 도우미 이름{suffix}'] = rng.choice(['-', '박민수', np.nan], num_slots)
+    df = pd.DataFrame(columns, index=pd.Index(times, name='Unnamed: 0')).astype(object)
+    return df.where(df != 'nan', np.nan)
+
+
+def legacy_linearize_cue_sheet(df):
+    """비교용: 예전 4_linearlize_cue_sheets.py의 행 단위 구현."""
+    tasks = []
+    num_blocks = 0
+    for col in df.columns:
+        if '일정' in col and '시설' not in col:
+            num_blocks += 1
+    for i in range(num_blocks):
+        suffix = f'.{i}' if i > 0 else ''
+        schedule_col = f'일정{suffix}'
+        location_col = f'장소{suffix}' if f'장소{suffix}' in df.columns else None
+        details_col = f'세부 내용{suffix}' if f'세부 내용{suffix}' in df.columns else None
+        helpers_needed_col = f'필요 도우미 수{suffix}' if f'필요 도우미 수{suffix}' in df.columns else None
+        assigned_helper_col = f'배정된 도우미 이름{suffix}' if f'배정된 도우미 이름{suffix}' in df.columns else None
+        manager_col_v1 = f'담당자\n(프로그램 팀원 명){suffix}'
+        manager_col_v2 = f'담당자 \n(프로그램 팀원 명){suffix}'
+        manager_col = None
+        if manager_col_v1 in df.columns:
+            manager_col = manager_col_v1
+        elif manager_col_v2 in df.columns:
+            manager_col = manager_col_v2
+        if not helpers_needed_col:
+            continue
+        for time_value, row in df.iterrows():
+            helpers_needed_val = row[helpers_needed_col]
+            if pd.notna(helpers_needed_val) and str(helpers_needed_val).strip() not in ['-', '0', '0.0']:
+                tasks.append({
+                    '시간': time_value,
+                    '일정': row[schedule_col] if pd.notna(row[schedule_col]) else '-',
+                    '장소': row[location_col] if location_col and pd.notna(row[location_col]) else '-',
+                    '세부 내용': row[details_col] if details_col and pd.notna(row[details_col]) else '-',
+                    '담당자': row[manager_col] if manager_col and pd.notna(row[manager_col]) else '-',
+                    '필요 도우미 수': str(helpers_needed_val).strip(),
+                    '배정된 도우미': row[assigned_helper_col] if assigned_helper_col and pd.notna(row[assigned_helper_col]) else '-'
+                })
+    return pd.DataFrame(tasks)
+
+
+def _time_it(func, df, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(df)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+if __name__ == '__main__':
+    num_blocks = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_BLOCKS
+    num_slots = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_SLOTS
+    df = make_synthetic_sheet(num_blocks, num_slots)
+    print(f"가상 큐시트: 블록 {num_blocks}개 × 시간대 {num_slots}개 ({df.shape[1]}열)")
+
+    legacy_time, legacy_result = _time_it(legacy_linearize_cue_sheet, df, repeat=1)
+    new_time, new_result = _time_it(linearize_cue_sheet, df, repeat=3)
+
+    pd.testing.assert_frame_equal(legacy_result.astype(object), new_result.astype(object))
+    print(f"  - 결과 일치: {len(new_result)}개 작업 행")
+    print(f"  - 행 단위(iterrows):  {legacy_time * 1000:10.1f} ms")
+    print(f"  - 블록 단위(벡터화):  {new_time * 1000:10.1f} ms")
+    print(f"  - 속도 향상:          {legacy_time / new_time:10.1f}배")
@@ -0,0 +1,59 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.name_index import NameIndex
+
+# 이름 검색 벤치마크: 가상 명단 5만 명(여러 해 명단을 합친 크기)에서
+# 받침 하나를 틀린 이름으로 비슷한 이름 검색, 앞 두 글자로 자동 완성을 해 봅니다.
+# 사용법: python benchmarks/bench_name_index.py [이름 수]
+
+NUM_NAMES = 50000
+NUM_QUERIES = 1000
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+JONGSEONG_CHOICES = [0, 0, 0, 4, 8, 16, 21]  # 받침 없음(많이), ㄴ, ㄹ, ㅁ, ㅇ
+
+
+def _syllable(rng):
+    return chr(0xAC00 + rng.randrange(19) * 588 + rng.randrange(21) * 28 + rng.choice(JONGSEONG_CHOICES))
+
+
+def make_synthetic_names(num_names, seed=0):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < num_names:
+        names.add(rng.choice(SURNAMES) + _syllable(rng) + _syllable(rng))
+    return sorted(names)
+
+
+def with_typo(name):
+    """마지막 글자의 받침을 다음 받침으로 바꿉니다. ('김철수' → '김철숙')"""
+    offset = ord(name[-1]) - 0xAC00
+    return name[:-1] + chr(0xAC00 + offset // 28 * 28 + (offset % 28 + 1) % 28)
+
+
+def _time_queries(func, queries):
+    started = time.perf_counter()
+    results = [func(query) for query in queries]
+    return (time.perf_counter() - started) / len(queries), results
+
+
+if __name__ == '__main__':
+    num_names = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_NAMES
+    names = make_synthetic_names(num_names)
+    print(f"가상 명단: {num_names}명")
+
+    started = time.perf_counter()
+    index = NameIndex(names)
+    print(f"  - 색인 만들기: {(time.perf_counter() - started) * 1000:8.1f} ms")
+
+    targets = random.Random(1).sample(names, min(NUM_QUERIES, len(names)))
+    lookup_time, lookup_results = _time_queries(index.lookup, [with_typo(name) for name in targets])
+    found = sum(any(candidate == name for candidate, _ in result) for result, name in zip(lookup_results, targets))
+    print(f"  - 비슷한 이름 검색 1건당: {lookup_time * 1000:6.3f} ms (받침 오타 {len(targets)}건 중 {found}건 후보에 포함)")
+
+    complete_time, complete_results = _time_queries(index.complete, [name[:2] for name in targets])
+    assert all(name in result or len(result) == 10 for result, name in zip(complete_results, targets))
+    print(f"  - 자동 완성 1건당:        {complete_time * 1000:6.3f} ms")
@@ -0,0 +1,72 @@
+import os
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.name_matcher import NameMatcher
+
+# 개인 큐시트 행 찾기 벤치마크: 하루 일정표(행 400개)에서 도우미 300명 각각의 행을 찾습니다.
+#  - 예전 방식: 도우미마다 day_df.iterrows()로 모든 행을 훑으며 `name in 행 텍스트`
+#  - 새 방식:   NameMatcher로 모든 행을 한 번 훑어 도우미 → 행 번호 역색인
+# 사용법: python benchmarks/bench_name_matcher.py [도우미 수] [행 수]
+
+NUM_HELPERS = 300
+NUM_ROWS = 400
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN = '민서지현수영준호우진하윤은성희태연'
+
+
+def make_synthetic_day(num_helpers, num_rows, seed=0):
+    rng = random.Random(seed)
+    helpers = set()
+    while len(helpers) < num_helpers:
+        helpers.add(rng.choice(SURNAMES) + ''.join(rng.choice(GIVEN) for _ in range(rng.choice([1, 2, 2, 2]))))
+    helpers = sorted(helpers)
+    rows = []
+    for i in range(num_rows):
+        rows.append({
+            '요일': '금요일',
+            '시작시간': f"{9 + i % 12:02d}:{i % 4 * 15:02d}",
+            '일정': f"프로그램 {i}\n세부 진행 {rng.randrange(100)}",
+            '장소': rng.choice(['본당', '교육관 2층', '야외 무대']),
+            '배정된 도우미': ', '.join(rng.sample(helpers, rng.randint(1, 6))),
+            '담당자 연락처': f"{rng.choice(helpers)} 010{rng.randrange(10**8):08d}",
+        })
+    return helpers, pd.DataFrame(rows)
+
+
+def legacy_rows(helpers, day_df):
+    """비교용: 예전 generate_sheets_for_day의 도우미별 전체 행 스캔."""
+    return {name: sorted(set(i for i, row in day_df.iterrows() if name in " ".join([str(c) for c in row.values])))
+            for name in helpers}
+
+
+if __name__ == '__main__':
+    num_helpers = int(sys.argv[1]) if len(sys.argv) > 1 else NUM_HELPERS
+    num_rows = int(sys.argv[2]) if len(sys.argv) > 2 else NUM_ROWS
+    helpers, day_df = make_synthetic_day(num_helpers, num_rows)
+    print(f"가상 일정표: 도우미 {len(helpers)}명 × 행 {len(day_df)}개")
+
+    started = time.perf_counter()
+    legacy = legacy_rows(helpers, day_df)
+    legacy_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    row_texts = day_df.map(str).agg(" ".join, axis=1)
+    rows_by_helper = NameMatcher(helpers).index_rows(row_texts)
+    matcher_time = time.perf_counter() - started
+
+    substring = NameMatcher(helpers, whole_word=False).index_rows(row_texts)
+    assert all(substring.get(name, []) == legacy[name] for name in helpers)
+    expected = {name: [i for i, text in enumerate(row_texts)
+                       if re.search(r'(?<!\w)' + re.escape(name) + r'(?!\w)', text)] for name in helpers}
+    assert all(rows_by_helper.get(name, []) == expected[name] for name in helpers)
+    dropped = sum(len(legacy[name]) - len(rows_by_helper.get(name, [])) for name in helpers)
+
+    print(f"  - 예전 방식(도우미별 전체 스캔): {legacy_time * 1000:9.1f} ms")
+    print(f"  - NameMatcher 역색인:           {matcher_time * 1000:9.1f} ms ({legacy_time / matcher_time:.0f}배)")
+    print(f"  - 부분 문자열로만 겹쳐서 더 이상 잡히지 않는 행: {dropped}건 (예: '이희' ⊂ '이희언')")
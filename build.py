@@ -0,0 +1,379 @@
+import argparse
+import ast
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# 📦 파생 파일 증분 빌드
+# 원본 CSV → modified_csv_files → final_schedule_files → 개인 큐시트 PDF 로 이어지는 작업들을 그래프로 정의하고,
+# 각 결과물마다 '입력 파일 내용 해시 + 스크립트 버전(소스 해시) + 설정'을 기록해 두었다가
+# 바뀐 노드만 다시 만듭니다. 서로 의존하지 않는 노드는 프로세스 풀에서 동시에 실행합니다.
+#
+# 사용법: python build.py build [노드 이름 ...] [--jobs N] [--dry-run] [--force]
+#         python build.py status
+#         python build.py personal_pdfs:목요일     (노드 이름만 주면 그 노드와 선행 노드만 빌드)
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+INITIAL_DIR = os.path.join(REPO_DIR, 'initial_csv_files')
+MODIFIED_DIR = os.path.join(REPO_DIR, 'modified_csv_files')
+FINAL_SCHEDULE_DIR = os.path.join(REPO_DIR, 'final_schedule_files')
+PERSONAL_DIR = os.path.join(REPO_DIR, 'Personal_cue_sheets')
+BUILD_STATE_PATH = os.path.join(REPO_DIR, '.build_state.json')
+
+SHEET_PREFIX = '2025 KYSA 운영위원 통합 큐시트_'
+DAY_SHEETS = ['8.13수', '8.14목', '8.15금', '8.16토', '8.17일']
+PERSONAL_DAYS = ['목요일', '금요일', '토요일', '일요일']
+
+ROSTER_CSV = os.path.join(INITIAL_DIR, f"{SHEET_PREFIX}운영위 명단.csv")
+HELPERS_CSV = os.path.join(INITIAL_DIR, f"{SHEET_PREFIX}도우미 명단.csv")
+ASSIGNMENT_CSV = os.path.join(INITIAL_DIR, f"{SHEET_PREFIX}도우미 배정용서기용.csv")
+PERSONAL_MAX_RSS_MB = 1024  # main_script.py --max-rss-mb 기본값과 같음
+
+
+class BuildNode:
+    """빌드 그래프의 노드 하나: inputs를 읽어 outputs를 만드는 action."""
+
+    def __init__(self, name, action, args, inputs, outputs, sources, config=None):
+        self.name = name
+        self.action = action      # 프로세스 풀에서 실행되는 최상위 함수 (pickle 가능해야 함)
+        self.args = args
+        self.inputs = inputs      # 입력 파일 경로 목록
+        self.outputs = outputs    # 결과 파일(또는 폴더) 경로 목록
+        self.sources = sources    # 이 노드를 만드는 스크립트 소스 파일 (스크립트 버전)
+        self.config = config or {}
+        self.deps = []            # inputs를 만드는 다른 노드 이름 (build_graph에서 채움)
+
+
+# --- 스크립트 소스 목록 ---
+
+def _resolve_module(module_name, search_dirs):
+    """모듈 이름에 해당하는 저장소 안의 .py 파일 경로. 저장소 밖(설치된 패키지)이면 None."""
+    parts = module_name.split('.')
+    for directory in search_dirs:
+        for candidate in (os.path.join(directory, *parts) + '.py', os.path.join(directory, *parts, '__init__.py')):
+            if os.path.isfile(candidate):
+                return candidate
+    return None
+
+
+def _imported_modules(tree):
+    """import 문과 importlib.import_module('이름') 호출에서 모듈 이름들을 꺼냅니다."""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+            for alias in node.names:  # from cue_common import fonts → cue_common/fonts.py
+                yield f"{node.module}.{alias.name}"
+        elif (isinstance(node, ast.Call) and getattr(node.func, 'attr', None) == 'import_module'
+              and node.args and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+            yield node.args[0].value
+
+
+def python_sources(*entry_files):
+    """
+    스크립트들과, 그 스크립트들이 (거슬러 올라가며) import하는 저장소 안의 모듈 파일 목록을 REPO_DIR 기준 경로로 반환합니다.
+    cue_common 모듈이 새로 추가되거나 바뀌어도 노드의 스크립트 버전에 자동으로 반영됩니다.
+    """
+    seen = set()
+    pending = [os.path.join(REPO_DIR, path) for path in entry_files]
+    while pending:
+        path = os.path.normpath(pending.pop())
+        if path in seen:
+            continue
+        seen.add(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+        search_dirs = (REPO_DIR, os.path.dirname(path))  # 스크립트 폴더의 모듈도 import 가능 (sys.path에 추가해서 씀)
+        for module_name in _imported_modules(tree):
+            module_path = _resolve_module(module_name, search_dirs)
+            if module_path is not None:
+                pending.append(module_path)
+    return sorted(os.path.relpath(path, REPO_DIR) for path in seen)
+
+
+# --- 노드 작업 (각 스크립트의 함수를 그대로 호출) ---
+
+def action_roster(input_path, output_path):
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    importlib.import_module('2_chopping_name_sheets').chop_name_sheet(input_path, output_path)
+
+
+def action_day_schedule(input_path, output_path):
+    bots_dir = os.path.join(REPO_DIR, 'sheets_bots')
+    if bots_dir not in sys.path:
+        sys.path.insert(0, bots_dir)
+    from run_cue_pipeline import run_pipeline
+    run_pipeline(input_path, output_path)
+
+
+def action_personal_pdfs(day, cuesheet_path, helpers_path, render_workers=None, use_render_cache=True,
+                         max_rss_mb=PERSONAL_MAX_RSS_MB):
+    # 렌더링 워커 프로세스가 render_pdf_job을 찾을 수 있도록 파일 경로가 아니라 모듈 이름으로 가져옵니다.
+    if PERSONAL_DIR not in sys.path:
+        sys.path.insert(0, PERSONAL_DIR)
+    main_script = importlib.import_module('main_script')
+    main_script.CUESHEET_FILE = cuesheet_path
+    main_script.HELPERS_FILE = helpers_path
+    days = list(main_script.DAY_MAP.keys())
+    render_cache = main_script.open_render_cache() if use_render_cache else None
+    failures = main_script.generate_sheets([day], main_script.load_cuesheet(days), workers=render_workers,
+                                           render_cache=render_cache, max_rss_bytes=main_script.rss_cap_bytes(max_rss_mb))
+    if failures:
+        raise RuntimeError(f"PDF 생성 실패 {len(failures)}건")
+
+
+def default_render_workers(jobs=None):
+    """
+    개인 큐시트 노드 하나가 PDF 렌더링에 쓸 프로세스 수.
+    요일별 노드가 최대 min(jobs, 요일 수)개 동시에 실행되므로 CPU 코어를 그 수로 나눠 씁니다.
+    """
+    cpu_count = os.cpu_count() or 1
+    concurrent_nodes = min(jobs or cpu_count, len(PERSONAL_DAYS))
+    return max(1, cpu_count // concurrent_nodes)
+
+
+def build_graph(render_workers=None, use_render_cache=True):
+    """
+    빌드 노드 목록을 만들고, 각 노드의 입력을 만드는 노드를 의존성(deps)으로 연결합니다.
+    render_workers: 개인 큐시트 노드 하나의 PDF 렌더링 프로세스 수 (main_script.py의 --workers, 기본값은 default_render_workers())
+    use_render_cache: 개인 큐시트 PDF 렌더 캐시 사용 여부 (main_script.py의 --no-cache의 반대)
+    """
+    render_workers = render_workers or default_render_workers()
+    nodes = []
+    roster_output = os.path.join(MODIFIED_DIR, f"{SHEET_PREFIX}운영위 명단_processed_final.csv")
+    nodes.append(BuildNode(
+        'roster', action_roster, (ROSTER_CSV, roster_output),
+        inputs=[ROSTER_CSV], outputs=[roster_output],
+        sources=python_sources('2_chopping_name_sheets.py'),
+    ))
+
+    schedule_sources = python_sources('sheets_bots/run_cue_pipeline.py')
+    for day_sheet in DAY_SHEETS:
+        input_path = os.path.join(INITIAL_DIR, f"{SHEET_PREFIX}{day_sheet}.csv")
+        output_path = os.path.join(FINAL_SCHEDULE_DIR, f"{SHEET_PREFIX}{day_sheet}_event_schedule.csv")
+        nodes.append(BuildNode(
+            f"schedule:{day_sheet}", action_day_schedule, (input_path, output_path),
+            inputs=[input_path], outputs=[output_path],
+            sources=schedule_sources,
+        ))
+
+    personal_sources = python_sources('Personal_cue_sheets/main_script.py')
+    for day in PERSONAL_DAYS:
+        nodes.append(BuildNode(
+            f"personal_pdfs:{day}", action_personal_pdfs,
+            (day, ASSIGNMENT_CSV, HELPERS_CSV, render_workers, use_render_cache),
+            inputs=[ASSIGNMENT_CSV, HELPERS_CSV, os.path.join(PERSONAL_DIR, 'template.html'),
+                    os.path.join(PERSONAL_DIR, 'style.css'), os.path.join(PERSONAL_DIR, 'fonts', 'NanumGothicLight.ttf')],
+            outputs=[os.path.join(PERSONAL_DIR, 'output', day)],
+            sources=personal_sources,
+            config={'day': day},
+        ))
+
+    producers = {output: node.name for node in nodes for output in node.outputs}
+    for node in nodes:
+        node.deps = sorted({producers[path] for path in node.inputs if path in producers})
+    return nodes
+
+
+def select_nodes(nodes, targets):
+    """targets(노드 이름)와 그 노드들이 의존하는 노드들만 골라 원래 순서대로 반환합니다. targets가 비면 전체."""
+    if not targets:
+        return nodes
+    by_name = {node.name: node for node in nodes}
+    unknown = [name for name in targets if name not in by_name]
+    if unknown:
+        raise ValueError(f"알 수 없는 노드: {', '.join(unknown)} (가능한 노드: {', '.join(by_name)})")
+    selected, pending = set(), list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(by_name[name].deps)
+    return [node for node in nodes if node.name in selected]
+
+
+# --- 빌드 기록(stamp) ---
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_stamp(node):
+    """노드의 입력 파일 해시, 스크립트 소스 해시, 설정 해시를 계산합니다."""
+    source_digest = hashlib.sha256()
+    for source in node.sources:
+        source_digest.update(source.encode('utf-8'))
+        source_digest.update(_file_hash(os.path.join(REPO_DIR, source)).encode('ascii'))
+    return {
+        'inputs': {os.path.relpath(path, REPO_DIR): _file_hash(path) for path in node.inputs},
+        'script': source_digest.hexdigest(),
+        'config': hashlib.sha256(json.dumps(node.config, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest(),
+    }
+
+
+def load_build_state():
+    try:
+        with open(BUILD_STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_build_state(state):
+    tmp_path = BUILD_STATE_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, BUILD_STATE_PATH)
+
+
+def missing_inputs(node):
+    return [path for path in node.inputs if not os.path.exists(path)]
+
+
+def stale_reason(node, state):
+    """노드를 다시 만들어야 하는 이유를 반환합니다. 최신 상태이면 None."""
+    missing_outputs = [path for path in node.outputs if not os.path.exists(path)]
+    if missing_outputs:
+        return "결과물 없음"
+    recorded = state.get(node.name)
+    if recorded is None:
+        return "빌드 기록 없음"
+    stamp = compute_stamp(node)
+    if recorded.get('script') != stamp['script']:
+        return "스크립트 변경"
+    if recorded.get('config') != stamp['config']:
+        return "설정 변경"
+    changed = [path for path, digest in stamp['inputs'].items() if recorded.get('inputs', {}).get(path) != digest]
+    if changed:
+        return "입력 변경: " + ", ".join(os.path.basename(path) for path in changed)
+    return None
+
+
+# --- 실행 ---
+
+def _run_node(action, args):
+    """프로세스 풀 작업: 노드 작업을 실행하고 출력(print)을 모아서 돌려줍니다."""
+    log = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            action(*args)
+        return True, log.getvalue(), time.perf_counter() - started
+    except Exception as e:
+        return False, log.getvalue() + f"❌ 오류: {e}\n", time.perf_counter() - started
+
+
+def build(nodes, jobs=None, dry_run=False, force=False):
+    """오래된 노드만 의존성 순서대로 다시 만듭니다. 의존성이 없는 노드끼리는 동시에 실행합니다."""
+    state = load_build_state()
+    by_name = {node.name: node for node in nodes}
+    done, rebuilt, failed, skipped = set(), [], [], []
+    pending = list(nodes)
+    running = {}
+
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+        while pending or running:
+            for node in list(pending):
+                if any(dep in failed or dep in skipped for dep in node.deps):
+                    print(f"⏭️ [{node.name}] 선행 작업 실패로 건너뜁니다.")
+                    skipped.append(node.name)
+                    pending.remove(node)
+                    continue
+                if not all(dep in done for dep in node.deps):
+                    continue
+                pending.remove(node)
+
+                missing = missing_inputs(node)
+                if missing:
+                    print(f"⚠️ [{node.name}] 입력 파일이 없어 건너뜁니다: {', '.join(os.path.basename(p) for p in missing)}")
+                    skipped.append(node.name)
+                    continue
+
+                upstream_rebuilt = any(dep in rebuilt for dep in node.deps)
+                reason = "강제 빌드" if force else stale_reason(node, state)
+                if reason is None and not (dry_run and upstream_rebuilt):
+                    done.add(node.name)
+                    continue
+                reason = reason or "선행 작업 다시 빌드"
+
+                if dry_run:
+                    print(f"🔸 [{node.name}] 다시 빌드 예정 ({reason})")
+                    rebuilt.append(node.name)
+                    done.add(node.name)
+                    continue
+
+                print(f"🔨 [{node.name}] 빌드 시작 ({reason})")
+                running[executor.submit(_run_node, node.action, node.args)] = node
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                node = running.pop(future)
+                ok, log, elapsed = future.result()
+                for line in log.rstrip().splitlines():
+                    print(f"    {line}")
+                if ok:
+                    state[node.name] = compute_stamp(node)
+                    save_build_state(state)
+                    done.add(node.name)
+                    rebuilt.append(node.name)
+                    print(f"✅ [{node.name}] 완료 ({elapsed:.2f}초)")
+                else:
+                    failed.append(node.name)
+                    print(f"❌ [{node.name}] 실패 ({elapsed:.2f}초)")
+
+    up_to_date = len(nodes) - len(rebuilt) - len(failed) - len(skipped)
+    label = "다시 빌드 예정" if dry_run else "다시 빌드"
+    print(f"\n📊 {label} {len(rebuilt)}개, 최신 상태 {up_to_date}개, 실패 {len(failed)}개, 건너뜀 {len(skipped)}개")
+    return not failed
+
+
+def print_status(nodes):
+    state = load_build_state()
+    for node in nodes:
+        missing = missing_inputs(node)
+        if missing:
+            status = "입력 없음: " + ", ".join(os.path.basename(p) for p in missing)
+        else:
+            status = stale_reason(node, state) or "최신"
+        print(f"  {node.name:<24} {status}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="큐시트 파생 파일을 바뀐 부분만 다시 만듭니다.")
+    parser.add_argument('command', help="build, status 또는 빌드할 노드 이름")
+    parser.add_argument('targets', nargs='*', help="빌드할 노드 이름 (생략하면 전체)")
+    parser.add_argument('--jobs', type=int, default=None, help="동시에 실행할 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument('--dry-run', action='store_true', help="실제로 빌드하지 않고 다시 만들 노드만 보여줍니다.")
+    parser.add_argument('--force', action='store_true', help="모든 노드를 다시 빌드합니다.")
+    parser.add_argument('--render-workers', type=int, default=None,
+                        help="개인 큐시트 노드 하나가 PDF 렌더링에 쓸 프로세스 수 (기본값: CPU 코어 수 ÷ 동시에 도는 개인 큐시트 노드 수)")
+    parser.add_argument('--no-render-cache', action='store_true', help="개인 큐시트 PDF 렌더 캐시를 쓰지 않습니다.")
+    args = parser.parse_args()
+    if args.command not in ('build', 'status'):
+        args.targets.insert(0, args.command)
+        args.command = 'build'
+
+    try:
+        graph = select_nodes(build_graph(args.render_workers or default_render_workers(args.jobs), not args.no_render_cache), args.targets)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.command == 'status':
+        print_status(graph)
+    else:
+        sys.exit(0 if build(graph, jobs=args.jobs, dry_run=args.dry_run, force=args.force) else 1)
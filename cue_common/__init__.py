@@ -0,0 +1 @@
+"""큐시트 도구들이 함께 쓰는 공용 모듈 모음입니다."""
@@ -0,0 +1,129 @@
+import copy
+
+import numpy as np
+
+from cue_common.timeofday import MINUTES_PER_DAY
+
+# 도우미 × 시간대(slot) 가용 행렬
+#  - present[요일, 도우미]      : 그 요일에 참여 가능한지 ('도우미 명단'의 요일 행)
+#  - busy[요일, 도우미, 시간대] : 그 시간대에 배정된 일정이 있는지
+# "토요일 13:00~15:30 내내 비어 있는 사람"은 해당 시간대 열들을 잘라 any()로 줄이면
+# 모든 도우미에 대한 답이 한 번에 나옵니다. 팀별 인원은 bincount로 셉니다.
+# 시간대 경계에 맞지 않는 시간(예: slot_minutes=15에서 13:05)은 그 시간대 전체를 쓰는 것으로 봅니다.
+
+DEFAULT_SLOT_MINUTES = 5
+
+
+class AvailabilityMatrix:
+    """요일별 도우미 × 시간대 bool 행렬과 그 위의 조회 함수들."""
+
+    def __init__(self, names, days, teams=None, slot_minutes=DEFAULT_SLOT_MINUTES,
+                 day_start=0, day_end=MINUTES_PER_DAY):
+        self.names = list(names)
+        self.days = list(days)
+        self.slot_minutes = slot_minutes
+        self.day_start = day_start
+        self.num_slots = -(-(day_end - day_start) // slot_minutes)
+        self._name_pos = {name: i for i, name in enumerate(self.names)}
+        self._day_pos = {day: i for i, day in enumerate(self.days)}
+        # 요일별로, 표시한 배정 구간이 모두 시간대 경계에 맞으면 True (경계에 맞는 검색 결과가 분 단위 비교와 정확히 같음)
+        self.exact_days = np.ones(len(self.days), dtype=bool)
+
+        self.present = np.zeros((len(self.days), len(self.names)), dtype=bool)
+        self.busy = np.zeros((len(self.days), len(self.names), self.num_slots), dtype=bool)
+
+        teams = list(teams) if teams is not None else ['미지정'] * len(self.names)
+        self.team_names, self.team_codes = np.unique(np.array(teams, dtype=object).astype(str), return_inverse=True)
+
+    @classmethod
+    def from_schedules(cls, all_helpers, assigned_schedules, days, slot_minutes=DEFAULT_SLOT_MINUTES):
+        """
+        load_all_helpers() 결과({'이름': {'team':..., 'days': [...]}})와
+        {이름: [(요일, 시작분, 종료분, 설명), ...]} 배정 목록으로 행렬을 만듭니다.
+        """
+        names = sorted(all_helpers)
+        matrix = cls(names, days, teams=[all_helpers[name]['team'] for name in names], slot_minutes=slot_minutes)
+        for name in names:
+            for day in all_helpers[name]['days']:
+                matrix.set_present(name, day)
+        for name, schedules in assigned_schedules.items():
+            for day, start, end, _ in schedules:
+                matrix.mark_busy(name, day, start, end)
+        return matrix
+
+    # --- 채우기 ---
+
+    def set_present(self, name, day, present=True):
+        if name in self._name_pos and day in self._day_pos:
+            self.present[self._day_pos[day], self._name_pos[name]] = present
+
+    def mark_busy(self, name, day, start, end, busy=True):
+        """[start, end) 분 구간이 걸치는 시간대를 배정됨(busy)으로 표시합니다. 명단/요일에 없으면 무시."""
+        if name not in self._name_pos or day not in self._day_pos:
+            return
+        if not (self.is_aligned(start) and self.is_aligned(end)):
+            self.exact_days[self._day_pos[day]] = False
+        lo, hi = self.slot_range(start, end)
+        self.busy[self._day_pos[day], self._name_pos[name], lo:hi] = busy
+
+    def clear_day(self, day):
+        """그 요일의 배정 표시를 모두 지웁니다. (요일 하나만 다시 채울 때)"""
+        if day in self._day_pos:
+            self.busy[self._day_pos[day]] = False
+            self.exact_days[self._day_pos[day]] = True
+
+    def copy(self):
+        """배열(present/busy/exact_days)만 복사한 새 행렬. 명단과 요일 정보는 함께 씁니다."""
+        matrix = copy.copy(self)
+        matrix.present = self.present.copy()
+        matrix.busy = self.busy.copy()
+        matrix.exact_days = self.exact_days.copy()
+        return matrix
+
+    # --- 조회 ---
+
+    @property
+    def exact(self):
+        """모든 요일이 정확한지 (is_exact 참고)"""
+        return bool(self.exact_days.all())
+
+    def is_exact(self, day):
+        """그 요일의 배정 구간이 모두 시간대 경계에 맞는지. 행렬에 없는 요일이면 False."""
+        return day in self._day_pos and bool(self.exact_days[self._day_pos[day]])
+
+    def slot_range(self, start, end):
+        """[start, end) 분 구간이 걸치는 시간대 번호 범위 (lo, hi)."""
+        lo = (start - self.day_start) // self.slot_minutes
+        hi = -(-(end - self.day_start) // self.slot_minutes)
+        return max(lo, 0), min(max(hi, lo), self.num_slots)
+
+    def is_aligned(self, minutes):
+        """시간대 경계에 딱 맞는 시간인지 (맞으면 행렬 조회 결과가 분 단위 비교와 같습니다)."""
+        return (minutes - self.day_start) % self.slot_minutes == 0
+
+    def free_mask(self, day, start, end):
+        """그 요일에 참여하고 [start, end) 동안 배정이 하나도 없는 도우미 bool 배열."""
+        if day not in self._day_pos:
+            return np.zeros(len(self.names), dtype=bool)
+        d = self._day_pos[day]
+        lo, hi = self.slot_range(start, end)
+        return self.present[d] & ~self.busy[d, :, lo:hi].any(axis=1)
+
+    def free_names(self, day, start, end):
+        return [self.names[i] for i in np.flatnonzero(self.free_mask(day, start, end))]
+
+    def free_by_slot(self, day):
+        """(도우미 × 시간대) bool 행렬: 그 요일에 참여하고 해당 시간대가 비어 있으면 True."""
+        if day not in self._day_pos:
+            return np.zeros((len(self.names), self.num_slots), dtype=bool)
+        d = self._day_pos[day]
+        return self.present[d][:, None] & ~self.busy[d]
+
+    def team_counts(self, mask):
+        """도우미 bool 배열 → {팀: 인원}"""
+        counts = np.bincount(self.team_codes[mask], minlength=len(self.team_names))
+        return {str(team): int(count) for team, count in zip(self.team_names, counts) if count}
+
+    def slot_start(self, slot):
+        """시간대 번호 → 시작 분"""
+        return self.day_start + slot * self.slot_minutes
@@ -0,0 +1,153 @@
+import contextlib
+import os
+import re
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows에는 resource 모듈이 없습니다. (메모리 측정만 건너뜀)
+    resource = None
+
+# 긴 개인 큐시트를 나눠서 렌더링할 때 쓰는 도구들.
+#  - iter_chunks: 표의 행을 페이지 몇 장 분량씩 나눕니다.
+#  - chunk_template: 조각마다 쓸 HTML 템플릿. 제목/안내문은 첫 조각에만, 바닥글은 마지막 조각에만 넣습니다.
+#  - ChunkedStory: reportlab build()에 넘기는 story를 한꺼번에 만들지 않고, 앞 조각을 다 그렸을 때 다음 조각을 만듭니다.
+#  - MemoryTracker: 문서 하나를 렌더링하는 동안의 최대 RSS를 재고, 조각마다 상한(cap)을 넘었는지 확인합니다.
+#  - replace_when_done: PDF를 임시 파일에 쓰고, 끝까지 성공했을 때만 원래 경로로 옮깁니다.
+# 최대 RSS는 리눅스에서는 /proc/self/clear_refs로 문서마다 다시 잽니다. 다른 OS에서는 프로세스 전체의 최대값(ru_maxrss)이라
+# 같은 프로세스에서 앞서 렌더링한 문서의 최대값보다 작게 나오지 않습니다.
+DEFAULT_CHUNK_ROWS = 40  # 가로 A4 기준 1~2쪽 분량
+
+
+class RenderMemoryError(MemoryError):
+    """문서 하나를 렌더링하는 동안 최대 RSS가 상한을 넘었을 때 발생합니다."""
+
+
+def iter_chunks(rows, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """rows(리스트 또는 DataFrame)를 chunk_rows개씩 나눠 돌려줍니다."""
+    for start in range(0, len(rows), chunk_rows):
+        yield rows.iloc[start:start + chunk_rows] if hasattr(rows, 'iloc') else rows[start:start + chunk_rows]
+
+
+def chunk_template(template, first=True, last=True):
+    """
+    template에서 첫 조각이 아니면 <!-- chunk:first --> ~ <!-- /chunk:first --> 구역을,
+    마지막 조각이 아니면 <!-- chunk:last --> ~ <!-- /chunk:last --> 구역을 뺀 템플릿을 반환합니다.
+    """
+    for section, keep in (('first', first), ('last', last)):
+        if not keep:
+            template = re.sub(rf'<!-- chunk:{section} -->.*?<!-- /chunk:{section} -->', '', template, flags=re.S)
+    return template
+
+
+def _read_status_kb(field):
+    """/proc/self/status의 VmRSS/VmHWM 값(KB). 리눅스가 아니면 None."""
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_peak_rss():
+    """리눅스: 이 프로세스의 최대 RSS(VmHWM)를 현재 RSS로 되돌립니다. 성공하면 True."""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_bytes():
+    """지금까지(리눅스에서는 마지막 reset 이후) 이 프로세스의 최대 RSS(바이트). 잴 수 없으면 None."""
+    peak_kb = _read_status_kb('VmHWM')
+    if peak_kb is not None:
+        return peak_kb * 1024
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # macOS는 바이트, 리눅스는 KB 단위
+
+
+def format_bytes(num_bytes):
+    return '측정 불가' if num_bytes is None else f"{num_bytes / (1024 * 1024):.0f}MB"
+
+
+class MemoryTracker:
+    """
+    문서 하나의 최대 RSS를 잽니다. with 블록으로 감싸고, 조각 하나를 렌더링할 때마다 check()를 부릅니다.
+    max_rss_bytes를 넘으면 RenderMemoryError를 발생시켜 그 문서의 렌더링을 멈춥니다. (조각 단위로 확인)
+    """
+
+    def __init__(self, max_rss_bytes=None):
+        self.max_rss_bytes = max_rss_bytes
+        self.peak_bytes = None
+        self.chunks = 0
+
+    def __enter__(self):
+        _reset_peak_rss()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.peak_bytes = peak_rss_bytes()
+        return False
+
+    def check(self, after_write=False):
+        """조각 하나를 렌더링한 뒤(after_write=True이면 PDF를 다 쓴 뒤) 최대 RSS를 재고 상한을 넘었으면 RenderMemoryError."""
+        if not after_write:
+            self.chunks += 1
+        self.peak_bytes = peak_rss_bytes()
+        if self.max_rss_bytes and self.peak_bytes and self.peak_bytes > self.max_rss_bytes:
+            where = "PDF 저장" if after_write else f"{self.chunks}번째 조각"
+            raise RenderMemoryError(
+                f"렌더링 중 메모리 {format_bytes(self.peak_bytes)}가 상한 {format_bytes(self.max_rss_bytes)}를 넘었습니다. "
+                f"({where})")
+
+
+class ChunkedStory(list):
+    """
+    reportlab의 build()는 story 리스트 앞에서부터 flowable을 꺼내 그리고 지웁니다.
+    리스트가 비면(len() 호출 시) chunks에서 다음 조각의 flowable들을 채워 넣으므로, 메모리에는 한 조각 분량만 올라갑니다.
+    조각을 채울 때마다 on_chunk()를 부릅니다. (예: MemoryTracker.check)
+    """
+
+    def __init__(self, chunks, on_chunk=None):
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._on_chunk = on_chunk
+
+    def __len__(self):
+        while not list.__len__(self):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            if self._on_chunk is not None:
+                self._on_chunk()
+            self.extend(chunk)
+        return list.__len__(self)
+
+
+@contextlib.contextmanager
+def replace_when_done(path):
+    """
+    path 대신 쓸 임시 파일 경로를 돌려줍니다. with 블록이 끝나면 임시 파일을 path로 옮기고(os.replace),
+    도중에 예외가 나면(메모리 상한 초과 등) 임시 파일을 지웁니다. path에는 끝까지 쓴 PDF만 생깁니다.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        yield tmp_path
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def rss_cap_bytes(max_rss_mb):
+    """MB 단위 설정값을 바이트로 바꿉니다. 0이나 None이면 상한 없음(None)."""
+    return max_rss_mb * 1024 * 1024 if max_rss_mb else None
+
@@ -0,0 +1,140 @@
+import csv
+import os
+
+from cue_common.timeofday import parse_minutes
+
+# 가져온 CSV 옆에 같은 이름의 Feather(.feather) 스냅샷을 함께 저장해 두고,
+# 스냅샷이 CSV보다 최신이면 텍스트 CSV를 다시 파싱하지 않고 스냅샷을 읽습니다.
+#  - 값이 반복되는 열(요일/팀/이름 등)은 categorical로 저장합니다.
+#  - 시간 열('AM 6:00', '7:30' 등)은 '<열>_min' 정수(하루 중 분) 열을 함께 저장합니다.
+#  - 행마다 원래 칸 수를 'row_len' 열에 저장합니다. (batchGet 값은 끝의 빈칸이 잘려 행 길이가 제각각)
+# pandas/pyarrow가 없으면 스냅샷 없이 CSV만 사용합니다.
+try:
+    import pandas as pd
+    import pyarrow  # noqa: F401  (to_feather/read_feather에 필요)
+    SNAPSHOT_AVAILABLE = True
+except ImportError:
+    pd = None
+    SNAPSHOT_AVAILABLE = False
+
+SNAPSHOT_EXT = '.feather'
+MINUTE_SUFFIX = '_min'
+ROW_LENGTH_COLUMN = 'row_len'
+# 고유값 비율이 이 값 이하인 열만 categorical로 저장합니다.
+CATEGORICAL_MAX_RATIO = 0.5
+
+
+def snapshot_path_for(csv_path):
+    """'foo.csv' → 'foo.feather'"""
+    return os.path.splitext(csv_path)[0] + SNAPSHOT_EXT
+
+
+def _build_typed_frame(rows):
+    width = max((len(row) for row in rows), default=0)
+    columns = {}
+    for c_idx in range(width):
+        values = [row[c_idx] if c_idx < len(row) and row[c_idx] != '' else None for row in rows]
+        non_empty = [v for v in values if v is not None]
+        column = pd.Series(values, dtype='object')
+        if non_empty and len(set(non_empty)) <= len(values) * CATEGORICAL_MAX_RATIO:
+            column = column.astype('category')
+        columns[f"c{c_idx}"] = column
+
+        minutes = [parse_minutes(v) for v in values]
+        # 본문 값 대부분이 시간 형식인 열에만 분(minute) 열을 추가합니다. (머리글 몇 행은 예외 허용)
+        parsed = sum(1 for m in minutes if m is not None)
+        if parsed and parsed >= len(non_empty) * 0.8:
+            columns[f"c{c_idx}{MINUTE_SUFFIX}"] = pd.array(minutes, dtype='Int16')
+    columns[ROW_LENGTH_COLUMN] = pd.array([len(row) for row in rows], dtype='Int32')
+    return pd.DataFrame(columns, index=pd.RangeIndex(len(rows)))
+
+
+def write_snapshot(csv_path, rows):
+    """가져온 시트 값(2차원 리스트)을 CSV 옆에 Feather 스냅샷으로 저장합니다. 저장하면 True."""
+    if not SNAPSHOT_AVAILABLE:
+        return False
+    snapshot_path = snapshot_path_for(csv_path)
+    tmp_path = snapshot_path + '.tmp'
+    _build_typed_frame(rows).to_feather(tmp_path)
+    os.replace(tmp_path, snapshot_path)
+    return True
+
+
+def is_snapshot_fresh(csv_path):
+    """스냅샷이 있고 CSV보다 최신(또는 CSV가 없음)이면 True."""
+    snapshot_path = snapshot_path_for(csv_path)
+    if not SNAPSHOT_AVAILABLE or not os.path.exists(snapshot_path):
+        return False
+    if not os.path.exists(csv_path):
+        return True
+    return os.path.getmtime(snapshot_path) >= os.path.getmtime(csv_path)
+
+
+def read_typed_snapshot(csv_path):
+    """categorical/분(minute) 열이 포함된 스냅샷 원본을 반환합니다. 최신 스냅샷이 없으면 None."""
+    if not is_snapshot_fresh(csv_path):
+        return None
+    return pd.read_feather(snapshot_path_for(csv_path))
+
+
+def _mangle_header(header):
+    """pd.read_csv(header=0)과 같은 규칙으로 열 이름을 만듭니다. (중복 → '이름.1', 빈칸 → 'Unnamed: i')"""
+    seen = {}
+    names = []
+    for i, name in enumerate(header):
+        name = f"Unnamed: {i}" if name is None or (isinstance(name, float) and name != name) else str(name)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _value_columns(typed):
+    return [c for c in typed.columns if c != ROW_LENGTH_COLUMN and not c.endswith(MINUTE_SUFFIX)]
+
+
+def read_sheet_frame(csv_path, header=None, on_bad_lines='error'):
+    """
+    pd.read_csv(csv_path, header=header, dtype=str, keep_default_na=False, na_values=[''],
+    on_bad_lines=on_bad_lines)와 같은 문자열 DataFrame을 반환합니다. 최신 스냅샷이 있으면 CSV 대신 스냅샷을 읽습니다.
+    header는 None(머리글 없음) 또는 0(첫 행을 열 이름으로 사용)만 지원합니다.
+    on_bad_lines='skip'이면 pandas처럼 첫 행보다 칸이 많은 행을 건너뜁니다.
+    (행 길이가 저장되지 않은 예전 스냅샷이거나 'error'/'skip' 외의 값이면 CSV를 읽습니다)
+    """
+    typed = read_typed_snapshot(csv_path)
+    if typed is not None and on_bad_lines != 'error':
+        if on_bad_lines != 'skip' or ROW_LENGTH_COLUMN not in typed.columns:
+            typed = None
+    if typed is None:
+        return pd.read_csv(csv_path, header=header, dtype=str, keep_default_na=False, na_values=[''],
+                           on_bad_lines=on_bad_lines)
+
+    value_columns = _value_columns(typed)
+    df = typed[value_columns].astype(object)
+    df = df.where(df.notna(), float('nan'))
+    df.columns = range(len(value_columns))
+    if on_bad_lines == 'skip' and len(df):
+        row_lengths = typed[ROW_LENGTH_COLUMN].to_numpy()
+        width = int(row_lengths[0])
+        df = df.iloc[row_lengths <= width, :width].reset_index(drop=True)
+    if header == 0:
+        df.columns = _mangle_header(df.iloc[0].tolist())
+        df = df.iloc[1:].reset_index(drop=True)
+    return df
+
+
+def read_sheet_rows(csv_path):
+    """csv.reader로 읽은 것과 같은 2차원 문자열 리스트를 반환합니다. 최신 스냅샷이 있으면 스냅샷을 읽습니다."""
+    typed = read_typed_snapshot(csv_path)
+    if typed is None:
+        with open(csv_path, mode='r', encoding='utf-8', newline='') as infile:
+            return list(csv.reader(infile))
+
+    columns = [typed[c].astype(object).tolist() for c in _value_columns(typed)]
+    rows = [['' if v is None or v != v else v for v in row] for row in zip(*columns)]
+    if ROW_LENGTH_COLUMN in typed.columns:
+        rows = [row[:length] for row, length in zip(rows, typed[ROW_LENGTH_COLUMN].tolist())]
+    return rows
@@ -0,0 +1,50 @@
+import numpy as np
+
+# 중복 배정(시간이 겹치는 일정) 검사: 모든 (도우미, 요일, 시작, 종료) 행을 한 번에 정렬하고 쓸어가며(sweep line)
+# 겹치는 일정끼리 최대 묶음(cluster)으로 나눕니다.
+#  - (도우미, 요일, 시작시간) 순으로 정렬한 뒤, 같은 (도우미, 요일) 안에서 지금까지의 가장 늦은 종료시간(cummax)을 구합니다.
+#  - 다음 일정의 시작시간이 그 종료시간 이상이면 새 묶음이 시작됩니다.
+#    (A-B, B-C 처럼 사슬로 이어진 겹침도 하나의 묶음이 됩니다)
+# 정렬 O(n log n) + 나머지는 배열 연산이라, 배정 10만 행도 1초 안에 끝납니다.
+
+
+def _codes_in_order(values):
+    """값 → 처음 나온 순서대로 매긴 정수 코드"""
+    positions = {}
+    return np.fromiter((positions.setdefault(v, len(positions)) for v in values), dtype=np.int64, count=len(values))
+
+
+def find_overlap_clusters(helpers, days, starts, ends):
+    """
+    같은 도우미·같은 요일에서 시간이 겹치는(앞 일정 종료 > 뒤 일정 시작) 일정 묶음들을 찾습니다.
+    반환값: 행 번호 배열의 리스트. 묶음마다 2행 이상이며, (도우미가 처음 나온 순서, 요일, 시작시간) 순서입니다.
+    """
+    count = len(starts)
+    if count == 0:
+        return []
+    helper_codes = _codes_in_order(helpers)
+    _, day_codes = np.unique(np.asarray(days, dtype=str), return_inverse=True)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+
+    # 정렬 (lexsort는 마지막 키가 1순위이고, 같은 값은 원래 순서를 유지합니다)
+    order = np.lexsort((starts, day_codes, helper_codes))
+    group = helper_codes[order] * (day_codes.max() + 1) + day_codes[order]
+    sorted_starts = starts[order]
+    sorted_ends = ends[order]
+
+    # 그룹별 누적 최대 종료시간: 그룹마다 충분히 큰 오프셋을 더해 전체 cummax 한 번으로 계산합니다.
+    new_group = np.ones(count, dtype=bool)
+    new_group[1:] = group[1:] != group[:-1]
+    group_number = np.cumsum(new_group) - 1
+    span = int(max(sorted_ends.max(), sorted_starts.max()) - min(sorted_ends.min(), sorted_starts.min())) + 1
+    offset = group_number * span
+    running_end = np.maximum.accumulate(sorted_ends + offset) - offset
+
+    new_cluster = new_group.copy()
+    new_cluster[1:] |= sorted_starts[1:] >= running_end[:-1]
+    cluster_id = np.cumsum(new_cluster) - 1
+
+    sizes = np.bincount(cluster_id)
+    boundaries = np.flatnonzero(new_cluster)
+    return [order[b:b + sizes[c]] for c, b in enumerate(boundaries) if sizes[c] > 1]
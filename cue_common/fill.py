@@ -0,0 +1,73 @@
+import pandas as pd
+
+# 병합 셀 채우기 (forward fill): 빈 셀을 바로 위(또는 왼쪽)의 마지막 값으로 채웁니다.
+# 3_personal_cue.py, 3_tidy_cue_sheets.py(cue_stages), 2_chopping_name_sheets.py가 같은 규칙을 씁니다.
+#  - 빈 셀: 비어 있거나 공백만 있는 문자열, None/NaN
+#  - 값이 있는 셀은 그대로 두고, 빈 셀은 마지막 값으로 채웁니다.
+#    strip_filled=True면 마지막 값의 앞뒤 공백을 떼고 채웁니다. (3_personal_cue.py의 예전 동작, forward_fill_rows 기본값)
+#    큐시트 DataFrame(forward_fill_frame)은 원래 값 그대로 채웁니다. 원래 셀과 채운 셀의 글자가 달라지면
+#    6단계 구간 압축에서 같은 일정이 서로 다른 일정으로 나뉘기 때문입니다.
+#  - 첫 값이 나오기 전의 빈 셀은 그대로 둡니다.
+# 배열(numpy 문자열/object 배열, pyarrow)로 바꿔서 채우면 변환하고 다시 파이썬 리스트로 돌리는 비용이
+# 채우기 자체보다 커서 오히려 느렸습니다. (benchmarks/bench_fill.py 참고)
+# 그래서 행/열마다 한 번 훑는 루프로 처리하고, DataFrame은 고른 열들을 한 번에 꺼내고 한 번에 돌려놓습니다.
+
+
+def _fill_values(values, strip_filled):
+    """값 리스트 하나(열 또는 행)를 앞에서부터 채운 새 리스트."""
+    filled = list(values)
+    last_value = None
+    for i, value in enumerate(filled):
+        if isinstance(value, str):
+            stripped = value.strip()
+            if stripped:
+                last_value = stripped if strip_filled else value
+                continue
+        elif value is not None and value is not pd.NA and value == value:  # NaN != NaN
+            last_value = value
+            continue
+        if last_value is not None:
+            filled[i] = last_value
+    return filled
+
+
+def forward_fill_rows(data_rows, strip_filled=True):
+    """
+    리스트의 리스트(CSV 행들, 셀은 모두 문자열)를 가장 긴 행 길이로 패딩하면서 위 → 아래로 채운 새 리스트를 돌려줍니다.
+    (strip_filled=True: 3_personal_cue.py의 예전 fill_data_down_all_columns와 같은 결과)
+    """
+    if not data_rows:
+        return []
+    max_cols = max(len(row) for row in data_rows)
+    padding = [""] * max_cols
+    last_values = [None] * max_cols
+    processed = []
+    for row in data_rows:
+        new_row = [*row, *padding[len(row):]]
+        for c, cell in enumerate(new_row):
+            stripped = cell.strip()
+            if stripped:
+                last_values[c] = stripped if strip_filled else cell
+            elif last_values[c] is not None:
+                new_row[c] = last_values[c]
+        processed.append(new_row)
+    return processed
+
+
+def forward_fill_frame(df, positions=None, axis=0, strip_filled=False):
+    """
+    DataFrame에서 positions(열 위치 목록, 기본: 전체 열)에 해당하는 열들을 채운 새 DataFrame을 돌려줍니다.
+    열 이름이 겹치거나 비어 있어도 되도록 위치로 고릅니다. axis=1이면 고른 열들 사이에서 왼쪽 → 오른쪽으로 채웁니다.
+    """
+    positions = list(range(df.shape[1])) if positions is None else list(positions)
+    result = df.copy()
+    if not positions or df.empty:
+        return result
+    block = df.iloc[:, positions].to_numpy(dtype=object)
+    if axis == 1:
+        columns = list(zip(*[_fill_values(row, strip_filled) for row in block.tolist()]))
+    else:
+        columns = [_fill_values(column, strip_filled) for column in block.T.tolist()]
+    for position, values in zip(positions, columns):
+        result.isetitem(position, pd.Series(values, index=df.index, dtype=object).astype(df.dtypes.iloc[position]))
+    return result
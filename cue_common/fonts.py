@@ -0,0 +1,93 @@
+import hashlib
+import os
+import string
+
+try:
+    from fontTools import subset as font_subset
+    SUBSET_AVAILABLE = True
+except ImportError:  # fontTools가 없으면 원본 폰트를 그대로 씁니다.
+    font_subset = None
+    SUBSET_AVAILABLE = False
+
+# PDF 생성기들이 함께 쓰는 한글 폰트 (NanumGothicLight).
+#  - 실행 한 번에 쓰이는 글자(모든 표의 한글 음절 + 기본 ASCII)만 남긴 작은 서브셋 TTF를 한 번 만들고,
+#    모든 PDF가 그 서브셋을 씁니다. 서브셋은 원본 폰트와 글자 목록의 해시로 캐시 폴더에 저장되므로
+#    렌더링 워커 프로세스들은 같은 파일을 읽기만 합니다.
+#  - reportlab은 프로세스마다 폰트를 한 번만 등록합니다. (TTF 해석과 글리프 폭 계산 결과를 재사용)
+# 참고: reportlab과 WeasyPrint 모두 PDF에는 쓰인 글리프만 넣지만, 그 전에 폰트 전체를 읽고 해석합니다.
+#      한글 11,172자가 든 원본 대신 서브셋을 읽으면 PDF마다/프로세스마다 드는 이 비용이 줄어듭니다.
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONT_PATH = os.path.join(REPO_DIR, 'Fonts', 'NanumGothicLight.ttf')
+FONT_NAME = 'NanumGothicLight'
+DEFAULT_SUBSET_DIR = os.path.join(REPO_DIR, '.render_cache', 'fonts')
+
+# 서브셋에 항상 넣는 글자 (숫자, 영문, 시간 표기에 쓰는 기호 등)
+BASE_CHARACTERS = frozenset(string.printable) - frozenset('\t\n\r\x0b\x0c')
+
+_registered_fonts = {}  # (글꼴 이름, 경로) → 등록된 이름. 프로세스마다 한 번만 등록합니다.
+
+
+def collect_characters(*texts):
+    """문자열들(또는 문자열이 든 리스트/표)에 쓰인 글자 집합을 모읍니다."""
+    characters = set()
+    stack = list(texts)
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            characters.update(item)
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif item is not None:
+            characters.update(str(item))
+    return characters
+
+
+def _subset_path(font_path, characters, subset_dir):
+    digest = hashlib.sha256()
+    with open(font_path, 'rb') as f:
+        digest.update(hashlib.sha256(f.read()).digest())
+    digest.update(''.join(sorted(characters)).encode('utf-8'))
+    stem = os.path.splitext(os.path.basename(font_path))[0]
+    return os.path.join(subset_dir, f"{stem}-{digest.hexdigest()[:16]}.ttf")
+
+
+def subset_font(characters, font_path=FONT_PATH, subset_dir=DEFAULT_SUBSET_DIR):
+    """
+    characters(+ BASE_CHARACTERS)만 남긴 서브셋 TTF 경로를 반환합니다. 같은 글자 목록이면 캐시된 파일을 그대로 씁니다.
+    fontTools가 없으면 원본 폰트 경로를 반환합니다.
+    """
+    if not SUBSET_AVAILABLE:
+        return font_path
+    characters = set(characters) | BASE_CHARACTERS
+    path = _subset_path(font_path, characters, subset_dir)
+    if os.path.exists(path):
+        return path
+    options = font_subset.Options()
+    options.name_IDs = ['*']        # 글꼴 이름은 그대로 유지
+    options.notdef_outline = True
+    options.hinting = False         # PDF에서는 힌팅을 쓰지 않으므로 빼서 크기를 줄입니다.
+    font = font_subset.load_font(font_path, options)
+    subsetter = font_subset.Subsetter(options)
+    subsetter.populate(text=''.join(sorted(characters)))
+    subsetter.subset(font)
+    os.makedirs(subset_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    font_subset.save_font(font, tmp_path, options)
+    os.replace(tmp_path, path)
+    return path
+
+
+def register_reportlab_font(font_path=FONT_PATH, font_name=FONT_NAME):
+    """
+    reportlab에 TTF 폰트를 등록하고 글꼴 이름을 반환합니다. 같은 프로세스에서 다시 부르면 등록을 건너뜁니다.
+    <b>/<i> 태그가 있어도 오류가 나지 않도록 굵게/기울임도 같은 폰트로 연결합니다. (Light 한 가지 굵기뿐)
+    """
+    key = (font_name, os.path.abspath(font_path))
+    if key in _registered_fonts:
+        return _registered_fonts[key]
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    pdfmetrics.registerFont(TTFont(font_name, font_path))
+    pdfmetrics.registerFontFamily(font_name, normal=font_name, bold=font_name, italic=font_name, boldItalic=font_name)
+    _registered_fonts[key] = font_name
+    return font_name
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+
+from cue_common import sheet_source
+
+# 시트 가져오기 기록(manifest) 파일.
+# 워크시트마다 Drive 수정 시각(modifiedTime)과 내용 해시를 저장해 두고,
+# 다음 가져오기 때 바뀌지 않은 시트는 CSV를 다시 쓰지 않습니다. (CSV 수정 시각도 그대로 유지)
+# 기록은 (스프레드시트 ID, 시트 이름, CSV 경로)마다 따로 둡니다. 1_import_all_sheets.py와 3_personal_cue.py처럼
+# 같은 시트를 서로 다른 CSV로 저장하는 도구들이 한 manifest를 같이 써도 서로의 기록을 덮어쓰지 않습니다.
+MANIFEST_SUFFIX = '_manifest.json'
+
+
+def manifest_path_for(output_directory):
+    """CSV 저장 폴더 옆에 놓이는 manifest 경로를 반환합니다. (예: initial_csv_files → initial_csv_files_manifest.json)"""
+    return os.path.normpath(output_directory) + MANIFEST_SUFFIX
+
+
+def load_manifest(manifest_path):
+    """manifest 파일을 읽어옵니다. 파일이 없거나 깨져 있으면 빈 manifest를 반환합니다."""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if isinstance(manifest, dict) and isinstance(manifest.get('spreadsheets'), dict):
+            return manifest
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+    return {'spreadsheets': {}}
+
+
+def save_manifest(manifest_path, manifest):
+    """manifest를 임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 기존 기록이 깨지지 않게 저장합니다."""
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def content_hash(all_values):
+    """get_all_values() 결과(2차원 리스트)의 내용 해시(sha256)를 계산합니다."""
+    payload = json.dumps(all_values, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _csv_key(csv_path):
+    return os.path.abspath(csv_path)
+
+
+def _sheet_entry(manifest, spreadsheet_id, sheet_name, csv_path):
+    entries = manifest['spreadsheets'].get(spreadsheet_id, {}).get(sheet_name)
+    if not isinstance(entries, dict) or 'hash' in entries:  # CSV 경로별로 나누기 전의 기록은 없는 것으로 봅니다.
+        return None
+    return entries.get(_csv_key(csv_path))
+
+
+def is_revision_unchanged(manifest, spreadsheet_id, sheet_name, modified_time, csv_path):
+    """
+    스프레드시트의 Drive 수정 시각이 지난 가져오기 때와 같고 CSV 파일도 그대로 있으면 True.
+    이 경우 시트 내용을 내려받을 필요조차 없습니다.
+    record 모드에서는 항상 False입니다. (모든 시트를 내려받아야 기록이 빠짐없이 남아 replay할 수 있음)
+    """
+    if sheet_source.is_recording():
+        return False
+    entry = _sheet_entry(manifest, spreadsheet_id, sheet_name, csv_path)
+    return (
+        entry is not None
+        and modified_time is not None
+        and entry.get('modified_time') == modified_time
+        and entry.get('csv_path') == csv_path
+        and os.path.exists(csv_path)
+    )
+
+
+def is_content_unchanged(manifest, spreadsheet_id, sheet_name, rows_hash, csv_path):
+    """내려받은 시트 내용의 해시가 기록과 같고 CSV 파일이 그대로 있으면 True. (CSV를 다시 쓸 필요 없음)"""
+    entry = _sheet_entry(manifest, spreadsheet_id, sheet_name, csv_path)
+    return (
+        entry is not None
+        and entry.get('hash') == rows_hash
+        and entry.get('csv_path') == csv_path
+        and os.path.exists(csv_path)
+    )
+
+
+def record_sheet(manifest, spreadsheet_id, sheet_name, csv_path, rows_hash, modified_time, row_count):
+    """가져오기가 끝난 시트의 수정 시각, 내용 해시, CSV 경로를 manifest에 기록합니다."""
+    sheets = manifest['spreadsheets'].setdefault(spreadsheet_id, {})
+    if not isinstance(sheets.get(sheet_name), dict) or 'hash' in sheets[sheet_name]:
+        sheets[sheet_name] = {}
+    sheets[sheet_name][_csv_key(csv_path)] = {
+        'csv_path': csv_path,
+        'hash': rows_hash,
+        'modified_time': modified_time,
+        'rows': row_count,
+    }
+
+
+def get_drive_modified_time(spreadsheet):
+    """gspread Spreadsheet 객체의 Drive 수정 시각(modifiedTime)을 가져옵니다. 가져올 수 없으면 None."""
+    return sheet_source.drive_modified_time(spreadsheet)
@@ -0,0 +1,49 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+# 요일별 배정 구간 색인: "토요일 13:00~15:30에 일정이 있는 사람"을 찾을 때
+# 모든 사람의 모든 일정을 훑지 않고, 시작시간으로 정렬된 배열에서 겹칠 수 있는 구간만 봅니다.
+#  - 구간 [start, end) 가 검색 구간과 겹치는 조건: start < 검색 종료 AND 검색 시작 < end
+#  - start < 검색 종료      → bisect로 오른쪽 끝을 찾습니다.
+#  - 검색 시작 < end        → end ≤ start + (가장 긴 구간 길이) 이므로 왼쪽 끝도 bisect로 자릅니다.
+# 시간 값은 비교만 가능하면 되지만, 가장 긴 구간 길이를 빼야 하므로 분(int)을 씁니다.
+
+
+class IntervalIndex:
+    """한 요일의 (시작, 종료, 이름) 구간들을 시작시간 순으로 정렬해 둔 색인."""
+
+    def __init__(self, intervals):
+        intervals = sorted(intervals, key=lambda item: (item[0], item[1]))
+        self.starts = [start for start, _, _ in intervals]
+        self.ends = [end for _, end, _ in intervals]
+        self.names = [name for _, _, name in intervals]
+        self.max_duration = max((end - start for start, end, _ in intervals), default=0)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def overlapping(self, start, end):
+        """구간 [s, e) 중 s < end 이고 start < e 인(검색 구간과 겹치는) 구간의 위치(index)를 차례로 돌려줍니다."""
+        hi = bisect_left(self.starts, end)
+        lo = bisect_right(self.starts, start - self.max_duration)
+        for i in range(lo, hi):
+            if start < self.ends[i]:
+                yield i
+
+    def busy_names(self, start, end):
+        """[start, end) 와 겹치는 일정이 있는 이름 집합."""
+        return {self.names[i] for i in self.overlapping(start, end)}
+
+
+def intervals_by_day(assigned_schedules):
+    """{이름: [(요일, 시작분, 종료분, 설명), ...]} → {요일: [(시작분, 종료분, 이름), ...]}"""
+    by_day = defaultdict(list)
+    for name, schedules in assigned_schedules.items():
+        for day, start, end, _ in schedules:
+            by_day[day].append((start, end, name))
+    return by_day
+
+
+def build_day_index(assigned_schedules):
+    """{이름: [(요일, 시작분, 종료분, 설명), ...]} → {요일: IntervalIndex}"""
+    return {day: IntervalIndex(intervals) for day, intervals in intervals_by_day(assigned_schedules).items()}
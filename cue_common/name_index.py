@@ -0,0 +1,196 @@
+from bisect import bisect_left
+from collections import defaultdict
+
+import numpy as np
+
+# 이름 검색 색인: 오타나 띄어쓰기가 달라도 비슷한 이름을 찾아 줍니다.
+#  - 한글 음절을 자모로 풀어서 비교합니다. ('김철수' → 'ㄱㅣㅁㅊㅓㄹㅅㅜ')
+#    받침 하나가 틀린 이름('김철슈', '김철스')도 자모 몇 개 차이로 가깝게 나옵니다.
+#  - 자모 2-gram 역색인으로 후보를 좁히고(bincount 한 번), 상위 후보끼리만 편집 거리(자모 단위)로 순위를 매깁니다.
+#    명단 수만 명에서도 검색 한 번이 1ms 안쪽입니다. (benchmarks/bench_name_index.py)
+#  - 자모 단위 접두어 검색으로 자동 완성을 합니다. ('김처' → '김철수', '김철민', ...)
+# 띄어쓰기와 대소문자는 무시합니다.
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+              'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+NGRAM = 2
+# 2-gram 겹침(Dice 계수)으로 고른 후보 중 편집 거리를 계산할 최대 개수
+MAX_RERANK = 20
+
+
+def to_jamo(text):
+    """한글 음절을 자모로 풀고, 띄어쓰기를 없애고 소문자로 바꿉니다."""
+    jamo = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            jamo.append(_CHOSEONG[offset // 588])
+            jamo.append(_JUNGSEONG[(offset % 588) // 28])
+            jamo.append(_JONGSEONG[offset % 28])
+        elif not ch.isspace():
+            jamo.append(ch.lower())
+    return ''.join(jamo)
+
+
+def _ngrams(key):
+    padded = f"^{key}$"
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+def _edit_distance(a, b, max_distance):
+    """자모 문자열 사이의 편집 거리 (Levenshtein). max_distance를 넘는 것이 확실해지면 max_distance + 1."""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > max_distance:
+        return max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        left = best = i
+        for j, cb in enumerate(b):
+            cost = previous[j] if ca == cb else previous[j] + 1
+            if left + 1 < cost:
+                cost = left + 1
+            if previous[j + 1] + 1 < cost:
+                cost = previous[j + 1] + 1
+            current.append(cost)
+            left = cost
+            if cost < best:
+                best = cost
+        if best > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous[-1], max_distance + 1)
+
+
+class NameIndex:
+    """이름 목록으로 한 번 만들어 두고 비슷한 이름 검색/자동 완성에 씁니다."""
+
+    def __init__(self, names):
+        self.names = sorted({name for name in names if name})
+        self.keys = [to_jamo(name) for name in self.names]
+        self._by_key = defaultdict(list)
+        postings = defaultdict(list)
+        gram_counts = []
+        for i, key in enumerate(self.keys):
+            self._by_key[key].append(i)
+            grams = _ngrams(key)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings[gram].append(i)
+        # 2-gram → 그 2-gram을 가진 이름 번호 배열
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._gram_counts = np.array(gram_counts, dtype=np.int32)
+        # 자동 완성용: (자모 키, 이름 번호) 정렬 목록
+        self._sorted_keys = sorted((key, i) for i, key in enumerate(self.keys))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return any(self.names[i] == name for i in self._by_key.get(to_jamo(name), ()))
+
+    def exact(self, text):
+        """띄어쓰기/대소문자만 다른 같은 이름들."""
+        return [self.names[i] for i in self._by_key.get(to_jamo(text), [])]
+
+    def lookup(self, text, limit=5, max_distance=None):
+        """
+        비슷한 이름을 가까운 순서로 [(이름, 편집 거리), ...] 로 돌려줍니다.
+        max_distance를 주지 않으면 입력 길이(자모)의 1/3까지 허용합니다.
+        """
+        key = to_jamo(text)
+        if not key:
+            return []
+        if max_distance is None:
+            max_distance = max(1, len(key) // 3)
+
+        grams = _ngrams(key)
+        lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not lists:
+            return []
+        # 이름마다 겹치는 2-gram 수. 편집 한 번은 2-gram을 최대 NGRAM개 바꾸므로
+        # 그보다 적게 겹치는 이름은 편집 거리를 계산하지 않고 버립니다. (q-gram 개수 필터)
+        hits = np.bincount(np.concatenate(lists), minlength=len(self.names))
+        candidates = np.flatnonzero(hits >= max(1, len(grams) - NGRAM * max_distance))
+        # 남은 후보 중 Dice 계수 상위만 편집 거리로 다시 정렬합니다.
+        if len(candidates) > MAX_RERANK:
+            dice = hits[candidates] / (len(grams) + self._gram_counts[candidates])
+            candidates = candidates[np.argpartition(-dice, MAX_RERANK)[:MAX_RERANK]]
+        ranked = []
+        for i in candidates.tolist():
+            distance = _edit_distance(key, self.keys[i], max_distance)
+            if distance <= max_distance:
+                ranked.append((distance, self.names[i]))
+        ranked.sort()
+        return [(name, distance) for distance, name in ranked[:limit]]
+
+    def complete(self, prefix, limit=10):
+        """자모 단위 접두어로 시작하는 이름들 (이름 순)."""
+        key = to_jamo(prefix)
+        start = bisect_left(self._sorted_keys, (key, -1))
+        matches = []
+        for candidate_key, i in self._sorted_keys[start:]:
+            if not candidate_key.startswith(key):
+                break
+            matches.append(self.names[i])
+        return sorted(matches)[:limit]
+
+
+def suggest_names(index, text, limit=5):
+    """정확히 같은 이름이 없을 때 보여줄 후보: 자동 완성 결과 + 비슷한 이름 (중복 없이)."""
+    suggestions = []
+    for name in index.complete(text, limit) + [name for name, _ in index.lookup(text, limit)]:
+        if name not in suggestions:
+            suggestions.append(name)
+    return suggestions[:limit]
+
+
+def ask_name(index, text, input_func=input):
+    """
+    대화형 검색용: 입력한 이름이 명단에 정확히 있으면 그대로, 없으면 비슷한 이름 후보를 보여주고 번호로 고르게 합니다.
+    후보가 하나뿐이면 바로 그 이름을 씁니다. 고르지 않으면 입력한 그대로 돌려줍니다.
+    """
+    text = text.strip()
+    if text in index:
+        return text
+    exact = index.exact(text)
+    candidates = exact if exact else suggest_names(index, text)
+    if not candidates:
+        return text
+    if len(candidates) == 1:
+        print(f"  → '{text}' 대신 '{candidates[0]}' 님으로 검색합니다.")
+        return candidates[0]
+    print(f"  → '{text}' 님을 찾을 수 없습니다. 혹시 아래 분인가요?")
+    for number, name in enumerate(candidates, 1):
+        print(f"     {number}. {name}")
+    choice = input_func("  번호 선택 (Enter: 입력한 이름 그대로) >> ").strip()
+    if choice.isdigit() and 1 <= int(choice) <= len(candidates):
+        return candidates[int(choice) - 1]
+    return text
+
+
+def install_readline_completer(index):
+    """readline이 있으면 Tab 키로 이름 자동 완성을 켭니다. (없으면 아무것도 하지 않음) 켜지면 True."""
+    try:
+        import readline
+    except ImportError:
+        return False
+
+    matches = []
+
+    def completer(text, state):
+        if state == 0:
+            matches[:] = index.complete(text, limit=50) if text else []
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    readline.set_completer_delims(' \t\n,')
+    readline.parse_and_bind('tab: complete')
+    return True
@@ -0,0 +1,101 @@
+from collections import deque
+
+# 여러 이름을 한 번에 찾는 매처 (Aho-Corasick 오토마톤)
+# 표의 각 행 텍스트를 글자 단위로 한 번만 훑으면서 명단의 모든 이름을 동시에 찾습니다.
+#  - 예전 방식: 도우미마다 모든 행을 다시 훑음 → 도우미 수 × 행 수 × 행 길이
+#  - 이 방식:   모든 행을 한 번 훑음         → 전체 텍스트 길이 + 찾은 이름 수
+# 기본값(whole_word=True)은 이름 앞뒤가 글자/숫자가 아닐 때만 찾은 것으로 봅니다.
+#   '이희'는 '이희, 김철수'에서는 찾지만 '이희언'에서는 찾지 않습니다.
+# whole_word=False로 만들면 예전 `name in text`처럼 부분 문자열도 찾습니다.
+
+
+def _is_word_char(ch):
+    return ch.isalnum()
+
+
+class NameMatcher:
+    """이름 목록으로 한 번 만들어 두고, 여러 텍스트에서 이름이 나오는 위치/행을 찾습니다."""
+
+    def __init__(self, names, whole_word=True):
+        self.whole_word = whole_word
+        # 찾을 문자열(앞뒤 공백 제거) → 원래 이름들 (공백만 다른 이름이 여러 개일 수 있음)
+        self.patterns = []
+        self._pattern_names = []
+        positions = {}
+        for name in names:
+            if not isinstance(name, str) or not name.strip():
+                continue
+            pattern = name.strip()
+            if pattern not in positions:
+                positions[pattern] = len(self.patterns)
+                self.patterns.append(pattern)
+                self._pattern_names.append([])
+            if name not in self._pattern_names[positions[pattern]]:
+                self._pattern_names[positions[pattern]].append(name)
+        self._build()
+
+    def _build(self):
+        # goto[노드] = {글자: 다음 노드}, fail[노드] = 실패 시 이동할 노드, output[노드] = 여기서 끝나는 패턴 번호들
+        goto, fail, output = [{}], [0], [[]]
+        for k, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    output.append([])
+                node = nxt
+            output[node].append(k)
+
+        # 너비 우선으로 실패 링크를 잇고, 실패 링크 쪽에서 끝나는 패턴도 출력에 합칩니다.
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if node else 0
+                output[nxt] = output[nxt] + output[fail[nxt]]
+        self._goto, self._fail, self._output = goto, fail, output
+
+    def _matches(self, text):
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for k in output[node]:
+                end = i + 1
+                start = end - len(patterns[k])
+                if self.whole_word and ((start > 0 and _is_word_char(text[start - 1]))
+                                        or (end < len(text) and _is_word_char(text[end]))):
+                    continue
+                yield start, end, k
+
+    def finditer(self, text):
+        """text에서 찾은 (시작, 끝, 찾은 문자열) 들. 겹치는 이름도 모두 돌려줍니다."""
+        for start, end, k in self._matches(text):
+            yield start, end, self.patterns[k]
+
+    def names_in(self, text):
+        """text에 나오는 이름들의 집합 (처음에 넘긴 원래 이름 기준)."""
+        return {name for k in {k for _, _, k in self._matches(text)} for name in self._pattern_names[k]}
+
+    def index_rows(self, texts):
+        """
+        여러 행 텍스트를 한 번씩 훑어서 {이름: [그 이름이 나온 행 번호, ...]} 역색인을 만듭니다.
+        행 번호는 texts 안에서의 위치(0부터)이고 오름차순입니다. 한 번도 나오지 않은 이름은 키가 없습니다.
+        """
+        rows_by_pattern = {}
+        for row, text in enumerate(texts):
+            for _, _, k in self._matches(text):
+                rows = rows_by_pattern.setdefault(k, [])
+                if not rows or rows[-1] != row:
+                    rows.append(row)
+        return {name: rows for k, rows in sorted(rows_by_pattern.items()) for name in self._pattern_names[k]}
@@ -0,0 +1,61 @@
+from cue_common.name_matcher import NameMatcher
+
+# 3_personal_cue.py의 참가자별 표 만들기
+# 시트는 고정 열(FIXED_COLUMNS개) 뒤에 GROUP_WIDTH개씩 묶인 그룹(역할, 담당자 등)이 이어지는 모양입니다.
+# 참가자마다 본문 전체를 다시 훑는 대신, 본문을 한 번 훑어 참가자 → (역할이 있는 그룹, 이름이 나온 셀) 색인을 만들고
+# 고정 열/그룹 열 조각도 한 번만 잘라 둔 뒤, 참가자별 표는 그 조각들을 이어 붙여서 만듭니다.
+
+FIXED_COLUMNS = 6
+GROUP_WIDTH = 3
+
+
+def build_participant_index(body_rows, group_starts, participants):
+    """
+    본문을 한 번만 훑어서 참가자별 {'groups': 역할이 있는 그룹 번호 목록, 'cells': [(행, 그룹, 그룹 안 열), ...]}을 만듭니다.
+    그룹의 두 번째/세 번째 열에 이름이 들어 있으면 그 그룹에 역할이 있는 것으로 봅니다. (예전과 같은 부분 문자열 기준)
+    'cells'는 PDF에서 [이름]으로 표시할 셀들입니다.
+    """
+    matcher = NameMatcher(participants, whole_word=False)
+    names_by_text = {}  # 위 셀 채우기 때문에 같은 텍스트가 반복되므로 셀 텍스트별로 한 번만 찾습니다.
+    index = {name: {'groups': set(), 'cells': []} for name in participants}
+    for r, row in enumerate(body_rows):
+        for i, s in enumerate(group_starts):
+            if len(row) <= s + 2:
+                continue
+            for offset in (1, 2):
+                text = row[s + offset]
+                if text not in names_by_text:
+                    names_by_text[text] = matcher.names_in(text)
+                for name in names_by_text[text]:
+                    index[name]['groups'].add(i)
+                    index[name]['cells'].append((r, i, offset))
+    for entry in index.values():
+        entry['groups'] = sorted(entry['groups'])
+    return index
+
+
+def slice_group_columns(header_rows, body_rows, group_starts):
+    """고정 열과 그룹별 열을 미리 잘라 둡니다. 참가자별 표는 이 조각들을 이어 붙여서 만듭니다."""
+    fixed = [row[:FIXED_COLUMNS] for row in header_rows + body_rows]
+    groups = []
+    for s in group_starts:
+        header_part = [row[s:s + GROUP_WIDTH] for row in header_rows]
+        body_part = [row[s:s + GROUP_WIDTH] if len(row) > s + 2 else [""] * GROUP_WIDTH for row in body_rows]
+        groups.append(header_part + body_part)
+    return fixed, groups
+
+
+def assemble_participant_table(name, entry, fixed_columns, group_columns, num_header_rows):
+    """미리 잘라 둔 열 조각으로 참가자 한 명의 표(헤더 + 본문)를 만들고, 이름이 나온 셀을 [이름]으로 표시합니다."""
+    groups = entry['groups']
+    table = []
+    for r, fixed in enumerate(fixed_columns):
+        new_row = list(fixed)
+        for i in groups:
+            new_row += group_columns[i][r]
+        table.append(new_row)
+    position = {i: FIXED_COLUMNS + GROUP_WIDTH * k for k, i in enumerate(groups)}
+    for r, i, offset in entry['cells']:
+        row = table[num_header_rows + r]
+        row[position[i] + offset] = row[position[i] + offset].replace(name, f"[{name}]")
+    return table
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import shutil
+from threading import Lock
+
+# 개인 큐시트 PDF 렌더링 캐시.
+# 도우미 한 명의 PDF를 "그 사람 표의 내용 + 템플릿/CSS/폰트 파일 내용"의 해시(sha256)로 찾아,
+# 지난 실행 때와 입력이 같으면 write_pdf/create_pdf를 다시 부르지 않고 저장해 둔 PDF를 그대로 씁니다.
+# 캐시 폴더에는 <해시 앞 2글자>/<해시>.pdf 로 저장합니다. (같은 내용이면 같은 파일)
+DEFAULT_CACHE_DIRNAME = '.render_cache'
+
+
+def _file_digest(path):
+    """파일 내용의 sha256. 파일이 없으면 경로만으로 구분합니다. (나중에 파일이 생기면 키가 바뀜)"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    except FileNotFoundError:
+        digest.update(f"missing:{path}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+    내용 기반(content-addressed) PDF 캐시. dependencies(템플릿, CSS, 폰트 등 파일 경로)의 내용은 처음에 한 번만 해시합니다.
+    key(payload)로 키를 만들고 load_*/store_*로 꺼내거나 저장합니다. 여러 스레드에서 함께 써도 됩니다.
+    """
+
+    def __init__(self, cache_dir, dependencies=(), salt=''):
+        self.cache_dir = cache_dir
+        base = hashlib.sha256(salt.encode('utf-8'))
+        for path in sorted(dependencies):
+            base.update(_file_digest(path).encode('ascii'))
+        self._base = base.digest()
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+    def key(self, payload):
+        """payload(표 내용 등 JSON으로 바꿀 수 있는 값)와 의존 파일들로 캐시 키를 만듭니다."""
+        digest = hashlib.sha256(self._base)
+        digest.update(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        return digest.hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.pdf")
+
+    def _count(self, hit):
+        with self._lock:
+            if hit: self.hits += 1
+            else: self.misses += 1
+
+    def load_bytes(self, key):
+        """캐시에 있으면 PDF 바이트, 없으면 None. (적중/미적중을 셉니다)"""
+        try:
+            with open(self.path_for(key), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._count(False)
+            return None
+        self._count(True)
+        return data
+
+    def load_to(self, key, pdf_path):
+        """캐시에 있으면 pdf_path로 복사하고 True, 없으면 False. (적중/미적중을 셉니다)"""
+        try:
+            shutil.copyfile(self.path_for(key), pdf_path)
+        except FileNotFoundError:
+            self._count(False)
+            return False
+        self._count(True)
+        return True
+
+    def store_bytes(self, key, data):
+        """PDF 바이트를 캐시에 저장합니다. 임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 깨진 PDF가 남지 않습니다."""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{id(data)}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def store_file(self, key, pdf_path):
+        """렌더링된 PDF 파일을 캐시에 저장합니다."""
+        with open(pdf_path, 'rb') as f:
+            self.store_bytes(key, f.read())
+
+    def summary(self):
+        total = self.hits + self.misses
+        return f"♻️ 렌더 캐시: {total}개 중 {self.hits}개 재사용, {self.misses}개 새로 렌더링"
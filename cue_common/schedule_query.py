@@ -0,0 +1,287 @@
+import copy
+import re
+from collections import defaultdict
+
+from cue_common.availability import AvailabilityMatrix
+from cue_common.columnar_snapshot import read_sheet_rows
+from cue_common.conflicts import find_overlap_clusters
+from cue_common.interval_index import IntervalIndex, build_day_index, intervals_by_day
+from cue_common.name_index import NameIndex, suggest_names
+from cue_common.timeofday import parse_minutes
+
+# 2_schedule_check.py의 데이터 읽기와 검색 로직.
+# 대화형 CLI, 일괄(batch) 모드, 상시 실행 서버가 같은 함수를 씁니다. (출력/print는 호출하는 쪽에서)
+#  - ScheduleData.load(): 배정 일정 CSV + 도우미 명단 CSV를 한 번 읽고 색인(요일별 구간 색인, 가용 행렬)을 만듭니다.
+#  - parse_query() / run_query(): '이름', '요일 시간', '요일 시작 종료', '4'(전체 일정), '중복' 검색
+
+DAY_ORDER = ['수요일', '목요일', '금요일', '토요일', '일요일']
+DAY_SHORT_MAP = {'수': '수요일', '목': '목요일', '금': '금요일', '토': '토요일', '일': '일요일'}
+
+QUERY_PERSON = 'person'
+QUERY_AVAILABLE = 'available'
+QUERY_EXPORT = 'export'
+QUERY_OVERLAPS = 'overlaps'
+
+
+def day_sort_key(day):
+    """DAY_ORDER 순서, 없는 요일은 뒤쪽(99)"""
+    return DAY_ORDER.index(day) if day in DAY_ORDER else 99
+
+
+def parse_time(time_str: str):
+    """'7:30', '오후 21:00', 'PM 5:30' 등 다양한 시간 형식의 문자열을 하루 중 분(int)으로 변환합니다."""
+    return parse_minutes(time_str)
+
+
+def parse_helpers(helper_str: str):
+    """'김준민, 박주영(리더)' 와 같은 도우미 이름 문자열을 개별 이름 리스트로 분리하고 정제합니다."""
+    if not helper_str or helper_str.strip() in ['-', '미정']:
+        return []
+    names = helper_str.split(',')
+    cleaned_names = []
+    for name in names:
+        name_no_paren = re.sub(r'\(.*\)', '', name).strip()
+        if name_no_paren:
+            cleaned_names.append(name_no_paren)
+    return cleaned_names
+
+
+# --- 읽기 ---
+
+def read_helpers_roster(file_path: str):
+    """
+    '도우미 명단' CSV 파일에서 전체 운영위원/도우미 명단, 팀, 참여 가능 요일을 읽어옵니다.
+    반환값: {'이름': {'team': '팀이름', 'days': ['요일1', '요일2']}, ...} 형태의 딕셔너리
+    """
+    all_helpers_data = defaultdict(lambda: {'team': '미지정', 'days': []})
+
+    # 가져오기 때 저장된 Feather 스냅샷이 CSV보다 최신이면 스냅샷을 읽습니다.
+    rows = read_sheet_rows(file_path)
+
+    teams = rows[1]
+    names = rows[2]
+    availability_rows = rows[3:8]
+
+    for i, name in enumerate(names):
+        name = name.strip()
+        if not name or i == 0:
+            continue
+
+        team_name = teams[i].strip() if i < len(teams) else "미지정"
+        all_helpers_data[name]['team'] = team_name
+
+        for row in availability_rows:
+            day_short = row[0].strip()
+            day_full = DAY_SHORT_MAP.get(day_short)
+            if day_full and len(row) > i and row[i] == '1':
+                all_helpers_data[name]['days'].append(day_full)
+
+    return all_helpers_data
+
+
+def read_assigned_schedules(schedule_path: str):
+    """배정 일정 CSV → {이름: [(요일, 시작분, 종료분, '시작-종료 일정'), ...]}"""
+    assigned_schedules = defaultdict(list)
+    rows = read_sheet_rows(schedule_path)
+    header = rows[0]
+
+    for row in rows[1:]:
+        if len(row) < len(header) or not row[0].strip():
+            continue
+        day, start_str, end_str, event, helpers_str = row[0], row[1], row[2], row[4], row[11]
+        start_time, end_time = parse_time(start_str), parse_time(end_str)
+
+        cleaned_helpers = parse_helpers(helpers_str)
+        if start_time is not None and end_time is not None and cleaned_helpers:
+            info = (day.strip(), start_time, end_time, f"{start_str.strip()}-{end_str.strip()} {event.strip().replace(chr(10), ' ')}")
+            for helper in cleaned_helpers:
+                assigned_schedules[helper].append(info)
+
+    for schedules in assigned_schedules.values():
+        schedules.sort(key=lambda x: (x[0], x[1])) # 요일과 시작 시간으로 정렬 (개인 일정 출력 순서)
+    return assigned_schedules
+
+
+# --- 검색 ---
+
+def find_available_helpers(target_day, start_search_time, end_search_time, all_helpers, day_index, availability=None):
+    """
+    ❗ [기능 추가] 특정 요일과 '시간 간격'에 투입 가능한 인원을 찾습니다.
+    (기존의 특정 시점 검색은 이 함수를 활용하여 처리)
+    day_index: build_day_index()로 만든 요일별 배정 구간 색인
+    availability: AvailabilityMatrix가 주어지고 배정/검색 시간이 모두 시간대 경계에 맞으면 행렬에서 한 번에 조회합니다.
+    """
+    if (availability is not None and availability.is_exact(target_day) and start_search_time < end_search_time
+            and availability.is_aligned(start_search_time) and availability.is_aligned(end_search_time)):
+        return availability.free_names(target_day, start_search_time, end_search_time)
+
+    # 1. 해당 요일에 참여 가능한 인원 필터링
+    available_on_day = {name for name, data in all_helpers.items() if target_day in data['days']}
+
+    # 2. 해당 시간 간격과 겹치는 일정이 있는 인원(배정 불가 인원) 찾기
+    # 겹치는 조건: 내 일정 시작시간 < 검색 종료시간 AND 검색 시작시간 < 내 일정 종료시간
+    # (요일별 색인에서 겹칠 수 있는 구간만 확인합니다)
+    index = day_index.get(target_day)
+    unavailable_helpers = index.busy_names(start_search_time, end_search_time) if index else set()
+
+    # 3. 참여 가능 인원에서 배정 불가 인원을 제외하여 최종 목록 생성
+    final_available_list = sorted(list(available_on_day - unavailable_helpers))
+    return final_available_list
+
+
+def find_overlaps(assigned_schedules):
+    """
+    시간이 겹치게 배정된 일정 묶음(사슬로 이어진 겹침 포함)을 요일별로 모읍니다.
+    반환값: {요일: [{'helper': 이름, 'schedules': [설명, ...]}, ...]} (요일은 DAY_ORDER 순)
+    """
+    all_overlaps = defaultdict(list)
+    rows = [(helper, day, start, end, info)
+            for helper, schedules in assigned_schedules.items()
+            for day, start, end, info in schedules]
+    clusters = find_overlap_clusters([r[0] for r in rows], [r[1] for r in rows],
+                                     [r[2] for r in rows], [r[3] for r in rows])
+    for cluster in clusters:
+        helper, day_of_conflict = rows[cluster[0]][0], rows[cluster[0]][1]
+        all_overlaps[day_of_conflict].append({
+            'helper': helper,
+            'schedules': [rows[i][4] for i in cluster]
+        })
+    return {day: all_overlaps[day] for day in sorted(all_overlaps, key=day_sort_key)}
+
+
+class ScheduleData:
+    """배정 일정과 도우미 명단을 한 번 읽고 만든 검색용 색인 묶음."""
+
+    def __init__(self, assigned_schedules, all_helpers):
+        self.assigned_schedules = assigned_schedules
+        self.all_helpers = all_helpers
+        self.day_index = build_day_index(assigned_schedules)
+        helper_days = sorted({day for data in all_helpers.values() for day in data['days']})
+        self.availability = AvailabilityMatrix.from_schedules(all_helpers, assigned_schedules, helper_days)
+        self.name_index = NameIndex(set(all_helpers) | set(assigned_schedules))
+
+    def with_schedules(self, assigned_schedules):
+        """
+        배정 일정만 바뀌었을 때: 배정 구간이 달라진 요일만 구간 색인과 가용 행렬을 다시 만든 새 ScheduleData와
+        다시 만든 요일 목록을 반환합니다. self는 그대로 두므로 새 데이터를 만드는 동안에도 계속 조회할 수 있습니다.
+        """
+        old_by_day = intervals_by_day(self.assigned_schedules)
+        new_by_day = intervals_by_day(assigned_schedules)
+        changed_days = sorted((day for day in set(old_by_day) | set(new_by_day)
+                               if sorted(old_by_day.get(day, [])) != sorted(new_by_day.get(day, []))),
+                              key=day_sort_key)
+        data = copy.copy(self)  # 명단, 바뀌지 않은 요일의 색인, (이름이 그대로면) 이름 색인은 함께 씁니다.
+        data.assigned_schedules = assigned_schedules
+        data.day_index = dict(self.day_index)
+        data.availability = self.availability.copy()
+        for day in changed_days:
+            if day in new_by_day:
+                data.day_index[day] = IntervalIndex(new_by_day[day])
+            else:
+                data.day_index.pop(day, None)
+            data.availability.clear_day(day)
+            for start, end, name in new_by_day.get(day, []):
+                data.availability.mark_busy(name, day, start, end)
+        names = set(self.all_helpers) | set(assigned_schedules)
+        if names != set(self.all_helpers) | set(self.assigned_schedules):
+            data.name_index = NameIndex(names)
+        return data, changed_days
+
+    @classmethod
+    def load(cls, schedule_path, helpers_list_path):
+        """두 CSV를 읽어 ScheduleData를 만듭니다. 파일이 없거나 형식이 잘못되면 예외가 그대로 올라갑니다."""
+        return cls(read_assigned_schedules(schedule_path), read_helpers_roster(helpers_list_path))
+
+    def schedules_by_day(self, name, day_order=False):
+        """이름 → {요일: [설명, ...]} (day_order=True면 DAY_ORDER 순, 아니면 요일 이름 순)"""
+        grouped = defaultdict(list)
+        for day, _, _, info in self.assigned_schedules.get(name, []):
+            grouped[day].append(info)
+        days = sorted(grouped, key=day_sort_key) if day_order else sorted(grouped)
+        return {day: grouped[day] for day in days}
+
+    def search_person(self, name):
+        """
+        특정 인원 일정 검색. status: 'assigned' | 'unassigned'(명단에만 있음) | 'unknown'
+        'unknown'이면 suggestions에 비슷한 이름(오타, 띄어쓰기 차이, 앞부분만 입력)을 담아 돌려줍니다.
+        """
+        if name in self.assigned_schedules:
+            return {'status': 'assigned', 'schedules': self.schedules_by_day(name)}
+        if name in self.all_helpers:
+            return {'status': 'unassigned', 'schedules': {}}
+        return {'status': 'unknown', 'schedules': {}, 'suggestions': suggest_names(self.name_index, name)}
+
+    def search_available(self, day_text, start_text, end_text=None):
+        """
+        특정 시점(end_text 없음) 또는 시간 간격에 투입 가능한 인원을 팀별로 묶어 돌려줍니다.
+        시간 형식이 잘못되었거나 시작이 종료보다 늦으면 ValueError.
+        """
+        target_day = day_text if day_text.endswith("요일") else day_text + "요일"
+
+        start_search_time = parse_time(start_text)
+        # 특정 시점 검색일 경우, 종료시간을 시작시간과 동일하게 설정하여 처리
+        end_search_time = parse_time(end_text) if end_text is not None else start_search_time
+
+        if start_search_time is None or end_search_time is None:
+            raise ValueError("시간 형식이 올바르지 않습니다.")
+        if start_search_time > end_search_time:
+            raise ValueError("시작 시간이 종료 시간보다 늦을 수 없습니다.")
+
+        available_list = find_available_helpers(target_day, start_search_time, end_search_time,
+                                                self.all_helpers, self.day_index, self.availability)
+        grouped_by_team = defaultdict(list)
+        for name in available_list:
+            grouped_by_team[self.all_helpers[name]['team']].append(name)
+        return {
+            'day': target_day,
+            'time_range': start_text if end_text is None else f"{start_text} ~ {end_text}",
+            'count': len(available_list),
+            'teams': dict(sorted(grouped_by_team.items())),
+        }
+
+    def export_schedules(self):
+        """전체 인원별 일정: [(이름, {요일: [설명, ...]} 또는 None(배정 없음)), ...] (이름 순)"""
+        return [(name, self.schedules_by_day(name, day_order=True) if name in self.assigned_schedules else None)
+                for name in sorted(self.all_helpers.keys())]
+
+
+# --- 검색어 ---
+
+def parse_query(text):
+    """
+    검색어 한 줄 → (종류, 인자). 대화형 검색창과 같은 형식입니다.
+      '4' → 전체 일정, '중복' → 중복 배정, '이름' → 개인 일정,
+      '요일 시간' / '요일 시작시간 종료시간' → 투입 가능 인원
+    형식이 맞지 않으면 ValueError.
+    """
+    text = text.strip()
+    parts = text.split()
+    if text == '4':
+        return QUERY_EXPORT, ()
+    if text == '중복':
+        return QUERY_OVERLAPS, ()
+    if len(parts) == 1:
+        return QUERY_PERSON, (parts[0],)
+    if len(parts) in (2, 3):
+        return QUERY_AVAILABLE, tuple(parts)
+    raise ValueError("입력 형식이 올바르지 않습니다.")
+
+
+def run_query(data, text):
+    """검색어 한 줄을 실행해 JSON으로 바꿀 수 있는 dict를 돌려줍니다. 잘못된 검색어는 ok=False와 오류 메시지."""
+    result = {'query': text}
+    try:
+        kind, args = parse_query(text)
+        result['type'] = kind
+        if kind == QUERY_PERSON:
+            result.update(name=args[0], **data.search_person(args[0]))
+        elif kind == QUERY_AVAILABLE:
+            result.update(data.search_available(*args))
+        elif kind == QUERY_EXPORT:
+            result['helpers'] = [{'name': name, 'schedules': schedules or {}} for name, schedules in data.export_schedules()]
+        else:
+            result['overlaps'] = find_overlaps(data.assigned_schedules)
+        result['ok'] = True
+    except ValueError as e:
+        result.update(ok=False, error=str(e))
+    return result
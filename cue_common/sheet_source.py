@@ -0,0 +1,196 @@
+import json
+import os
+
+try:
+    from gspread.exceptions import WorksheetNotFound
+except ImportError:  # replay 모드는 gspread 없이도 동작해야 합니다.
+    class WorksheetNotFound(Exception):
+        """요청한 워크시트가 기록(스냅샷)에 없을 때 발생합니다."""
+
+# 시트 데이터 소스 모드
+#   live   : 지금처럼 gspread/Drive에 직접 접속합니다. (기본값)
+#   record : live와 같이 동작하면서 받아온 get_all_values() 결과를 로컬 저장소에 기록합니다.
+#   replay : 네트워크/인증 없이 기록된 데이터를 gspread와 같은 방식(worksheet(), get_all_values() 등)으로 돌려줍니다.
+# 환경 변수로 지정합니다: CUE_SHEET_SOURCE=replay python 1_import_all_sheets.py
+MODE_LIVE = 'live'
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+SOURCE_MODES = (MODE_LIVE, MODE_RECORD, MODE_REPLAY)
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SNAPSHOT_DIR = os.path.join(REPO_DIR, 'sheet_snapshots')
+
+
+def get_source_mode():
+    """환경 변수 CUE_SHEET_SOURCE에서 데이터 소스 모드를 읽습니다."""
+    mode = os.environ.get('CUE_SHEET_SOURCE', MODE_LIVE).strip().lower()
+    if mode not in SOURCE_MODES:
+        raise ValueError(f"❌ 알 수 없는 CUE_SHEET_SOURCE 값: '{mode}' (가능한 값: {', '.join(SOURCE_MODES)})")
+    return mode
+
+
+def get_snapshot_dir():
+    """기록 저장소 폴더 (환경 변수 CUE_SHEET_SNAPSHOT_DIR로 변경 가능)."""
+    return os.environ.get('CUE_SHEET_SNAPSHOT_DIR', DEFAULT_SNAPSHOT_DIR)
+
+
+def is_offline():
+    """replay 모드이면 True. (Drive 업로드 등 네트워크 작업을 건너뛸 때 사용)"""
+    return get_source_mode() == MODE_REPLAY
+
+
+def is_recording():
+    """record 모드이면 True. (기록이 빠짐없이 남도록 가져오기 manifest의 건너뛰기를 끌 때 사용)"""
+    return get_source_mode() == MODE_RECORD
+
+
+def _sheet_name_from_range(range_name):
+    """"'8.13(수)'!A1:Z" 같은 A1 범위 문자열에서 시트 이름만 꺼냅니다."""
+    name = range_name.rsplit('!', 1)[0] if '!' in range_name else range_name
+    if len(name) >= 2 and name[0] == name[-1] == "'":
+        name = name[1:-1].replace("''", "'")
+    return name
+
+
+def _pad_rows(rows):
+    """gspread의 get_all_values()처럼 모든 행을 가장 긴 행의 길이에 맞춥니다."""
+    width = max((len(row) for row in rows), default=0)
+    return [list(row) + [''] * (width - len(row)) for row in rows]
+
+
+class SnapshotStore:
+    """스프레드시트 하나의 기록을 '<저장소>/<스프레드시트 ID>/' 아래 JSON 파일로 보관합니다."""
+
+    def __init__(self, snapshot_dir, spreadsheet_id):
+        self.spreadsheet_dir = os.path.join(snapshot_dir, spreadsheet_id)
+
+    def _sheet_path(self, sheet_name):
+        safe_name = sheet_name.replace('/', '_').replace('\\', '_')
+        return os.path.join(self.spreadsheet_dir, f"{safe_name}.json")
+
+    def _write_json(self, path, payload):
+        os.makedirs(self.spreadsheet_dir, exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def save_metadata(self, title, modified_time):
+        self._write_json(os.path.join(self.spreadsheet_dir, '_spreadsheet.json'),
+                         {'title': title, 'modified_time': modified_time})
+
+    def load_metadata(self):
+        path = os.path.join(self.spreadsheet_dir, '_spreadsheet.json')
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"❌ 기록된 스프레드시트가 없습니다: '{self.spreadsheet_dir}' (먼저 record 모드로 실행하세요)")
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_values(self, sheet_name, values):
+        self._write_json(self._sheet_path(sheet_name), {'sheet_name': sheet_name, 'values': values})
+
+    def load_values(self, sheet_name):
+        path = self._sheet_path(sheet_name)
+        if not os.path.exists(path):
+            raise WorksheetNotFound(sheet_name)
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)['values']
+
+
+# --- record 모드: 실제 gspread 객체를 감싸서 받아온 값을 기록합니다 ---
+
+class RecordingWorksheet:
+    def __init__(self, worksheet, store):
+        self._worksheet = worksheet
+        self._store = store
+
+    def __getattr__(self, name):
+        return getattr(self._worksheet, name)
+
+    def get_all_values(self, *args, **kwargs):
+        values = self._worksheet.get_all_values(*args, **kwargs)
+        self._store.save_values(self._worksheet.title, values)
+        return values
+
+
+def drive_modified_time(spreadsheet):
+    """gspread Spreadsheet의 Drive 수정 시각. 가져올 수 없으면 None."""
+    try:
+        if hasattr(spreadsheet, 'get_lastUpdateTime'):  # gspread 6.x
+            return spreadsheet.get_lastUpdateTime()
+        return spreadsheet.lastUpdateTime  # gspread 5.x
+    except Exception:
+        return None
+
+
+class RecordingSpreadsheet:
+    def __init__(self, spreadsheet, store):
+        self._spreadsheet = spreadsheet
+        self._store = store
+        # 실제 수정 시각을 기록해 둡니다. (replay 때 get_lastUpdateTime()이 None을 돌려주지 않도록)
+        self._modified_time = drive_modified_time(spreadsheet)
+        self._store.save_metadata(spreadsheet.title, self._modified_time)
+
+    def __getattr__(self, name):
+        return getattr(self._spreadsheet, name)
+
+    def worksheet(self, title):
+        return RecordingWorksheet(self._spreadsheet.worksheet(title), self._store)
+
+    def values_batch_get(self, ranges, *args, **kwargs):
+        response = self._spreadsheet.values_batch_get(ranges, *args, **kwargs)
+        for range_name, value_range in zip(ranges, response.get('valueRanges', [])):
+            self._store.save_values(_sheet_name_from_range(range_name), value_range.get('values', []))
+        return response
+
+    def get_lastUpdateTime(self):
+        return self._modified_time
+
+
+# --- replay 모드: 기록된 값을 gspread와 같은 호출 방식으로 돌려줍니다 ---
+
+class ReplayWorksheet:
+    def __init__(self, title, store):
+        self.title = title
+        self._store = store
+        self._values = store.load_values(title)  # 없는 시트이면 여기서 WorksheetNotFound
+
+    def get_all_values(self, *args, **kwargs):
+        return _pad_rows(self._values)
+
+
+class ReplaySpreadsheet:
+    def __init__(self, spreadsheet_id, store):
+        self.id = spreadsheet_id
+        self._store = store
+        metadata = store.load_metadata()
+        self.title = metadata['title']
+        self._modified_time = metadata.get('modified_time')
+
+    def worksheet(self, title):
+        return ReplayWorksheet(title, self._store)
+
+    def values_batch_get(self, ranges, *args, **kwargs):
+        value_ranges = []
+        for range_name in ranges:
+            values = self._store.load_values(_sheet_name_from_range(range_name))
+            value_ranges.append({'range': range_name, 'values': values})
+        return {'spreadsheetId': self.id, 'valueRanges': value_ranges}
+
+    def get_lastUpdateTime(self):
+        return self._modified_time
+
+
+def open_spreadsheet(spreadsheet_id, client_factory, mode=None, snapshot_dir=None):
+    """
+    설정된 모드에 맞는 스프레드시트 객체를 반환합니다.
+    client_factory는 gspread 클라이언트를 만드는 함수로, replay 모드에서는 호출되지 않습니다. (인증 불필요)
+    """
+    mode = mode or get_source_mode()
+    store = SnapshotStore(snapshot_dir or get_snapshot_dir(), spreadsheet_id)
+    if mode == MODE_REPLAY:
+        return ReplaySpreadsheet(spreadsheet_id, store)
+    spreadsheet = client_factory().open_by_key(spreadsheet_id)
+    if mode == MODE_RECORD:
+        return RecordingSpreadsheet(spreadsheet, store)
+    return spreadsheet
@@ -0,0 +1,48 @@
+import re
+from functools import lru_cache
+
+# 시트에 나오는 시간 문자열을 '하루 중 분(minute-of-day)' 정수 하나로 통일합니다.
+#  - '7:30'      → 450
+#  - '오후 21:00' → 1260  (24시간 표기에 오전/오후가 붙어 있어도 그대로 21:00)
+#  - 'PM 5:30'   → 1050
+#  - 'PM 12:15'  → 735   (정오 12:15), 'AM 12:15' → 15 (자정 0:15)
+# 모든 스크립트는 이 정수로 비교/정렬합니다. 같은 문자열은 캐시에서 바로 돌려줍니다.
+
+MINUTES_PER_DAY = 24 * 60
+PARSE_CACHE_SIZE = 4096
+
+_TIME_PATTERN = re.compile(r'(?:(AM|PM|오전|오후)\s*)?(\d{1,2}):(\d{2})', re.IGNORECASE)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_minutes_cached(text):
+    match = _TIME_PATTERN.search(text)
+    if not match:
+        return None
+    meridiem, hour, minute = match.group(1), int(match.group(2)), int(match.group(3))
+    if meridiem and meridiem.upper() in ('PM', '오후') and hour < 12:
+        hour += 12
+    elif meridiem and meridiem.upper() in ('AM', '오전') and hour == 12:
+        hour = 0
+    if hour >= 24 or minute >= 60:
+        return None
+    return hour * 60 + minute
+
+
+def parse_minutes(value):
+    """시간 문자열을 하루 중 분(int)으로 바꿉니다. 비어 있거나 시간 형식이 아니면 None."""
+    if not isinstance(value, str):
+        return None
+    return _parse_minutes_cached(value.strip())
+
+
+def format_hhmm(minutes):
+    """분 → '17:30'"""
+    hour, minute = divmod(int(minutes) % MINUTES_PER_DAY, 60)
+    return f"{hour:02d}:{minute:02d}"
+
+
+def format_ampm(minutes):
+    """분 → 'PM 5:30' (큐시트의 시간 표기)"""
+    hour, minute = divmod(int(minutes) % MINUTES_PER_DAY, 60)
+    return f"{'AM' if hour < 12 else 'PM'} {(hour % 12) or 12}:{minute:02d}"
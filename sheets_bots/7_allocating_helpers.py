@@ -1,18 +1,22 @@
 import pandas as pd
 import os
 import re
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.columnar_snapshot import read_sheet_frame
+from cue_common.name_index import NameIndex, ask_name, install_readline_completer
+from cue_common.timeofday import format_hhmm, parse_minutes
+
 # --- 설정 ---
 HELPERS_FILE = '/Users/heeeonlee/2025KYSA/QueueSheets/initial_csv_files/2025 KYSA 운영위원 통합 큐시트_도우미 명단.csv'
 FINAL_SCHEDULE_DIR = '/Users/heeeonlee/2025KYSA/QueueSheets/final_schedule_files'
 # ----------------
 
-def to_datetime(time_str):
-    try:
-        return datetime.strptime(time_str.strip(), '%p %I:%M')
-    except (ValueError, TypeError):
-        return None
+def to_minutes(time_str):
+    """시간 문자열(예: 'AM 9:00')을 하루 중 분(int)으로 변환합니다. 읽을 수 없으면 None."""
+    return parse_minutes(time_str)
 
 def parse_helpers_needed(text):
     try:
@@ -23,7 +27,7 @@ def parse_helpers_needed(text):
 def run_assignment_tool():
     # 1. 도우미 명단 로드
     try:
-        df_raw = pd.read_csv(HELPERS_FILE, header=None)
+        df_raw = read_sheet_frame(HELPERS_FILE)
         df_transposed = df_raw.T
         df_transposed.columns = df_transposed.iloc[0]
         helpers_df = df_transposed.iloc[1:].drop(df_transposed.columns[0], axis=1).reset_index(drop=True)
@@ -119,6 +123,9 @@ def run_assignment_tool():
     final_available_df = day_available_df[~day_available_df['이름'].isin(excluded_crew_members)]
     available_helpers_list = final_available_df['이름'].tolist()
     full_helpers_list = helpers_df['이름'].tolist()
+    # 이름 검색용 색인 (오타/앞부분만 입력해도 후보를 보여주고, Tab 키로 이름 자동 완성)
+    name_index = NameIndex(full_helpers_list)
+    install_readline_completer(name_index)
     
     try:
         df = pd.read_csv(schedule_file_path)
@@ -127,7 +134,7 @@ def run_assignment_tool():
         return
 
     df['배정된 도우미'] = ''
-    df_sorted = df.sort_values(by='시작시간', key=lambda x: pd.to_datetime(x, format='%p %I:%M')).reset_index(drop=True)
+    df_sorted = df.sort_values(by='시작시간', key=lambda x: x.map(to_minutes)).reset_index(drop=True)
     helper_schedules = {name: [] for name in full_helpers_list}
     
     # 5. 일반 배정 루프
@@ -173,7 +180,7 @@ def run_assignment_tool():
             while True:
                 search_choice = input("\n무엇을 검색하시겠습니까? (1: 도우미 이름, 2: 일정 번호, q: 취소) >> ").strip()
                 if search_choice == '1':
-                    search_name = input("검색할 도우미 이름을 입력하세요 >> ").strip()
+                    search_name = ask_name(name_index, input("검색할 도우미 이름을 입력하세요 >> "))
                     found_tasks = []
                     if search_name in excluded_crew_members:
                          found_tasks.append(f"  - ({selected_day_column} 하루 종일) 시설조 활동")
@@ -287,14 +294,14 @@ def run_assignment_tool():
 
         elif not user_input: print("입력값이 없습니다."); continue
 
-        task_start_dt, task_end_dt = to_datetime(task['시작시간']), to_datetime(task['종료시간'])
+        task_start_dt, task_end_dt = to_minutes(task['시작시간']), to_minutes(task['종료시간'])
 
         if user_input.startswith('-'):
             name_to_remove = user_input[1:].strip()
             if name_to_remove in current_helpers_list:
                 current_helpers_list.remove(name_to_remove)
                 df_sorted.at[i, '배정된 도우미'] = ', '.join(current_helpers_list)
-                if name_to_remove in helper_schedules and task_start_dt:
+                if name_to_remove in helper_schedules and task_start_dt is not None:
                     for item in helper_schedules[name_to_remove]:
                         if item[0] == task_start_dt and item[1] == task_end_dt:
                             helper_schedules[name_to_remove].remove(item); break
@@ -319,9 +326,9 @@ def run_assignment_tool():
             
             is_conflicted = False
             for start, end in helper_schedules.get(name, []):
-                if task_start_dt and end and task_end_dt > start and task_start_dt < end:
+                if task_start_dt is not None and end is not None and task_end_dt > start and task_start_dt < end:
                     is_conflicted = True
-                    conflicted_names.append(f"{name}({start.strftime('%H:%M')}~{end.strftime('%H:%M')})")
+                    conflicted_names.append(f"{name}({format_hhmm(start)}~{format_hhmm(end)})")
                     break
             if not is_conflicted: valid_names.append(name)
 
@@ -329,7 +336,7 @@ def run_assignment_tool():
         for name in valid_names:
             if name not in current_helpers_list:
                 current_helpers_list.append(name)
-                if task_start_dt: helper_schedules[name].append((task_start_dt, task_end_dt))
+                if task_start_dt is not None: helper_schedules[name].append((task_start_dt, task_end_dt))
                 newly_assigned.append(name)
 
         df_sorted.at[i, '배정된 도우미'] = ', '.join(current_helpers_list)
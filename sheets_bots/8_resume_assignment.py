@@ -1,20 +1,24 @@
 import pandas as pd
 import os
 import re
-from datetime import datetime, time, timedelta
+import sys
+from datetime import datetime
 import glob
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.availability import AvailabilityMatrix
+from cue_common.columnar_snapshot import read_sheet_frame
+from cue_common.name_index import NameIndex, ask_name, install_readline_completer
+from cue_common.timeofday import format_ampm, parse_minutes
+
 # --- 설정 ---
 # HELPERS_FILE 경로를 실제 환경에 맞게 수정해주세요.
 HELPERS_FILE = '/Users/heeeonlee/2025KYSA/QueueSheets/initial_csv_files/2025 KYSA 운영위원 통합 큐시트_도우미 명단.csv'
 # ----------------
 
-def to_datetime(time_str):
-    """시간 문자열(예: 'AM 9:00')을 datetime 객체로 변환합니다."""
-    try:
-        return datetime.strptime(str(time_str).strip(), '%p %I:%M')
-    except (ValueError, TypeError):
-        return None
+def to_minutes(time_str):
+    """시간 문자열(예: 'AM 9:00')을 하루 중 분(int)으로 변환합니다. 읽을 수 없으면 None."""
+    return parse_minutes(time_str)
 
 def parse_helpers_needed(text):
     """필요 도우미 수 텍스트를 파싱하여 숫자로 반환합니다."""
@@ -52,7 +56,7 @@ def run_resume_tool():
     except IndexError:
         print("❌ 파일 이름 형식이 잘못되어 요일을 추출할 수 없습니다. (예: assignment_목_...)"); return
 
-    df_raw = pd.read_csv(HELPERS_FILE, header=None)
+    df_raw = read_sheet_frame(HELPERS_FILE)
     df_transposed = df_raw.T
     df_transposed.columns = df_transposed.iloc[0]
     helpers_df = df_transposed.iloc[1:].drop(df_transposed.columns[0], axis=1).reset_index(drop=True)
@@ -81,14 +85,18 @@ def run_resume_tool():
     print("\n저장된 배정 현황을 바탕으로 스케줄을 구성합니다...")
     helper_schedules = {} 
     for _, task in df_sorted.iterrows():
-        start_dt, end_dt = to_datetime(task['시작시간']), to_datetime(task['종료시간'])
-        if start_dt and end_dt:
+        start_dt, end_dt = to_minutes(task['시작시간']), to_minutes(task['종료시간'])
+        if start_dt is not None and end_dt is not None:
             helpers_in_task = [h.strip() for h in str(task['배정된 도우미']).split(',') if h.strip()]
             for helper_name in helpers_in_task:
                 if helper_name not in helper_schedules:
                     helper_schedules[helper_name] = []
                 helper_schedules[helper_name].append((start_dt, end_dt))
 
+    # 이름 검색용 색인 (오타/앞부분만 입력해도 후보를 보여주고, Tab 키로 이름 자동 완성)
+    name_index = NameIndex(helpers_df['이름'].dropna())
+    install_readline_completer(name_index)
+
     # 배정 시작 위치 탐색
     start_index = 0
     for idx, row in df_sorted.iterrows():
@@ -145,12 +153,12 @@ def run_resume_tool():
             while True:
                 search_choice = input("\n무엇을 검색하시겠습니까? (1: 도우미 이름, 2: 일정 번호, 3: 전체 스케줄, 4: 시간대별 미배정 인원, q: 취소) >> ").strip()
                 if search_choice == '1':
-                    search_name = input("검색할 도우미 이름을 입력하세요 >> ").strip()
+                    search_name = ask_name(name_index, input("검색할 도우미 이름을 입력하세요 >> "))
                     if search_name in helper_schedules:
                         print(f"\n--- 🔍 '{search_name}' 님 검색 결과 ---")
                         for start_dt, end_dt in sorted(helper_schedules[search_name]):
                             for _, row in df_sorted.iterrows():
-                                if to_datetime(row['시작시간']) == start_dt and to_datetime(row['종료시간']) == end_dt:
+                                if to_minutes(row['시작시간']) == start_dt and to_minutes(row['종료시간']) == end_dt:
                                     print(f"  - ({row['시작시간']}~{row['종료시간']}) {row['일정'].strip().replace(chr(10), ' ')}")
                                     break
                     else:
@@ -196,7 +204,7 @@ def run_resume_tool():
                             sorted_schedule = sorted(helper_schedules[helper_name])
                             for start_dt, end_dt in sorted_schedule:
                                 for _, row in df_sorted.iterrows():
-                                    if to_datetime(row['시작시간']) == start_dt and to_datetime(row['종료시간']) == end_dt:
+                                    if to_minutes(row['시작시간']) == start_dt and to_minutes(row['종료시간']) == end_dt:
                                         if helper_name in [h.strip() for h in str(row['배정된 도우미']).split(',')]:
                                             task_str = f"({row['시작시간']}~{row['종료시간']}) {row['일정'].strip().replace(chr(10), ' ')}"
                                             print(f"  - {task_str}")
@@ -220,22 +228,20 @@ def run_resume_tool():
                 
                 elif search_choice == '4':
                     print("\n--- 🕒 시간대별 미배정 인원 검색 ---")
-                    time_slots = pd.date_range("06:00", "23:45", freq="15min").to_pydatetime()
-                    
+                    time_slots = range(6 * 60, 23 * 60 + 45 + 1, 15)
+
+                    # 1분 단위 가용 행렬: 시간대 시작 시각에 진행 중인 일정(start <= 시각 < end)이 있으면 배정된 것으로 봅니다.
+                    availability = AvailabilityMatrix(sorted(final_available_helpers), [selected_day_column], slot_minutes=1)
+                    for helper_name in final_available_helpers:
+                        availability.set_present(helper_name, selected_day_column)
+                    for helper_name, schedules in helper_schedules.items():
+                        for start_dt, end_dt in schedules:
+                            availability.mark_busy(helper_name, selected_day_column, start_dt, end_dt)
+                    free_matrix = availability.free_by_slot(selected_day_column)[:, list(time_slots)]
+
                     free_helpers_by_slot = {}
-                    for slot in time_slots:
-                        slot_time = slot.time()
-                        
-                        busy_helpers = set()
-                        for helper_name, schedules in helper_schedules.items():
-                            for start_dt, end_dt in schedules:
-                                if start_dt.time() <= slot_time < end_dt.time():
-                                    busy_helpers.add(helper_name)
-                                    break
-                        
-                        free_helpers = final_available_helpers - busy_helpers
-                        
-                        free_helpers_tuple = tuple(sorted(list(free_helpers)))
+                    for col, slot in enumerate(time_slots):
+                        free_helpers_tuple = tuple(availability.names[h] for h in free_matrix[:, col].nonzero()[0])
                         if free_helpers_tuple:
                             if free_helpers_tuple not in free_helpers_by_slot:
                                 free_helpers_by_slot[free_helpers_tuple] = []
@@ -253,7 +259,7 @@ def run_resume_tool():
                             start_chunk = slots[0]
                             
                             for i in range(1, len(slots)):
-                                if (slots[i] - slots[i-1]).total_seconds() > 900:
+                                if slots[i] - slots[i-1] > 15:
                                     merged_slots.append((start_chunk, slots[i-1], helpers))
                                     start_chunk = slots[i]
                             
@@ -262,8 +268,8 @@ def run_resume_tool():
                         merged_slots.sort(key=lambda x: x[0])
 
                         for start_chunk, end_chunk, helpers in merged_slots:
-                            end_time_display = end_chunk + timedelta(minutes=15)
-                            print(f"\n[ {start_chunk.strftime('%p %I:%M')} ~ {end_time_display.strftime('%p %I:%M')} ]")
+                            end_time_display = end_chunk + 15
+                            print(f"\n[ {format_ampm(start_chunk)} ~ {format_ampm(end_time_display)} ]")
                             print(f"  - 미배정 ({len(helpers)}명): {', '.join(helpers)}")
 
                     print("\n---------------------------------")
@@ -319,14 +325,14 @@ def run_resume_tool():
 
         elif not user_input: print("입력값이 없습니다."); continue
 
-        task_start_dt, task_end_dt = to_datetime(task['시작시간']), to_datetime(task['종료시간'])
+        task_start_dt, task_end_dt = to_minutes(task['시작시간']), to_minutes(task['종료시간'])
 
         if user_input.startswith('-'):
             name_to_remove = user_input[1:].strip()
             if name_to_remove in current_helpers_list:
                 current_helpers_list.remove(name_to_remove)
                 df_sorted.at[i, '배정된 도우미'] = ', '.join(sorted(current_helpers_list))
-                if name_to_remove in helper_schedules and task_start_dt:
+                if name_to_remove in helper_schedules and task_start_dt is not None:
                     schedules = helper_schedules[name_to_remove]
                     if (task_start_dt, task_end_dt) in schedules:
                         schedules.remove((task_start_dt, task_end_dt))
@@ -349,9 +355,9 @@ def run_resume_tool():
 
             is_conflicted = False
             for start, end in helper_schedules.get(name, []):
-                if task_start_dt and end and task_end_dt > start and task_start_dt < end:
+                if task_start_dt is not None and end is not None and task_end_dt > start and task_start_dt < end:
                     is_conflicted = True
-                    conflicted_names.append(f"{name}({start.strftime('%p %I:%M')}~{end.strftime('%p %I:%M')})")
+                    conflicted_names.append(f"{name}({format_ampm(start)}~{format_ampm(end)})")
                     break
             if not is_conflicted:
                 valid_names.append(name)
@@ -365,7 +371,7 @@ def run_resume_tool():
             current_helpers_list.extend(newly_assigned)
             df_sorted.at[i, '배정된 도우미'] = ', '.join(sorted(current_helpers_list))
             for name in newly_assigned:
-                if task_start_dt and task_end_dt:
+                if task_start_dt is not None and task_end_dt is not None:
                     if name not in helper_schedules:
                         helper_schedules[name] = []
                     helper_schedules[name].append((task_start_dt, task_end_dt))
@@ -0,0 +1,190 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.fill import forward_fill_frame
+from cue_common.timeofday import MINUTES_PER_DAY, parse_minutes
+
+# 3_tidy → 4_linearlize → 6_event_time_tidy(구간 압축) 각 단계의 처리 로직.
+# 번호 붙은 스크립트들은 CSV를 읽고 써서 이 함수들을 호출하고,
+# run_cue_pipeline.py는 CSV 왕복 없이 DataFrame을 그대로 다음 단계로 넘깁니다.
+
+
+# --- 3단계: 큐시트 정리 (병합 셀 채우기) ---
+def tidy_cue_sheet(df_raw):
+    """원본 큐시트(머리글 없이 읽은 DataFrame)의 3번째 행을 열 이름으로 쓰고, 병합으로 비어 있는 셀을 채웁니다."""
+    df_new = df_raw.copy()
+    df_new.columns = df_new.iloc[2]
+    df_new.columns = df_new.columns.str.strip()
+
+    df_new = df_new.iloc[3:].reset_index(drop=True)
+
+    # 병합 셀 채우기는 cue_common/fill.py의 규칙(공백만 있는 셀도 빈칸으로 봄)을 따릅니다.
+    # 열 이름이 겹칠 수 있으므로('일정'이 여러 개) 위치로 고릅니다.
+    columns = list(df_new.columns)
+    schedule_positions = [i for i, col in enumerate(columns) if "일정" in str(col)]
+    df_new = forward_fill_frame(df_new, sorted(set(range(min(2, len(columns)))) | set(schedule_positions)))
+
+    target_detail_cols = [
+        "일정","장소", "세부 내용", "재료", "담당자\n(프로그램 팀원 명)",
+        "필요 도우미 수", "도우미 역할\n(최대한 구체적으로)", "배정된 도우미 이름"
+    ]
+    target_detail_cols = [col.strip() for col in target_detail_cols]
+
+    existing_target_detail_cols = [col for col in target_detail_cols if col in df_new.columns]
+
+    if existing_target_detail_cols and schedule_positions:
+        schedule_values = df_new.iloc[:, schedule_positions]
+        is_schedule_row_empty_or_dash = (schedule_values.isnull() | (schedule_values == '-')).all(axis=1)
+
+        target_positions = [i for i, col in enumerate(columns) if col in existing_target_detail_cols]
+        df_new = forward_fill_frame(df_new, target_positions)
+        for col in existing_target_detail_cols:
+            if col not in df_new.columns[:2]:
+                df_new.loc[is_schedule_row_empty_or_dash, col] = '-'
+
+    return df_new.fillna('-')
+
+
+def as_linearize_input(tidy_df):
+    """
+    3단계 결과를 4단계가 CSV로 읽었을 때와 같은 모양으로 바꿉니다.
+    (중복 열 이름 → '일정.1', 빈 열 이름 → 'Unnamed: i', 첫 열(시간)을 인덱스로)
+    """
+    seen = {}
+    names = []
+    for i, name in enumerate(tidy_df.columns):
+        name = f"Unnamed: {i}" if pd.isna(name) or str(name) == '' else str(name)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    df = tidy_df.copy()
+    df.columns = names
+    return df.set_index(names[0])
+
+
+# --- 4단계: 블록별 일정 → 한 줄짜리 작업 목록 ---
+LINEAR_COLUMNS = ['시간', '일정', '장소', '세부 내용', '담당자', '필요 도우미 수', '배정된 도우미']
+
+
+def _find_block_columns(columns, suffix):
+    """블록 하나(suffix: '', '.1', '.2', ...)의 열 이름들을 찾습니다. 없는 열은 None."""
+    def optional(name):
+        return name if name in columns else None
+
+    manager_col = optional(f'담당자\n(프로그램 팀원 명){suffix}') or optional(f'담당자 \n(프로그램 팀원 명){suffix}')
+    return {
+        '일정': f'일정{suffix}',
+        '장소': optional(f'장소{suffix}'),
+        '세부 내용': optional(f'세부 내용{suffix}'),
+        '담당자': manager_col,
+        '필요 도우미 수': optional(f'필요 도우미 수{suffix}'),
+        '배정된 도우미': optional(f'배정된 도우미 이름{suffix}'),
+    }
+
+
+def linearize_cue_sheet(df):
+    """
+    '일정{suffix}' 블록들을 세로로 쌓아 도우미가 필요한 시간대만 (시간, 일정, 장소, ...) 행으로 펼칩니다.
+    행마다 반복하지 않고 블록 단위로 열 전체를 한 번에 걸러 붙입니다. (블록 순서 → 시간 순서 유지)
+    """
+    num_blocks = 0
+    for col in df.columns:
+        if '일정' in col and '시설' not in col:
+             num_blocks += 1
+
+    times = df.index.to_numpy()
+    blocks = []
+    for i in range(num_blocks):
+        block_cols = _find_block_columns(df.columns, f'.{i}' if i > 0 else '')
+        helpers_needed_col = block_cols['필요 도우미 수']
+        if not helpers_needed_col:
+            continue
+
+        helpers_needed = df[helpers_needed_col]
+        helpers_needed_str = helpers_needed.astype(str).str.strip()
+        mask = (helpers_needed.notna() & ~helpers_needed_str.isin(['-', '0', '0.0'])).to_numpy()
+        if not mask.any():
+            continue
+
+        block = {'시간': times[mask]}
+        for out_col in ['일정', '장소', '세부 내용', '담당자']:
+            src_col = block_cols[out_col]
+            if src_col is None:
+                block[out_col] = ['-'] * int(mask.sum())
+            else:
+                block[out_col] = df[src_col].to_numpy(dtype=object)[mask]
+        block['필요 도우미 수'] = helpers_needed_str.to_numpy(dtype=object)[mask]
+        assigned_col = block_cols['배정된 도우미']
+        block['배정된 도우미'] = (df[assigned_col].to_numpy(dtype=object)[mask] if assigned_col
+                               else ['-'] * int(mask.sum()))
+        blocks.append(pd.DataFrame(block, columns=LINEAR_COLUMNS))
+
+    if not blocks:
+        return pd.DataFrame()
+    tasks = pd.concat(blocks, ignore_index=True)
+    # 빈 값은 '-'로 표시합니다. ('필요 도우미 수'는 이미 걸러져 빈 값이 없습니다)
+    for col in ['일정', '장소', '세부 내용', '담당자', '배정된 도우미']:
+        tasks[col] = tasks[col].where(tasks[col].notna(), '-')
+    return tasks
+
+
+# --- 6단계: 15분 단위 작업 → 시작/종료 시간이 있는 일정 (구간 압축) ---
+# (예전 5_eliminating + 6_event_time_tidy 두 단계를 한 번에 처리합니다. 5단계 중간 파일은 더 이상 만들지 않습니다)
+COMPACT_KEY = ['일정', '장소', '필요 도우미 수']
+SLOT_MINUTES = 15
+EVENT_COLUMNS = ['시작시간', '종료시간', '일정', '장소', '세부 내용', '담당자', '필요 도우미 수', '배정된 도우미']
+
+
+def _time_to_minutes(times):
+    """'AM 6:00', 'PM 5:30' 같은 시간 문자열 Series를 하루 중 분(float, 읽을 수 없으면 NaN)으로 바꿉니다."""
+    return pd.to_numeric(times.map(parse_minutes), errors='coerce').astype(float)
+
+
+def _format_end_time(minutes):
+    """분 → 예전 6단계(add_15_minutes)와 같은 종료시간 표기 ('PM  05:45')."""
+    minutes = int(minutes) % MINUTES_PER_DAY
+    hour, minute = divmod(minutes, 60)
+    meridiem = 'AM' if hour < 12 else 'PM'
+    return f"{meridiem}  {(hour % 12) or 12:02d}:{minute:02d}"
+
+
+def compact_intervals(df, key=None, slot_minutes=SLOT_MINUTES):
+    """
+    4단계 결과(시간대별 작업 행)에서 key가 같고 시간대가 끊기지 않고 이어지는 행들을 하나의 일정으로 묶어
+    시작시간/종료시간(마지막 시간대 + slot_minutes) 행으로 만들고 시작시간 순으로 정렬합니다.
+    시간을 정수 시간대 번호로 바꿔 열 단위 비교 한 번으로 구간 경계를 찾습니다.
+    """
+    if df.empty:
+        return pd.DataFrame()
+    key = key or COMPACT_KEY
+    df = df.reset_index(drop=True)
+
+    minutes = _time_to_minutes(df['시간'])
+    slots = (minutes // slot_minutes).to_numpy()
+    # 구간 경계: key 값이 바뀌었거나, 시간대가 같은 칸/바로 다음 칸이 아닌 곳 (빈 시간대, 다음 블록, 읽을 수 없는 시간)
+    # 같은 시간대의 하위 행(병합된 시간 셀)은 예전처럼 하나의 일정으로 합칩니다.
+    starts = (df[key] != df[key].shift()).any(axis=1).to_numpy().copy()
+    step = slots[1:] - slots[:-1]
+    starts[1:] |= ~((step == 0) | (step == 1))
+    starts[0] = True
+
+    first_rows = np.flatnonzero(starts)
+    last_rows = np.append(first_rows[1:] - 1, len(df) - 1)
+    end_minutes = (slots[last_rows] + 1) * slot_minutes
+
+    events = df.iloc[first_rows].reset_index(drop=True)
+    end_times = [_format_end_time(m) if m == m else last
+                 for m, last in zip(end_minutes, df['시간'].to_numpy()[last_rows])]
+    events.insert(0, '시작시간', events.pop('시간'))
+    events.insert(1, '종료시간', end_times)
+    events = events[[col for col in EVENT_COLUMNS if col in events.columns]]
+
+    order = np.argsort(minutes.to_numpy()[first_rows], kind='stable')
+    return events.iloc[order].reset_index(drop=True)
@@ -0,0 +1,160 @@
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cue_common.columnar_snapshot import read_sheet_frame
+from cue_stages import (
+    as_linearize_input,
+    compact_intervals,
+    linearize_cue_sheet,
+    tidy_cue_sheet,
+)
+
+# 3_tidy → 4_linearlize → 6_event_time_tidy(구간 압축) 를 한 프로세스 안에서 실행합니다.
+# 단계 사이에는 CSV 대신 DataFrame을 그대로 넘기고, 중간 결과 CSV는 요청할 때만 저장합니다.
+# 사용법: python run_cue_pipeline.py <입력_파일_경로> <출력_파일_경로> [--keep-intermediate <폴더>]
+#         python run_cue_pipeline.py --all <입력_폴더> <출력_폴더> [--workers N]
+#           → 입력 폴더의 모든 요일 큐시트(예: ..._8.13수.csv)를 프로세스 풀에서 동시에 처리합니다.
+
+STAGE_NAMES = ['3_tidy', '4_linearlize', '6_event_time_tidy']
+# 요일 큐시트 파일 이름 패턴: '2025 KYSA 운영위원 통합 큐시트_8.13수.csv'
+DAY_FILE_PATTERN = re.compile(r'_(\d{1,2})\.(\d{1,2})[월화수목금토일]\.csv$')
+OUTPUT_SUFFIX = '_event_schedule'
+
+
+def _save_intermediate(df, intermediate_dir, base_name, suffix, index=False):
+    os.makedirs(intermediate_dir, exist_ok=True)
+    path = os.path.join(intermediate_dir, f"{base_name}{suffix}.csv")
+    df.to_csv(path, index=index, encoding='utf-8-sig')
+    return path
+
+
+def run_pipeline(input_path, output_path, intermediate_dir=None, log=print):
+    """
+    원본 큐시트 CSV 하나를 모든 단계로 처리하여 output_path에 저장하고, 단계별 소요 시간(초)을 반환합니다.
+    intermediate_dir가 주어지면 단계별 중간 결과 CSV도 그 폴더에 저장합니다.
+    """
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    timings = {}
+
+    started = time.perf_counter()
+    df = tidy_cue_sheet(read_sheet_frame(input_path))
+    timings['3_tidy'] = time.perf_counter() - started
+    if intermediate_dir:
+        _save_intermediate(df, intermediate_dir, base_name, '_tidy')
+
+    started = time.perf_counter()
+    df = linearize_cue_sheet(as_linearize_input(df))
+    timings['4_linearlize'] = time.perf_counter() - started
+    if intermediate_dir:
+        _save_intermediate(df, intermediate_dir, base_name, '_linear')
+
+    started = time.perf_counter()
+    df = compact_intervals(df)
+    timings['6_event_time_tidy'] = time.perf_counter() - started
+
+    output_directory = os.path.dirname(output_path)
+    if output_directory:
+        os.makedirs(output_directory, exist_ok=True)
+    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+    log(f"✅ '{os.path.basename(input_path)}' → '{output_path}' ({len(df)}개 일정)")
+    for stage_name in STAGE_NAMES:
+        log(f"    - {stage_name:<20} {timings[stage_name] * 1000:8.1f} ms")
+    log(f"    - {'합계':<20} {sum(timings.values()) * 1000:8.1f} ms")
+    return timings
+
+
+def find_day_files(input_directory):
+    """입력 폴더에서 요일 큐시트 CSV들을 날짜 순으로 찾습니다."""
+    day_files = []
+    for path in glob.glob(os.path.join(input_directory, '*.csv')):
+        match = DAY_FILE_PATTERN.search(os.path.basename(path))
+        if match:
+            day_files.append(((int(match.group(1)), int(match.group(2))), path))
+    return [path for _, path in sorted(day_files)]
+
+
+def _run_day_job(job):
+    """프로세스 풀에서 요일 하나를 처리합니다. 로그는 모아서 돌려주고, 출력은 부모 프로세스가 요일 순서대로 합칩니다."""
+    input_path, output_path, intermediate_dir = job
+    log_lines = []
+    try:
+        timings = run_pipeline(input_path, output_path, intermediate_dir=intermediate_dir, log=log_lines.append)
+        return input_path, True, log_lines, timings
+    except Exception as e:
+        log_lines.append(f"❌ '{os.path.basename(input_path)}' 처리 중 오류가 발생했습니다: {e}")
+        return input_path, False, log_lines, {}
+
+
+def _merge_day_logs(results, log):
+    failed = []
+    for input_path, ok, log_lines, _ in results:
+        for line in log_lines:
+            log(line)
+        if not ok:
+            failed.append(input_path)
+    return failed
+
+
+def run_all_days(input_directory, output_directory, workers=None, intermediate_dir=None, log=print):
+    """입력 폴더의 모든 요일 큐시트를 workers개 프로세스로 동시에 처리합니다. 실패한 파일 목록을 반환합니다."""
+    day_files = find_day_files(input_directory)
+    if not day_files:
+        log(f"❌ '{input_directory}' 폴더에서 요일 큐시트 파일(예: ..._8.13수.csv)을 찾을 수 없습니다.")
+        return []
+
+    jobs = []
+    for input_path in day_files:
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        jobs.append((input_path, os.path.join(output_directory, f"{base_name}{OUTPUT_SUFFIX}.csv"), intermediate_dir))
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    log(f"🗓️ 요일 큐시트 {len(jobs)}개를 {workers}개 프로세스로 처리합니다.")
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = map(_run_day_job, jobs)
+        failed = _merge_day_logs(results, log)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map()은 제출한 순서대로 결과를 돌려주므로, 로그도 요일 순서대로 출력됩니다.
+            failed = _merge_day_logs(executor.map(_run_day_job, jobs), log)
+    elapsed = time.perf_counter() - started
+
+    log(f"\n📊 전체 {len(jobs)}개 중 {len(jobs) - len(failed)}개 완료, {len(failed)}개 실패 (총 {elapsed:.2f}초)")
+    for input_path in failed:
+        log(f"    - 실패: {os.path.basename(input_path)}")
+    return failed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="큐시트 정리 단계들을 한 프로세스에서 실행합니다.")
+    parser.add_argument('input_path', help="원본 큐시트 CSV 경로 (--all이면 입력 폴더)")
+    parser.add_argument('output_path', help="최종 일정(event_schedule) CSV 경로 (--all이면 출력 폴더)")
+    parser.add_argument('--keep-intermediate', metavar='폴더', default=None,
+                        help="단계별 중간 결과 CSV를 저장할 폴더 (지정하지 않으면 저장하지 않음)")
+    parser.add_argument('--all', action='store_true',
+                        help="입력 폴더의 모든 요일 큐시트를 동시에 처리합니다.")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="--all 에서 사용할 프로세스 수 (기본값: CPU 코어 수)")
+    args = parser.parse_args()
+
+    if args.all:
+        failed = run_all_days(args.input_path, args.output_path, workers=args.workers,
+                              intermediate_dir=args.keep_intermediate)
+        sys.exit(1 if failed else 0)
+
+    try:
+        run_pipeline(args.input_path, args.output_path, intermediate_dir=args.keep_intermediate)
+    except FileNotFoundError:
+        print(f"❌ 오류: 입력 파일 '{args.input_path}'을(를) 찾을 수 없습니다.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"데이터 처리 중 오류가 발생했습니다: {e}")
+        sys.exit(1)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# 테스트에서 cue_common와 sheets_bots의 모듈을 바로 import할 수 있도록 경로를 추가합니다.
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (REPO_DIR, os.path.join(REPO_DIR, 'sheets_bots')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,101 @@
+import random
+
+from cue_common.availability import AvailabilityMatrix
+
+DAYS = ['금요일', '토요일']
+
+
+def _matrix():
+    helpers = {
+        '가': {'team': '기획팀', 'days': ['금요일', '토요일']},
+        '나': {'team': '시설팀', 'days': ['토요일']},
+        '다': {'team': '기획팀', 'days': ['토요일']},
+    }
+    assigned = {
+        '가': [('토요일', 600, 660, '접수')],
+        '다': [('토요일', 650, 720, '안내'), ('금요일', 600, 700, '명단에 없는 요일')],
+        '라': [('토요일', 600, 700, '명단에 없는 사람')],
+    }
+    return AvailabilityMatrix.from_schedules(helpers, assigned, DAYS)
+
+
+def test_free_names_uses_presence_and_assignments():
+    matrix = _matrix()
+
+    assert matrix.free_names('토요일', 540, 600) == ['가', '나', '다']
+    assert matrix.free_names('토요일', 600, 650) == ['나', '다']
+    assert matrix.free_names('토요일', 655, 665) == ['나']
+    assert matrix.free_names('금요일', 600, 700) == ['가']
+    assert matrix.free_names('일요일', 600, 700) == []
+    assert matrix.exact
+
+
+def test_team_counts():
+    matrix = _matrix()
+
+    assert matrix.team_counts(matrix.free_mask('토요일', 540, 600)) == {'기획팀': 2, '시설팀': 1}
+    assert matrix.team_counts(matrix.free_mask('토요일', 655, 665)) == {'시설팀': 1}
+
+
+def test_unaligned_times_block_whole_slot():
+    matrix = AvailabilityMatrix(['가'], ['토요일'], slot_minutes=15)
+    matrix.set_present('가', '토요일')
+    matrix.mark_busy('가', '토요일', 785, 790)  # 13:05~13:10 → 13:00~13:15 시간대 전체
+
+    assert not matrix.exact and not matrix.is_exact('토요일')
+    assert matrix.slot_range(785, 790) == (52, 53)
+    assert matrix.free_names('토요일', 780, 785) == []
+    assert matrix.free_names('토요일', 765, 780) == ['가']
+    assert matrix.free_names('토요일', 795, 810) == ['가']
+
+
+def test_free_mask_matches_minute_comparison_when_aligned():
+    rng = random.Random(3)
+    names = [f"사람{i}" for i in range(30)]
+    matrix = AvailabilityMatrix(names, ['토요일'])
+    assigned = {name: [] for name in names}
+    for name in names:
+        matrix.set_present(name, '토요일')
+        for _ in range(rng.randrange(4)):
+            start = rng.randrange(8 * 60, 20 * 60, 5)
+            end = start + rng.choice([15, 30, 60])
+            assigned[name].append((start, end))
+            matrix.mark_busy(name, '토요일', start, end)
+
+    for _ in range(100):
+        start = rng.randrange(8 * 60, 20 * 60, 5)
+        end = start + rng.choice([5, 30, 90])
+        expected = [name for name in names if all(not (s < end and start < e) for s, e in assigned[name])]
+        assert matrix.free_names('토요일', start, end) == expected
+
+
+def test_free_by_slot():
+    matrix = _matrix()
+    free = matrix.free_by_slot('토요일')
+
+    assert free.shape == (3, matrix.num_slots)
+    assert not free[0, 600 // 5] and free[1, 600 // 5]
+    assert matrix.slot_start(120) == 600
+
+
+def test_clear_day_and_copy():
+    matrix = _matrix()
+    matrix.mark_busy('나', '토요일', 601, 602)
+    copied = matrix.copy()
+
+    matrix.clear_day('토요일')
+    assert matrix.free_by_slot('토요일').all()
+    assert matrix.is_exact('토요일')
+    assert matrix.free_names('토요일', 0, 1440) == ['가', '나', '다']
+    assert copied.free_names('토요일', 600, 605) == ['다']
+    assert not copied.is_exact('토요일')
+
+
+def test_exactness_is_tracked_per_day():
+    matrix = AvailabilityMatrix(['가', '나'], ['토요일', '일요일'], slot_minutes=15)
+    matrix.mark_busy('가', '토요일', 600, 660)
+    matrix.mark_busy('나', '일요일', 605, 660)
+
+    assert matrix.is_exact('토요일') and not matrix.is_exact('일요일')
+    assert not matrix.exact
+    assert not matrix.is_exact('월요일')
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+import build
+
+
+def test_sources_follow_imports_into_cue_common():
+    sources = build.python_sources('Personal_cue_sheets/main_script.py')
+    assert 'Personal_cue_sheets/main_script.py' in sources
+    assert 'cue_common/columnar_snapshot.py' in sources
+    assert all(not path.startswith('..') for path in sources)  # 설치된 패키지(pandas 등)는 넣지 않음
+
+
+def test_sources_follow_script_folder_imports():
+    sources = build.python_sources('sheets_bots/run_cue_pipeline.py')
+    assert 'sheets_bots/cue_stages.py' in sources
+    assert 'cue_common/columnar_snapshot.py' in sources
+
+
+def test_personal_nodes_track_template_css_and_font():
+    node = next(node for node in build.build_graph() if node.name.startswith('personal_pdfs:'))
+    for path in ('template.html', 'style.css', os.path.join('fonts', 'NanumGothicLight.ttf')):
+        assert os.path.join(build.PERSONAL_DIR, path) in node.inputs
+
+
+def test_actions_do_not_grow_sys_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(build.sys, 'path', list(build.sys.path))
+    input_path = next(node for node in build.build_graph() if node.name.startswith('schedule:')).inputs[0]
+    build.action_day_schedule(input_path, str(tmp_path / 'first.csv'))
+    length = len(build.sys.path)
+    build.action_day_schedule(input_path, str(tmp_path / 'second.csv'))
+    assert len(build.sys.path) == length
+
+
+def test_select_nodes_keeps_targets_and_their_deps():
+    nodes = build.build_graph(render_workers=2, use_render_cache=False)
+    day = next(node for node in nodes if node.name.startswith('schedule:'))
+    selected = build.select_nodes(nodes, [day.name])
+
+    assert [node.name for node in selected] == [node.name for node in nodes if node.name in {day.name, *day.deps}]
+    assert build.select_nodes(nodes, []) == nodes
+    personal = next(node for node in nodes if node.name.startswith('personal_pdfs:'))
+    assert personal.args[3:] == (2, False)
+
+
+def test_select_nodes_rejects_unknown_names():
+    with pytest.raises(ValueError, match='nope'):
+        build.select_nodes(build.build_graph(), ['nope'])
+
+
+def test_default_render_workers_split_cores_between_personal_nodes(monkeypatch):
+    monkeypatch.setattr(build.os, 'cpu_count', lambda: 8)
+
+    assert build.default_render_workers() == 2        # 요일 4개 노드가 동시에 실행
+    assert build.default_render_workers(jobs=1) == 8  # 한 번에 노드 하나
+    assert build.default_render_workers(jobs=3) == 2
+    monkeypatch.setattr(build.os, 'cpu_count', lambda: 2)
+    assert build.default_render_workers() == 1
+    assert build.build_graph()[-1].args[3] == 1
@@ -0,0 +1,167 @@
+import os
+from html.parser import HTMLParser
+
+import pandas as pd
+import pytest
+
+from cue_common.chunked_render import (DEFAULT_CHUNK_ROWS, ChunkedStory, MemoryTracker, RenderMemoryError,
+                                       chunk_template, iter_chunks, replace_when_done, rss_cap_bytes)
+
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'Personal_cue_sheets', 'template.html')
+
+
+class _PageContent(HTMLParser):
+    """<body>의 내용을 표 머리글, 표 본문 행, 표 밖의 글자로 나눠 모읍니다."""
+
+    def __init__(self, html):
+        super().__init__()
+        self.header, self.rows, self.text, self.tags = [], [], [], []
+        self._in_body = False
+        self._section = None
+        self._row = None
+        self.feed(html)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'body':
+            self._in_body = True
+        if self._in_body:
+            self.tags.append(tag)
+        if tag in ('thead', 'tbody'):
+            self._section = tag
+        elif tag == 'tr':
+            self._row = []
+
+    def handle_endtag(self, tag):
+        if tag in ('thead', 'tbody'):
+            self._section = None
+        elif tag == 'tr':
+            (self.header if self._section == 'thead' else self.rows).append(tuple(self._row))
+            self._row = None
+
+    def handle_data(self, data):
+        if not self._in_body:
+            return
+        if self._row is not None:
+            self._row.append(data.strip())
+        elif data.strip():
+            self.text.append(data.strip())
+
+
+def _render(template, html_table):
+    return template.replace('{{HELPER_NAME}}', '이희언').replace('{{SELECTED_DAY}}', '금요일').replace('{{SCHEDULE_TABLE}}', html_table)
+
+
+def _to_html(df):
+    return df.to_html(index=False, na_rep='', escape=False).replace('<th>', '<th style="text-align: center;">')
+
+
+def test_iter_chunks_splits_lists_and_frames():
+    assert list(iter_chunks(list(range(5)), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(iter_chunks([], 2)) == []
+
+    df = pd.DataFrame({'행': range(85)})
+    chunks = list(iter_chunks(df, 40))
+    assert [len(chunk) for chunk in chunks] == [40, 40, 5]
+    assert pd.concat(chunks).equals(df)
+
+
+def test_chunk_template_keeps_title_in_first_and_footer_in_last_chunk():
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        template = f.read()
+
+    assert chunk_template(template) == template
+    middle = chunk_template(template, first=False, last=False)
+    assert '<h1>' not in middle and '<footer>' not in middle
+    assert '{{SCHEDULE_TABLE}}' in middle and '<title>' in middle
+    assert '<h1>' in chunk_template(template, first=True, last=False)
+    assert '<footer>' in chunk_template(template, first=False, last=True)
+
+
+def test_chunks_of_200_row_sheet_match_single_render():
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        template = f.read()
+    df = pd.DataFrame({
+        '시작시간': [f"{8 + i // 12}:{i % 12 * 5:02d}" for i in range(200)],
+        '일정': [f"일정 {i}" for i in range(200)],
+        '장소': ['대강당' if i % 3 else '' for i in range(200)],
+    })
+
+    single = _PageContent(_render(template, _to_html(df)))
+    tables = [_to_html(chunk) for chunk in iter_chunks(df, DEFAULT_CHUNK_ROWS)]
+    chunks = [_PageContent(_render(chunk_template(template, i == 0, i == len(tables) - 1), table))
+              for i, table in enumerate(tables)]
+
+    assert len(chunks) == 5
+    assert [row for chunk in chunks for row in chunk.rows] == single.rows
+    assert len(single.rows) == 200
+    assert [text for chunk in chunks for text in chunk.text] == single.text
+    assert all(chunk.header == single.header for chunk in chunks)  # 표 머리글은 페이지마다 반복되는 것과 같음
+    assert [chunk.tags.count('h1') for chunk in chunks] == [1, 0, 0, 0, 0]
+    assert [chunk.tags.count('footer') for chunk in chunks] == [0, 0, 0, 0, 1]
+    assert DEFAULT_CHUNK_ROWS % 2 == 0  # tbody tr:nth-child(even) 줄무늬가 조각 경계에서도 이어짐
+
+
+def test_chunked_story_fills_one_chunk_at_a_time():
+    seen = []
+    story = ChunkedStory(iter_chunks(list(range(5)), 2), on_chunk=lambda: seen.append(len(seen)))
+    drawn = []
+    while len(story):
+        drawn.append(story.pop(0))
+        assert list.__len__(story) <= 2
+
+    assert drawn == [0, 1, 2, 3, 4]
+    assert seen == [0, 1, 2]
+
+
+def test_memory_tracker_raises_over_cap():
+    tracker = MemoryTracker()
+    tracker.check()
+    if tracker.peak_bytes is None:
+        pytest.skip("이 OS에서는 최대 RSS를 잴 수 없습니다.")
+
+    with pytest.raises(RenderMemoryError):
+        with MemoryTracker(rss_cap_bytes(1)) as memory:
+            memory.check()
+    assert rss_cap_bytes(0) is None
+
+
+def test_memory_tracker_final_check_does_not_count_a_chunk():
+    tracker = MemoryTracker()
+    tracker.check()
+    if tracker.peak_bytes is None:
+        pytest.skip("이 OS에서는 최대 RSS를 잴 수 없습니다.")
+
+    with pytest.raises(RenderMemoryError, match='PDF 저장'):
+        with MemoryTracker(rss_cap_bytes(1)) as memory:
+            memory.check(after_write=True)
+    assert memory.chunks == 0
+
+
+def test_replace_when_done_moves_finished_file_into_place(tmp_path):
+    pdf_path = tmp_path / 'out.pdf'
+
+    with replace_when_done(str(pdf_path)) as tmp:
+        assert tmp != str(pdf_path)
+        with open(tmp, 'wb') as f:
+            f.write(b'%PDF-1')
+        assert not pdf_path.exists()
+
+    assert pdf_path.read_bytes() == b'%PDF-1'
+    assert os.listdir(tmp_path) == ['out.pdf']
+
+
+def test_tiny_cap_leaves_no_pdf_behind(tmp_path):
+    tracker = MemoryTracker()
+    tracker.check()
+    if tracker.peak_bytes is None:
+        pytest.skip("이 OS에서는 최대 RSS를 잴 수 없습니다.")
+
+    # write_pdf_chunks와 같은 순서: 임시 파일에 다 쓴 뒤 마지막 확인에서 상한을 넘음
+    with pytest.raises(RenderMemoryError):
+        with MemoryTracker(rss_cap_bytes(1)) as memory, replace_when_done(str(tmp_path / 'out.pdf')) as tmp:
+            with open(tmp, 'wb') as f:
+                f.write(b'%PDF-1')
+            memory.check(after_write=True)
+
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,101 @@
+import csv
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from cue_common import columnar_snapshot
+from cue_common.columnar_snapshot import (ROW_LENGTH_COLUMN, is_snapshot_fresh, read_sheet_frame, read_sheet_rows,
+                                          read_typed_snapshot, snapshot_path_for, write_snapshot)
+
+# batchGet 값처럼 끝의 빈칸이 잘린 행과, 첫 행보다 칸이 많은 행(메모)이 섞인 명단
+ROSTER_ROWS = [
+    ['', '팀', '기획팀', '기획팀', '시설팀'],
+    ['', '이름', '김철수', '이민수', '박영희'],
+    ['금', '1', '', '1', '1'],
+    ['토', '1', '1'],
+    ['메모', '', '', '', '', '늦게 옴'],
+    ['일', '', '1', '1', '1'],
+]
+CUE_ROWS = [
+    ['시간', '일정', '일정', ''],
+    ['AM 9:00', '접수', '', '-'],
+    ['AM 9:15', '접수', '안내', '-'],
+    ['PM 1:00', '점심', '점심', ''],
+    ['PM 1:15', '점심', '', '-'],
+]
+
+
+def _import(tmp_path, rows, name='sheet.csv'):
+    """1_import_all_sheets.write_rows_to_csv와 같이 CSV를 쓰고 그 뒤에 스냅샷을 씁니다."""
+    csv_path = str(tmp_path / name)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(rows)
+    assert write_snapshot(csv_path, rows)
+    return csv_path
+
+
+def _read_csv(csv_path, **kwargs):
+    return pd.read_csv(csv_path, dtype=str, keep_default_na=False, na_values=[''], **kwargs)
+
+
+def test_snapshot_round_trip_keeps_rows_and_adds_typed_columns(tmp_path):
+    cue_path = _import(tmp_path, CUE_ROWS, 'cue.csv')
+    roster_path = _import(tmp_path, ROSTER_ROWS, 'roster.csv')
+
+    assert is_snapshot_fresh(cue_path) and is_snapshot_fresh(roster_path)
+    assert read_sheet_rows(cue_path) == CUE_ROWS
+    assert read_sheet_rows(roster_path) == ROSTER_ROWS
+    assert read_typed_snapshot(cue_path)['c0_min'].tolist()[1:] == [540, 555, 780, 795]
+    typed = read_typed_snapshot(roster_path)
+    assert isinstance(typed['c1'].dtype, pd.CategoricalDtype)
+    assert typed[ROW_LENGTH_COLUMN].tolist() == [5, 5, 5, 3, 6, 5]
+
+
+def test_stale_snapshot_falls_back_to_csv(tmp_path):
+    csv_path = _import(tmp_path, CUE_ROWS)
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(CUE_ROWS[:2])
+    snapshot_mtime = os.path.getmtime(snapshot_path_for(csv_path))
+    os.utime(csv_path, (snapshot_mtime + 10, snapshot_mtime + 10))
+
+    assert not is_snapshot_fresh(csv_path)
+    assert read_typed_snapshot(csv_path) is None
+    assert read_sheet_rows(csv_path) == CUE_ROWS[:2]
+    assert len(read_sheet_frame(csv_path)) == 2
+
+
+@pytest.mark.parametrize('header', [None, 0])
+def test_snapshot_frame_matches_csv(tmp_path, header):
+    csv_path = _import(tmp_path, CUE_ROWS)
+
+    from_snapshot = read_sheet_frame(csv_path, header=header)
+    from_csv = _read_csv(csv_path, header=header)
+    pd.testing.assert_frame_equal(from_snapshot, from_csv, check_dtype=False, check_column_type=False)
+    if header == 0:
+        assert list(from_snapshot.columns) == ['시간', '일정', '일정.1', 'Unnamed: 3']
+
+
+def test_skip_bad_lines_matches_csv(tmp_path):
+    csv_path = _import(tmp_path, ROSTER_ROWS)
+
+    from_snapshot = read_sheet_frame(csv_path, on_bad_lines='skip')
+    from_csv = _read_csv(csv_path, header=None, on_bad_lines='skip')
+    pd.testing.assert_frame_equal(from_snapshot, from_csv, check_dtype=False, check_column_type=False)
+    assert from_snapshot[0].tolist()[2:] == ['금', '토', '일']
+    with pytest.raises(pd.errors.ParserError):
+        _read_csv(csv_path, header=None)
+
+
+def test_snapshot_without_row_lengths_reads_csv_for_skip(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / 'roster.csv')
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(ROSTER_ROWS)
+    build_typed_frame = columnar_snapshot._build_typed_frame
+    monkeypatch.setattr(columnar_snapshot, '_build_typed_frame',
+                        lambda rows: build_typed_frame(rows).drop(columns=[ROW_LENGTH_COLUMN]))
+    write_snapshot(csv_path, ROSTER_ROWS)
+
+    assert len(read_sheet_frame(csv_path, on_bad_lines='skip')) == 5
@@ -0,0 +1,70 @@
+import random
+
+from cue_common.conflicts import find_overlap_clusters
+
+
+def _clusters(rows):
+    helpers, days, starts, ends = zip(*rows) if rows else ((), (), (), ())
+    return [list(cluster) for cluster in find_overlap_clusters(list(helpers), list(days), list(starts), list(ends))]
+
+
+def _brute_force(rows):
+    """같은 (도우미, 요일)에서 겹침으로 이어진 행들을 합쳐 2행 이상인 묶음을 찾습니다. (연결 요소)"""
+    parent = list(range(len(rows)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i, (h1, d1, s1, e1) in enumerate(rows):
+        for j, (h2, d2, s2, e2) in enumerate(rows[:i]):
+            if h1 == h2 and d1 == d2 and s1 < e2 and s2 < e1:
+                parent[find(i)] = find(j)
+    groups = {}
+    for i in range(len(rows)):
+        groups.setdefault(find(i), set()).add(i)
+    return sorted(sorted(group) for group in groups.values() if len(group) > 1)
+
+
+def test_no_rows():
+    assert _clusters([]) == []
+
+
+def test_touching_schedules_do_not_conflict():
+    assert _clusters([('가', '토요일', 600, 660), ('가', '토요일', 660, 720)]) == []
+
+
+def test_chained_overlaps_form_one_cluster():
+    rows = [
+        ('가', '토요일', 700, 760),  # 0
+        ('가', '토요일', 600, 650),  # 1
+        ('가', '토요일', 640, 710),  # 2: 1과 겹치고 0과도 겹침
+        ('나', '토요일', 600, 700),  # 3: 다른 사람
+        ('가', '일요일', 600, 700),  # 4: 다른 요일
+    ]
+
+    assert _clusters(rows) == [[1, 2, 0]]
+
+
+def test_clusters_follow_helper_first_appearance_then_day_then_start():
+    rows = [
+        ('나', '토요일', 600, 700),
+        ('가', '토요일', 650, 700),
+        ('나', '토요일', 630, 640),
+        ('가', '토요일', 600, 660),
+        ('가', '금요일', 600, 610),
+        ('가', '금요일', 605, 620),
+    ]
+
+    assert _clusters(rows) == [[0, 2], [4, 5], [3, 1]]
+
+
+def test_matches_brute_force_on_random_rows():
+    rng = random.Random(11)
+    rows = []
+    for _ in range(400):
+        start = rng.randrange(8 * 60, 20 * 60, 5)
+        rows.append((f"사람{rng.randrange(25)}", rng.choice(['금요일', '토요일']), start, start + rng.choice([10, 30, 60])))
+
+    assert sorted(sorted(int(i) for i in cluster) for cluster in _clusters(rows)) == _brute_force(rows)
@@ -0,0 +1,150 @@
+import filecmp
+import os
+import shutil
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from benchmarks.bench_linearize import legacy_linearize_cue_sheet, make_synthetic_sheet
+from cue_common.columnar_snapshot import read_sheet_frame
+from cue_stages import as_linearize_input, compact_intervals, linearize_cue_sheet, tidy_cue_sheet
+from run_cue_pipeline import find_day_files, run_all_days, run_pipeline
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INITIAL_DIR = os.path.join(REPO_DIR, 'initial_csv_files')
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+# 골든 파일은 각 요일 큐시트의 최종 일정 CSV입니다. (8.15, 8.16은 구간 압축으로 바뀐 결과, 나머지는 예전 3 → 4 → 5 → 6 결과와 같음)
+DAY_FILES = find_day_files(INITIAL_DIR)
+
+
+def _golden_path(input_path):
+    return os.path.join(GOLDEN_DIR, f"{os.path.splitext(os.path.basename(input_path))[0]}_event_schedule.csv")
+
+
+@pytest.mark.parametrize('input_path', DAY_FILES, ids=lambda path: os.path.basename(path).split('_')[-1])
+def test_pipeline_matches_golden_output(input_path, tmp_path):
+    output_path = str(tmp_path / 'event_schedule.csv')
+    timings = run_pipeline(input_path, output_path, log=lambda line: None)
+
+    assert filecmp.cmp(output_path, _golden_path(input_path), shallow=False)
+    assert list(timings) == ['3_tidy', '4_linearlize', '6_event_time_tidy']
+
+
+def test_golden_event_counts():
+    # 예전 5·6단계 대비 8.15는 45 → 57개, 8.16은 53 → 55개
+    # (같은 시간 다른 장소의 일정을 버리지 않고, 빈 시간대를 사이에 둔 같은 일정은 따로 묶기 때문)
+    counts = {os.path.basename(path).split('_')[-1][:-4]: len(pd.read_csv(_golden_path(path))) for path in DAY_FILES}
+    assert counts == {'8.13수': 1, '8.14목': 19, '8.15금': 57, '8.16토': 55, '8.17일': 8}
+
+
+def test_numbered_scripts_match_runner_stage_by_stage(tmp_path):
+    input_path = next(path for path in DAY_FILES if '8.15' in path)
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    run_pipeline(input_path, str(tmp_path / 'runner.csv'), intermediate_dir=str(tmp_path / 'runner'),
+                 log=lambda line: None)
+
+    bots_dir = os.path.join(REPO_DIR, 'sheets_bots')
+    stages = [('3_tidy_cue_sheets.py', input_path, tmp_path / 'tidy.csv', '_tidy'),
+              ('4_linearlize_cue_sheets.py', tmp_path / 'tidy.csv', tmp_path / 'linear.csv', '_linear'),
+              ('6_event_time_tidy.py', tmp_path / 'linear.csv', tmp_path / 'events.csv', None)]
+    for script, stage_input, stage_output, suffix in stages:
+        subprocess.run([sys.executable, os.path.join(bots_dir, script), str(stage_input), str(stage_output)],
+                       cwd=bots_dir, check=True, capture_output=True)
+        runner_output = tmp_path / 'runner' / f"{base_name}{suffix}.csv" if suffix else tmp_path / 'runner.csv'
+        assert filecmp.cmp(stage_output, runner_output, shallow=False), script
+
+
+def test_find_day_files_orders_by_date_and_skips_rosters():
+    assert [os.path.basename(path).split('_')[-1] for path in DAY_FILES] == [
+        '8.13수.csv', '8.14목.csv', '8.15금.csv', '8.16토.csv', '8.17일.csv']
+
+
+def test_run_all_days_matches_golden_and_reports_failures(tmp_path):
+    input_dir = tmp_path / 'input'
+    input_dir.mkdir()
+    for path in DAY_FILES:
+        shutil.copy(path, input_dir)
+    (input_dir / '큐시트_8.18월.csv').write_text('깨진 파일\n', encoding='utf-8')
+    log_lines = []
+
+    failed = run_all_days(str(input_dir), str(tmp_path / 'output'), workers=2, log=log_lines.append)
+
+    assert [os.path.basename(path) for path in failed] == ['큐시트_8.18월.csv']
+    for path in DAY_FILES:
+        output_path = tmp_path / 'output' / os.path.basename(_golden_path(path))
+        assert filecmp.cmp(output_path, _golden_path(path), shallow=False)
+    # 프로세스가 끝나는 순서와 관계없이 로그는 요일 순서대로 모입니다.
+    done_lines = [line for line in log_lines if line.startswith(('✅', '❌'))]
+    assert [line.split('_')[1][:5] for line in done_lines] == ['8.13수', '8.14목', '8.15금', '8.16토', '8.17일', '8.18월']
+
+
+@pytest.mark.parametrize('input_path', DAY_FILES, ids=lambda path: os.path.basename(path).split('_')[-1])
+def test_linearize_matches_legacy_row_loop_on_day_sheets(input_path):
+    df = as_linearize_input(tidy_cue_sheet(read_sheet_frame(input_path)))
+
+    pd.testing.assert_frame_equal(linearize_cue_sheet(df).astype(object), legacy_linearize_cue_sheet(df).astype(object))
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_linearize_matches_legacy_row_loop_on_synthetic_sheets(seed):
+    df = make_synthetic_sheet(num_blocks=6, num_slots=80, seed=seed)
+
+    pd.testing.assert_frame_equal(linearize_cue_sheet(df).astype(object), legacy_linearize_cue_sheet(df).astype(object))
+
+
+def _linear(rows):
+    return pd.DataFrame(rows, columns=['시간', '일정', '장소', '세부 내용', '담당자', '필요 도우미 수', '배정된 도우미'])
+
+
+def test_compact_intervals_splits_on_gaps_and_key_changes():
+    df = _linear([
+        ['AM 9:00', '안내', '-', '', '', 1, ''],
+        ['AM 9:15', '안내', '-', '', '', 1, ''],
+        ['AM 9:30', '안내', '로비', '', '', 1, ''],    # 장소가 바뀌면 새 일정
+        ['AM 10:00', '안내', '로비', '', '', 1, ''],   # 9:45가 비어 있으면 새 일정
+        ['AM 10:00', '동아리', '11-201', '', '', 2, ''],
+        ['AM 10:00', '동아리', '11-302', '', '', 2, ''],
+        ['PM 12:45', '점심', '식당', '', '', 3, ''],
+    ])
+
+    events = compact_intervals(df)
+
+    assert events[['시작시간', '종료시간', '일정', '장소']].values.tolist() == [
+        ['AM 9:00', 'AM  09:30', '안내', '-'],
+        ['AM 9:30', 'AM  09:45', '안내', '로비'],
+        ['AM 10:00', 'AM  10:15', '안내', '로비'],
+        ['AM 10:00', 'AM  10:15', '동아리', '11-201'],
+        ['AM 10:00', 'AM  10:15', '동아리', '11-302'],
+        ['PM 12:45', 'PM  01:00', '점심', '식당'],
+    ]
+
+
+def test_compact_intervals_merges_rows_of_one_slot_and_sorts_by_start():
+    df = _linear([
+        ['PM 2:00', '세미나', '대강당', '', '', 4, ''],
+        ['PM 2:00', '세미나', '대강당', '하위 행', '', 4, ''],
+        ['PM 2:15', '세미나', '대강당', '', '', 4, ''],
+        ['AM 11:00', '준비', '대강당', '', '', 2, ''],
+    ])
+
+    events = compact_intervals(df)
+
+    assert events[['시작시간', '종료시간', '일정']].values.tolist() == [
+        ['AM 11:00', 'AM  11:15', '준비'],
+        ['PM 2:00', 'PM  02:30', '세미나'],
+    ]
+    assert list(events.columns) == ['시작시간', '종료시간', '일정', '장소', '세부 내용', '담당자', '필요 도우미 수', '배정된 도우미']
+
+
+def test_compact_intervals_key_and_slot_width_are_configurable():
+    df = _linear([
+        ['AM 9:00', '안내', '-', '', '', 1, ''],
+        ['AM 9:30', '안내', '로비', '', '', 1, ''],
+    ])
+
+    assert len(compact_intervals(df)) == 2
+    events = compact_intervals(df, key=['일정'], slot_minutes=30)
+    assert events[['시작시간', '종료시간', '장소']].values.tolist() == [['AM 9:00', 'AM  10:00', '-']]
+    assert compact_intervals(df.iloc[:0]).empty
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+
+from cue_common.fill import forward_fill_frame, forward_fill_rows
+
+
+def test_forward_fill_rows_pads_and_strips():
+    rows = [
+        ['', ' 접수 ', '가'],
+        ['1', '  ', ''],
+        ['2', '안내'],
+        ['', '', ' '],
+    ]
+
+    assert forward_fill_rows(rows) == [
+        ['', ' 접수 ', '가'],
+        ['1', '접수', '가'],
+        ['2', '안내', '가'],
+        ['2', '안내', '가'],
+    ]
+    assert forward_fill_rows(rows, strip_filled=False)[1] == ['1', ' 접수 ', '가']
+    assert rows[1] == ['1', '  ', '']  # 입력은 바꾸지 않음
+    assert forward_fill_rows([]) == []
+
+
+def test_forward_fill_frame_down_selected_columns():
+    df = pd.DataFrame([
+        ['금요일', '7:30', ' 세팅 ', 'x'],
+        [np.nan, '8:00', '', None],
+        ['', '  ', np.nan, 'y'],
+        ['토요일', '9:00', '식사', np.nan],
+    ], columns=['요일', '시작', '일정', '요일'])
+
+    filled = forward_fill_frame(df, positions=[0, 2])
+
+    assert filled.iloc[:, 0].tolist() == ['금요일', '금요일', '금요일', '토요일']
+    assert filled.iloc[:, 2].tolist() == [' 세팅 ', ' 세팅 ', ' 세팅 ', '식사']  # 원래 값 그대로 채움
+    assert filled.iloc[:, 1].equals(df.iloc[:, 1]) and filled.iloc[:, 3].equals(df.iloc[:, 3])
+    assert pd.isna(df.iloc[1, 0])  # 입력은 바꾸지 않음
+    assert forward_fill_frame(df, strip_filled=True).iloc[1, 2] == '세팅'
+
+
+def test_forward_fill_frame_across_columns():
+    df = pd.DataFrame([['A', '', 'B', ''], ['', 'C', '', np.nan]])
+
+    filled = forward_fill_frame(df, positions=[0, 1, 2], axis=1)
+
+    assert filled.values.tolist()[0] == ['A', 'A', 'B', '']
+    assert filled.values.tolist()[1][:3] == ['', 'C', 'C']
+    assert pd.isna(filled.iloc[1, 3])
+
+
+def test_forward_fill_frame_matches_ffill_for_missing_values():
+    rng = np.random.default_rng(5)
+    values = rng.choice(['가', '나', '다', None], size=(50, 4)).astype(object)
+    df = pd.DataFrame(values, columns=list('abcd'))
+
+    assert forward_fill_frame(df).equals(df.ffill())
+
+
+def test_forward_fill_frame_keeps_dtypes_and_empty_frames():
+    df = pd.DataFrame({'순번': [1, 2, 3], '일정': ['a', '', 'b']})
+
+    filled = forward_fill_frame(df)
+
+    assert filled.dtypes.tolist() == df.dtypes.tolist()
+    assert filled['일정'].tolist() == ['a', 'a', 'b']
+    assert forward_fill_frame(df.iloc[:0]).empty
+    assert forward_fill_frame(df, positions=[]).equals(df)
@@ -0,0 +1,56 @@
+import importlib
+import os
+
+import pytest
+
+from cue_common import fonts
+
+
+def test_collect_characters_walks_nested_tables():
+    characters = fonts.collect_characters([('이희언', [['AM 9:00', None, 3]])], '세팅')
+
+    assert characters == set('이희언AM 9:00') | {'3'} | set('세팅')
+
+
+def test_subset_keeps_requested_glyphs_and_is_cached(tmp_path):
+    ttLib = pytest.importorskip('fontTools.ttLib')
+    if not fonts.SUBSET_AVAILABLE:
+        pytest.skip("fontTools.subset를 쓸 수 없습니다")
+
+    path = fonts.subset_font(set('큐시트'), subset_dir=str(tmp_path))
+
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.getsize(path) < os.path.getsize(fonts.FONT_PATH) / 10
+    cmap = ttLib.TTFont(path).getBestCmap()
+    assert all(ord(ch) in cmap for ch in '큐시트AZaz09:')
+    assert ord('희') not in cmap
+    mtime = os.path.getmtime(path)
+    assert fonts.subset_font(set('트시큐'), subset_dir=str(tmp_path)) == path  # 같은 글자 집합이면 다시 만들지 않음
+    assert os.path.getmtime(path) == mtime
+    assert fonts.subset_font(set('큐시트희'), subset_dir=str(tmp_path)) != path
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_subset_falls_back_to_full_font_without_fonttools(tmp_path, monkeypatch):
+    monkeypatch.setattr(fonts, 'SUBSET_AVAILABLE', False)
+
+    assert fonts.subset_font(set('큐시트'), subset_dir=str(tmp_path)) == fonts.FONT_PATH
+    assert os.listdir(tmp_path) == []
+
+
+def test_register_reportlab_font_once_and_render_hangul(tmp_path, monkeypatch):
+    pytest.importorskip('reportlab')
+    from reportlab.lib.fonts import tt2ps
+    from reportlab.pdfbase import pdfmetrics
+    monkeypatch.setattr(fonts, '_registered_fonts', {})
+    registrations = []
+    register_font = pdfmetrics.registerFont
+    monkeypatch.setattr(pdfmetrics, 'registerFont', lambda font: registrations.append(font) or register_font(font))
+
+    font_name = fonts.register_reportlab_font()
+    assert fonts.register_reportlab_font() == font_name == fonts.FONT_NAME
+    assert len(registrations) == 1
+    assert tt2ps(font_name, 1, 0) == tt2ps(font_name, 1, 1) == font_name  # <b>, <i>도 같은 폰트로 연결됨
+    personal_cue = importlib.import_module('3_personal_cue')
+    pdf = personal_cue.create_pdf([['시간', '일정'], ['AM 9:00', '접수']], '이희언 Sheet', font_name).getvalue()
+    assert pdf.startswith(b'%PDF') and font_name.encode('ascii') in pdf
@@ -0,0 +1,35 @@
+from cue_common import import_manifest
+
+
+def test_entries_are_kept_per_csv_path(tmp_path):
+    manifest = {'spreadsheets': {}}
+    import_csv = str(tmp_path / 'initial.csv')
+    personal_csv = str(tmp_path / 'personal.csv')
+    for path in (import_csv, personal_csv):
+        open(path, 'w').close()
+
+    import_manifest.record_sheet(manifest, 'S', '8.13(수)', import_csv, 'h1', 't1', 3)
+    import_manifest.record_sheet(manifest, 'S', '8.13(수)', personal_csv, 'h2', 't2', 3)
+
+    assert import_manifest.is_content_unchanged(manifest, 'S', '8.13(수)', 'h1', import_csv)
+    assert import_manifest.is_content_unchanged(manifest, 'S', '8.13(수)', 'h2', personal_csv)
+    assert not import_manifest.is_content_unchanged(manifest, 'S', '8.13(수)', 'h2', import_csv)
+    assert import_manifest.is_revision_unchanged(manifest, 'S', '8.13(수)', 't1', import_csv)
+    assert not import_manifest.is_revision_unchanged(manifest, 'S', '8.13(수)', 't1', personal_csv)
+
+
+def test_old_single_entry_format_is_treated_as_missing(tmp_path):
+    csv_path = str(tmp_path / 'old.csv')
+    open(csv_path, 'w').close()
+    manifest = {'spreadsheets': {'S': {'시트': {'csv_path': csv_path, 'hash': 'h', 'modified_time': 't'}}}}
+
+    assert not import_manifest.is_content_unchanged(manifest, 'S', '시트', 'h', csv_path)
+    import_manifest.record_sheet(manifest, 'S', '시트', csv_path, 'h', 't', 1)
+    assert import_manifest.is_revision_unchanged(manifest, 'S', '시트', 't', csv_path)
+
+
+def test_missing_csv_is_never_unchanged(tmp_path):
+    manifest = {'spreadsheets': {}}
+    csv_path = str(tmp_path / 'gone.csv')
+    import_manifest.record_sheet(manifest, 'S', '시트', csv_path, 'h', 't', 1)
+    assert not import_manifest.is_content_unchanged(manifest, 'S', '시트', 'h', csv_path)
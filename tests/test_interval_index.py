@@ -0,0 +1,58 @@
+import random
+
+from cue_common.interval_index import IntervalIndex, build_day_index, intervals_by_day
+
+
+def _brute_force(intervals, start, end):
+    return {name for s, e, name in intervals if s < end and start < e}
+
+
+def test_busy_names_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for i in range(300):
+        start = rng.randrange(6 * 60, 22 * 60, 5)
+        intervals.append((start, start + rng.choice([15, 30, 60, 90, 240]), f"사람{i % 40}"))
+    index = IntervalIndex(intervals)
+
+    assert len(index) == 300
+    for _ in range(200):
+        start = rng.randrange(5 * 60, 23 * 60, 5)
+        end = start + rng.choice([5, 30, 120])
+        assert index.busy_names(start, end) == _brute_force(intervals, start, end)
+
+
+def test_touching_intervals_do_not_overlap():
+    index = IntervalIndex([(600, 660, '가'), (660, 720, '나')])
+
+    assert index.busy_names(660, 700) == {'나'}
+    assert index.busy_names(540, 600) == set()
+    assert index.busy_names(659, 661) == {'가', '나'}
+
+
+def test_long_interval_found_from_far_right():
+    # 길게 이어지는 구간은 시작이 한참 앞이어도 찾아야 합니다. (max_duration으로 왼쪽 끝을 자름)
+    index = IntervalIndex([(480, 1200, '종일'), (900, 930, '짧음'), (1000, 1010, '뒤')])
+
+    assert index.busy_names(1100, 1110) == {'종일'}
+    assert index.busy_names(905, 1005) == {'종일', '짧음', '뒤'}
+
+
+def test_empty_index():
+    index = IntervalIndex([])
+
+    assert len(index) == 0
+    assert index.busy_names(0, 1440) == set()
+
+
+def test_build_day_index_groups_by_day():
+    assigned = {
+        '가': [('토요일', 600, 660, '접수'), ('일요일', 600, 660, '정리')],
+        '나': [('토요일', 630, 700, '안내')],
+    }
+
+    assert sorted(intervals_by_day(assigned)['토요일']) == [(600, 660, '가'), (630, 700, '나')]
+    indexes = build_day_index(assigned)
+    assert set(indexes) == {'토요일', '일요일'}
+    assert indexes['토요일'].busy_names(650, 655) == {'가', '나'}
+    assert indexes['일요일'].busy_names(650, 655) == {'가'}
@@ -0,0 +1,69 @@
+from cue_common.name_index import NameIndex, _edit_distance, ask_name, suggest_names, to_jamo
+
+NAMES = ['김철수', '김철민', '김처음', '박영희', '이희언', 'Kim Minji', '최 현수']
+
+
+def test_to_jamo_splits_syllables_and_drops_spaces():
+    assert to_jamo('김철수') == 'ㄱㅣㅁㅊㅓㄹㅅㅜ'
+    assert to_jamo('최 현수') == to_jamo('최현수')
+    assert to_jamo('Kim Minji') == 'kimminji'
+
+
+def test_exact_and_contains_ignore_spacing_and_case():
+    index = NameIndex(NAMES + ['', None])
+
+    assert len(index) == len(NAMES)
+    assert '김철수' in index
+    assert '최현수' not in index
+    assert index.exact('최현수') == ['최 현수']
+    assert index.exact('kimminji') == ['Kim Minji']
+
+
+def test_lookup_finds_typos_by_jamo_distance():
+    index = NameIndex(NAMES)
+
+    assert index.lookup('김철슈')[0] == ('김철수', 1)
+    assert index.lookup('김철스')[0] == ('김철수', 1)
+    assert index.lookup('박영휘', limit=1) == [('박영희', 1)]
+    assert index.lookup('전혀다른이름') == []
+    assert index.lookup('') == []
+
+
+def test_lookup_finds_closest_name_of_full_scan():
+    surnames, given = '김이박최정강조윤장임', ['철수', '영희', '민수', '지원', '현우', '서연', '하늘', '도윤']
+    names = [f"{s}{g}{suffix}" for s in surnames for g in given for suffix in ('', '아')]
+    index = NameIndex(names)
+
+    for query in ['김철슈', '이영히', '최지윈', '장하는아', '윤도윤']:
+        key = to_jamo(query)
+        best = min(_edit_distance(key, to_jamo(name), len(key)) for name in names)
+        found = index.lookup(query)
+        assert found and found[0][1] == best
+        assert [distance for _, distance in found] == sorted(distance for _, distance in found)
+
+
+def test_complete_uses_jamo_prefix():
+    index = NameIndex(NAMES)
+
+    assert index.complete('김처') == ['김처음', '김철민', '김철수']
+    assert index.complete('김철') == ['김철민', '김철수']
+    assert index.complete('김철', limit=1) == ['김철민']
+    assert index.complete('없') == []
+
+
+def test_suggest_names_merges_completion_and_lookup():
+    index = NameIndex(NAMES)
+
+    assert suggest_names(index, '김철') == ['김철민', '김철수']
+    assert suggest_names(index, '이희어')[0] == '이희언'
+
+
+def test_ask_name():
+    index = NameIndex(NAMES)
+    answers = iter(['2', ''])
+
+    assert ask_name(index, ' 김철수 ') == '김철수'
+    assert ask_name(index, '최현수') == '최 현수'
+    assert ask_name(index, '김철', input_func=lambda prompt: next(answers)) == '김철수'
+    assert ask_name(index, '김철', input_func=lambda prompt: next(answers)) == '김철'
+    assert ask_name(index, '전혀다른이름') == '전혀다른이름'
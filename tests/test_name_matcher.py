@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from cue_common.name_matcher import NameMatcher
+
+
+def test_whole_word_skips_names_inside_longer_words():
+    matcher = NameMatcher(['이희', '김철수'])
+
+    assert matcher.names_in('이희, 김철수') == {'이희', '김철수'}
+    assert matcher.names_in('이희언') == set()
+    assert matcher.names_in('(이희)') == {'이희'}
+
+
+def test_substring_mode_matches_like_in_operator():
+    names = ['이희', '이희언', '철수']
+    matcher = NameMatcher(names, whole_word=False)
+
+    for text in ['이희언 담당', '김철수', '없음', '']:
+        assert matcher.names_in(text) == {name for name in names if name in text}
+
+
+def test_finditer_reports_overlapping_names():
+    matcher = NameMatcher(['희언', '이희언'], whole_word=False)
+
+    assert sorted(matcher.finditer('이희언')) == [(0, 3, '이희언'), (1, 3, '희언')]
+
+
+def test_names_with_surrounding_spaces_map_back_to_original():
+    matcher = NameMatcher([' 김철수', '김철수', '', None])
+
+    assert matcher.patterns == ['김철수']
+    assert matcher.names_in('김철수') == {' 김철수', '김철수'}
+
+
+def test_index_rows_matches_legacy_row_scan_with_blank_cells():
+    day_df = pd.DataFrame({
+        '일정': ['자리 세팅', '식사', '정리', np.nan],
+        '배정된 도우미 이름': ['이희, 김철수', np.nan, '김철수', '이희언'],
+    })
+    helpers = ['이희', '김철수', '박영희']
+
+    rows = NameMatcher(helpers, whole_word=False).index_rows(day_df.map(str).agg(" ".join, axis=1))
+
+    legacy = {name: [i for i, (_, row) in enumerate(day_df.iterrows()) if name in " ".join(str(c) for c in row.values)]
+              for name in helpers}
+    assert rows == {name: positions for name, positions in legacy.items() if positions}
+    assert rows == {'이희': [0, 3], '김철수': [0, 2]}
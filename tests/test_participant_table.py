@@ -0,0 +1,71 @@
+import random
+
+from cue_common.participant_table import assemble_participant_table, build_participant_index, slice_group_columns
+
+GROUP_STARTS = [6, 9, 12, 15, 18, 21]
+NAMES = ['이희', '이희언', '김지혜', '최윤영', '장정현']
+
+
+def _legacy_table(name, header_rows, body_rows, group_starts):
+    """비교용: 예전 make_sheet_file의 참가자별 표 만들기 (참가자마다 본문 전체를 다시 훑음)."""
+    active_set_indexes = []
+    for i, s in enumerate(group_starts):
+        for row in body_rows:
+            if len(row) > s + 2 and (name in row[s+1] or name in row[s+2]):
+                active_set_indexes.append(i)
+                break
+    if not active_set_indexes:
+        return None
+    result = []
+    for header_row in header_rows:
+        new_header = header_row[:6]
+        for i in active_set_indexes:
+            s = group_starts[i]
+            new_header += header_row[s:s+3]
+        result.append(new_header)
+    for row in body_rows:
+        new_row = row[:6]
+        for i in active_set_indexes:
+            s = group_starts[i]
+            def mark(cell): return cell.replace(name, f"[{name}]") if name in cell else cell
+            if len(row) > s + 2:
+                new_row += [row[s], mark(row[s+1]), mark(row[s+2])]
+            else:
+                new_row += ["", "", ""]
+        result.append(new_row)
+    return result
+
+
+def _tables(header_rows, body_rows):
+    index = build_participant_index(body_rows, GROUP_STARTS, NAMES)
+    fixed_columns, group_columns = slice_group_columns(header_rows, body_rows, GROUP_STARTS)
+    return {name: assemble_participant_table(name, index[name], fixed_columns, group_columns, len(header_rows))
+            if index[name]['groups'] else None for name in NAMES}
+
+
+def _random_sheet(rng):
+    cells = ['', '-', '세팅', '이희', '이희언', '이희, 김지혜', '김지혜(리더)', '최윤영 장정현', '이희언이희']
+    header_rows = [[f"머리{r}-{c}" for c in range(24)] for r in range(2)]
+    body_rows = [[rng.choice(cells) for _ in range(rng.choice([5, 12, 20, 24]))] for _ in range(rng.randrange(1, 15))]
+    return header_rows, body_rows
+
+
+def test_tables_match_legacy_loop_on_random_sheets():
+    rng = random.Random(18)
+    for _ in range(200):
+        header_rows, body_rows = _random_sheet(rng)
+        assert _tables(header_rows, body_rows) == {
+            name: _legacy_table(name, header_rows, body_rows, GROUP_STARTS) for name in NAMES}
+
+
+def test_index_records_groups_and_cells_to_mark():
+    body_rows = [['시간'] * 6 + ['접수', '이희언', '-', '안내', '이희', '']]
+
+    index = build_participant_index(body_rows, GROUP_STARTS, NAMES)
+
+    assert index['이희'] == {'groups': [0, 1], 'cells': [(0, 0, 1), (0, 1, 1)]}  # 부분 문자열 기준 (예전과 같음)
+    assert index['이희언'] == {'groups': [0], 'cells': [(0, 0, 1)]}
+    assert index['김지혜'] == {'groups': [], 'cells': []}
+    fixed_columns, group_columns = slice_group_columns([], body_rows, GROUP_STARTS)
+    assert assemble_participant_table('이희', index['이희'], fixed_columns, group_columns, 0) == [
+        ['시간'] * 6 + ['접수', '[이희]언', '-', '안내', '[이희]', '']]
@@ -0,0 +1,108 @@
+import importlib
+import os
+import threading
+
+import pytest
+
+from cue_common.render_cache import RenderCache
+
+personal_cue = importlib.import_module('3_personal_cue')
+
+TABLES = [(name, [['시간', '일정', '역할'], ['AM 9:00', '접수', f"[{name}]"]]) for name in ('가', '나', '다')]
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """replay 모드처럼 업로드 대신 tmp_path에 PDF를 저장하고, 결과 목록은 테스트마다 새로 씁니다."""
+    monkeypatch.setattr(personal_cue, 'OFFLINE', True)
+    monkeypatch.setattr(personal_cue, 'REPLAY_OUTPUT_DIR', str(tmp_path / 'uploaded'))
+    monkeypatch.setattr(personal_cue, 'UPLOAD_PUT_TIMEOUT', 0.05)
+    for name in ('success_list', 'fail_list', 'skipped_list'):
+        monkeypatch.setattr(personal_cue, name, [])
+    return RenderCache(str(tmp_path / 'cache'))
+
+
+def _run_in_thread(**kwargs):
+    """run_pipeline이 멈추지 않고 끝나는지 확인하기 위해 별도 스레드에서 실행합니다."""
+    outcome = {}
+
+    def target():
+        try:
+            personal_cue.run_pipeline(**kwargs)
+        except Exception as e:
+            outcome['error'] = e
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+    assert not thread.is_alive(), "run_pipeline이 끝나지 않았습니다"
+    return outcome.get('error')
+
+
+def test_pipeline_renders_uploads_and_reuses_cache(pipeline, tmp_path, capsys):
+    personal_cue.run_pipeline(TABLES, None, pipeline, render_workers=2, upload_workers=2, queue_size=1)
+
+    assert sorted(personal_cue.success_list) == ['가', '나', '다'] and personal_cue.fail_list == []
+    uploaded = sorted(os.listdir(tmp_path / 'uploaded'))
+    assert [name.split('_')[0] for name in uploaded] == ['가', '나', '다']
+    assert all(name.split('_')[1] == personal_cue.day_tag for name in uploaded)
+    assert (pipeline.hits, pipeline.misses) == (0, 3)
+    assert "🎨 렌더링: 3개 완료, 0개 실패" in capsys.readouterr().out
+
+    personal_cue.run_pipeline(TABLES, None, pipeline, render_workers=2, upload_workers=2, queue_size=1)
+    assert (pipeline.hits, pipeline.misses) == (3, 3)
+    assert len(personal_cue.success_list) == 6
+
+
+def test_failing_uploads_are_reported_and_pipeline_finishes(pipeline, monkeypatch):
+    def broken_upload(*args, **kwargs):
+        raise ConnectionError("네트워크 끊김")
+    monkeypatch.setattr(personal_cue, 'upload_file_to_drive', broken_upload)
+
+    error = _run_in_thread(tables=TABLES, creds=None, render_cache=pipeline,
+                           render_workers=2, upload_workers=2, queue_size=1)
+
+    assert error is None
+    assert sorted(personal_cue.fail_list) == ['가', '나', '다'] and personal_cue.success_list == []
+
+
+def test_failing_drive_service_marks_every_pdf_failed(pipeline, monkeypatch):
+    monkeypatch.setattr(personal_cue, 'OFFLINE', False)
+
+    def broken_build(*args, **kwargs):
+        raise RuntimeError("인증 만료")
+    monkeypatch.setattr(personal_cue, 'build', broken_build)
+
+    error = _run_in_thread(tables=TABLES, creds=None, render_cache=pipeline,
+                           render_workers=1, upload_workers=2, queue_size=1)
+
+    assert error is None
+    assert sorted(personal_cue.fail_list) == ['가', '나', '다']
+
+
+def test_dead_upload_threads_raise_instead_of_blocking(pipeline, monkeypatch):
+    monkeypatch.setattr(personal_cue, 'upload_worker', lambda *args: None)
+
+    error = _run_in_thread(tables=TABLES, creds=None, render_cache=pipeline,
+                           render_workers=1, upload_workers=2, queue_size=1)
+
+    assert isinstance(error, RuntimeError) and '업로드 스레드가 모두 종료' in str(error)
+
+
+def test_stage_and_queue_metrics_summaries(monkeypatch):
+    clock = iter([10.0, 12.0, 14.0])
+    monkeypatch.setattr(personal_cue.time, 'perf_counter', lambda: next(clock))
+    stage = personal_cue.StageMetrics("🎨 렌더링")
+
+    assert stage.summary() == "🎨 렌더링: 0개 완료, 0개 실패, 작업 시간 합계 0.0초, 구간 0.0초 (초당 0.0개)"
+    stage.start()
+    stage.record(1.5)
+    stage.start()  # 처음 시작 시각만 기록합니다.
+    stage.record(0.5, ok=False)
+    assert (stage.first_start, stage.last_end) == (10.0, 14.0)
+    assert stage.summary() == "🎨 렌더링: 1개 완료, 1개 실패, 작업 시간 합계 2.0초, 구간 4.0초 (초당 0.2개)"
+
+    queue = personal_cue.QueueMetrics(4)
+    assert queue.summary() == "📦 업로드 대기 큐: 최대 0/4, 평균 0.0, 큐가 가득 차 렌더링이 기다린 시간 0.0초"
+    for depth, blocked in [(1, 0.0), (4, 0.25), (3, 0.5)]:
+        queue.record(depth, blocked)
+    assert queue.summary() == "📦 업로드 대기 큐: 최대 4/4, 평균 2.7, 큐가 가득 차 렌더링이 기다린 시간 0.8초"
@@ -0,0 +1,53 @@
+import os
+
+from cue_common.render_cache import RenderCache
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return str(path)
+
+
+def test_key_depends_on_payload_dependencies_and_salt(tmp_path):
+    template = _write(tmp_path / 'template.html', '<h1>{{NAME}}</h1>')
+    cache = RenderCache(str(tmp_path / 'cache'), [template], salt='v1')
+
+    key = cache.key(['금요일', '이희언', ['표']])
+    assert key == RenderCache(str(tmp_path / 'cache'), [template], salt='v1').key(['금요일', '이희언', ['표']])
+    assert key != cache.key(['금요일', '이희언', ['다른 표']])
+    assert key != RenderCache(str(tmp_path / 'cache'), [template], salt='v2').key(['금요일', '이희언', ['표']])
+
+    _write(tmp_path / 'template.html', '<h2>{{NAME}}</h2>')
+    assert key != RenderCache(str(tmp_path / 'cache'), [template], salt='v1').key(['금요일', '이희언', ['표']])
+
+
+def test_dependency_order_and_missing_files(tmp_path):
+    a = _write(tmp_path / 'a.css', 'a')
+    b = _write(tmp_path / 'b.css', 'b')
+    missing = str(tmp_path / 'missing.ttf')
+
+    assert RenderCache('c', [a, b]).key(1) == RenderCache('c', [b, a]).key(1)
+    without_font = RenderCache('c', [a, missing]).key(1)
+    _write(missing, 'font')
+    assert RenderCache('c', [a, missing]).key(1) != without_font
+
+
+def test_store_and_load_round_trip(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache'))
+    key = cache.key('payload')
+
+    assert cache.load_bytes(key) is None
+    assert not cache.load_to(key, str(tmp_path / 'out.pdf'))
+    cache.store_bytes(key, b'%PDF-1')
+    assert cache.load_bytes(key) == b'%PDF-1'
+    assert cache.path_for(key) == os.path.join(str(tmp_path / 'cache'), key[:2], f"{key}.pdf")
+
+    rendered = tmp_path / 'rendered.pdf'
+    rendered.write_bytes(b'%PDF-2')
+    cache.store_file(key, str(rendered))
+    assert cache.load_to(key, str(tmp_path / 'out.pdf'))
+    assert (tmp_path / 'out.pdf').read_bytes() == b'%PDF-2'
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.summary() == "♻️ 렌더 캐시: 4개 중 2개 재사용, 2개 새로 렌더링"
+    assert not [name for name in os.listdir(os.path.dirname(cache.path_for(key))) if name.endswith('.tmp')]
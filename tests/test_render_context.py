@@ -0,0 +1,101 @@
+import csv
+import importlib
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('weasyprint')
+
+PERSONAL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Personal_cue_sheets')
+if PERSONAL_DIR not in sys.path:
+    sys.path.insert(0, PERSONAL_DIR)
+main_script = importlib.import_module('main_script')
+
+CUESHEET_ROWS = [
+    ['요일', '시작시간', '종료시간', '일정', '장소', '배정된 도우미'],
+    ['금요일', 'AM 10:00', 'AM 11:00', '접수', '로비', '김철수, 박영희'],
+    ['금요일', 'AM 9:00', 'AM 10:00', '세팅', '대강당', '김철수'],
+    ['토요일', 'PM 1:00', 'PM 2:00', '점심', '식당', '박영희'],
+]
+
+
+@pytest.fixture
+def cuesheet_df(tmp_path, monkeypatch):
+    cuesheet_path = tmp_path / 'cuesheet.csv'
+    with open(cuesheet_path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(CUESHEET_ROWS)
+    monkeypatch.setattr(main_script, 'CUESHEET_FILE', str(cuesheet_path))
+    monkeypatch.setattr(main_script, 'SCRIPT_DIR', str(tmp_path))
+    monkeypatch.setattr(main_script, 'get_helpers_by_day', lambda day_abbr: ['김철수', '박영희'])
+    return main_script.load_cuesheet(list(main_script.DAY_MAP))
+
+
+def test_render_html_fills_template():
+    html = main_script.RenderContext().render_html('김철수', '금요일', '<table></table>')
+
+    assert '김철수님 큐시트 (금요일)' in html and '<table></table>' in html
+    assert '{{HELPER_NAME}}' not in html and '{{SCHEDULE_TABLE}}' not in html
+
+
+def test_one_context_renders_every_pdf(cuesheet_df, tmp_path, monkeypatch):
+    stylesheets = []
+    css = main_script.CSS
+
+    def counting_css(*args, **kwargs):
+        stylesheets.append(css(*args, **kwargs))
+        return stylesheets[-1]
+    monkeypatch.setattr(main_script, 'CSS', counting_css)
+
+    assert main_script.generate_sheets(['금요일', '토요일'], cuesheet_df, workers=1) == []
+
+    pdf_paths = sorted(os.path.relpath(os.path.join(root, name), tmp_path / 'output')
+                       for root, _, names in os.walk(tmp_path / 'output') for name in names if name.endswith('.pdf'))
+    assert pdf_paths == [os.path.join('금요일', '김철수_큐시트.pdf'), os.path.join('금요일', '박영희_큐시트.pdf'),
+                         os.path.join('토요일', '박영희_큐시트.pdf')]
+    for path in pdf_paths:
+        with open(tmp_path / 'output' / path, 'rb') as f:
+            assert f.read(5) == b'%PDF-'
+    assert len(stylesheets) == 1  # style.css는 한 번만 해석합니다.
+
+
+def test_personal_csv_is_sorted_by_start_time(cuesheet_df, tmp_path):
+    jobs, failures = main_script.prepare_sheets_for_day('금요일', cuesheet_df)
+
+    assert [job[:2] for job in jobs] == [('금요일', '김철수'), ('금요일', '박영희')] and failures == []
+
+    with open(tmp_path / 'output' / '금요일' / '김철수_큐시트.csv', encoding='utf-8-sig') as f:
+        assert [row['일정'] for row in csv.DictReader(f)] == ['세팅', '접수']
+
+
+def test_render_pdf_jobs_in_a_pool_reports_in_order_and_collects_failures(tmp_path, capsys):
+    jobs = [('금요일', name, '<table></table>', str(tmp_path / f"{name}.pdf")) for name in ('가', '나', '다')]
+    jobs.insert(1, ('금요일', '없음', '<table></table>', str(tmp_path / 'missing' / '없음.pdf')))
+
+    failures = main_script.render_pdf_jobs(jobs, workers=2)
+
+    assert [(day, name) for day, name, _ in failures] == [('금요일', '없음')]
+    assert sorted(os.listdir(tmp_path)) == ['가.pdf', '나.pdf', '다.pdf']
+    progress = [line for line in capsys.readouterr().out.splitlines() if line.startswith(('🎨 (', '❗ ('))]
+    assert [line.split(')')[0][-3:] for line in progress] == ['1/4', '2/4', '3/4', '4/4']
+
+
+def test_render_cache_reuses_unchanged_pdfs(cuesheet_df, tmp_path, monkeypatch):
+    monkeypatch.setattr(main_script, 'RENDER_CACHE_DIR', str(tmp_path / 'cache'))
+    first, second = main_script.open_render_cache(), main_script.open_render_cache()
+
+    assert main_script.generate_sheets(['금요일'], cuesheet_df, workers=1, render_cache=first) == []
+    assert main_script.generate_sheets(['금요일'], cuesheet_df, workers=1, render_cache=second) == []
+    assert (first.hits, first.misses) == (0, 2)
+    assert (second.hits, second.misses) == (2, 0)
+
+
+def test_tiny_rss_cap_leaves_no_pdf_behind(tmp_path):
+    from cue_common.chunked_render import RenderMemoryError
+    render_context = main_script.RenderContext(max_rss_bytes=1)
+    tables = ['<table><tr><td>접수</td></tr></table>'] * 2
+
+    for html_tables in (tables[:1], tables):
+        with pytest.raises(RenderMemoryError):
+            render_context.write_pdf_chunks('김철수', '금요일', html_tables, str(tmp_path / '김철수_큐시트.pdf'))
+    assert os.listdir(tmp_path) == []
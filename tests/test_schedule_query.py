@@ -0,0 +1,127 @@
+import pytest
+
+from cue_common.schedule_query import (QUERY_AVAILABLE, QUERY_EXPORT, QUERY_OVERLAPS, QUERY_PERSON, ScheduleData,
+                                       find_available_helpers, parse_helpers, parse_query, run_query)
+
+
+def _data():
+    all_helpers = {
+        '김철수': {'team': '기획팀', 'days': ['토요일', '일요일']},
+        '박영희': {'team': '시설팀', 'days': ['토요일']},
+        '이민수': {'team': '기획팀', 'days': ['토요일']},
+        '최지원': {'team': '식사팀', 'days': ['일요일']},
+    }
+    assigned = {
+        '김철수': [('토요일', 600, 660, '10:00-11:00 접수'), ('토요일', 630, 700, '10:30-11:40 안내')],
+        '박영희': [('토요일', 660, 720, '11:00-12:00 정리')],
+    }
+    return ScheduleData(assigned, all_helpers)
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('4', (QUERY_EXPORT, ())),
+    ('  4  ', (QUERY_EXPORT, ())),
+    ('중복', (QUERY_OVERLAPS, ())),
+    ('김철수', (QUERY_PERSON, ('김철수',))),
+    (' 김철수\n', (QUERY_PERSON, ('김철수',))),
+    ('44', (QUERY_PERSON, ('44',))),
+    ('토 10:00', (QUERY_AVAILABLE, ('토', '10:00'))),
+    ('토요일  10:00   11:30', (QUERY_AVAILABLE, ('토요일', '10:00', '11:30'))),
+    ('4 중복', (QUERY_AVAILABLE, ('4', '중복'))),
+])
+def test_parse_query(text, expected):
+    assert parse_query(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', '   ', '토 10:00 11:00 12:00', '토 오후 1:00 오후 2:00'])
+def test_parse_query_rejects_malformed(text):
+    with pytest.raises(ValueError):
+        parse_query(text)
+
+
+def test_run_query_person():
+    data = _data()
+
+    assigned = run_query(data, '김철수')
+    assert assigned['ok'] and assigned['type'] == QUERY_PERSON and assigned['status'] == 'assigned'
+    assert assigned['schedules'] == {'토요일': ['10:00-11:00 접수', '10:30-11:40 안내']}
+    assert run_query(data, '이민수')['status'] == 'unassigned'
+    unknown = run_query(data, '김철슈')
+    assert unknown['status'] == 'unknown' and unknown['suggestions'][0] == '김철수'
+
+
+def test_run_query_available_point_and_range():
+    data = _data()
+
+    point = run_query(data, '토 10:30')
+    assert point['ok'] and point['day'] == '토요일' and point['time_range'] == '10:30'
+    assert point['teams'] == {'기획팀': ['이민수'], '시설팀': ['박영희']}
+    # 일정이 끝나는 시각에는 비어 있는 것으로 봅니다. (구간 [시작, 종료))
+    assert run_query(data, '토요일 11:40 12:30')['teams'] == {'기획팀': ['김철수', '이민수']}
+    assert run_query(data, '토 11:40 12:30')['time_range'] == '11:40 ~ 12:30'
+    assert run_query(data, '일 PM 1:00')['ok'] is False  # 공백이 든 시간은 세 번째 칸으로 나뉨
+
+
+def test_run_query_available_errors():
+    data = _data()
+
+    assert run_query(data, '토 10시') == {'query': '토 10시', 'type': QUERY_AVAILABLE, 'ok': False,
+                                          'error': "시간 형식이 올바르지 않습니다."}
+    assert run_query(data, '토 12:00 11:00')['error'] == "시작 시간이 종료 시간보다 늦을 수 없습니다."
+    assert run_query(data, '토 1 2 3')['error'] == "입력 형식이 올바르지 않습니다."
+    assert 'type' not in run_query(data, '')
+
+
+def test_run_query_export_and_overlaps():
+    data = _data()
+
+    export = run_query(data, '4')
+    assert [helper['name'] for helper in export['helpers']] == ['김철수', '박영희', '이민수', '최지원']
+    assert export['helpers'][2]['schedules'] == {}
+    overlaps = run_query(data, '중복')['overlaps']
+    assert overlaps == {'토요일': [{'helper': '김철수', 'schedules': ['10:00-11:00 접수', '10:30-11:40 안내']}]}
+
+
+def test_matrix_and_interval_paths_agree():
+    data = _data()
+    for start, end in [(600, 615), (605, 610), (655, 665), (700, 700), (540, 900)]:
+        for day in ('토요일', '일요일'):
+            fast = find_available_helpers(day, start, end, data.all_helpers, data.day_index, data.availability)
+            slow = find_available_helpers(day, start, end, data.all_helpers, data.day_index)
+            assert fast == slow
+
+
+def test_with_schedules_rebuilds_changed_days_only():
+    data = _data()
+    assigned = dict(data.assigned_schedules)
+    assigned['최지원'] = [('일요일', 600, 660, '10:00-11:00 정리')]
+
+    new_data, changed_days = data.with_schedules(assigned)
+
+    assert changed_days == ['일요일']
+    assert run_query(new_data, '일 10:30')['teams'] == {'기획팀': ['김철수']}
+    assert run_query(new_data, '최지원')['status'] == 'assigned'
+    assert new_data.name_index is data.name_index  # 이름이 그대로면 이름 색인도 함께 씁니다.
+    assert new_data.day_index['토요일'] is data.day_index['토요일']
+    # 원래 데이터는 그대로 (서버는 새 데이터를 다 만든 뒤에 바꿔 끼웁니다)
+    assert run_query(data, '일 10:30')['teams'] == {'기획팀': ['김철수'], '식사팀': ['최지원']}
+    assert '일요일' not in data.day_index
+
+
+def test_with_schedules_recomputes_exactness_of_changed_days():
+    data = _data()
+    assigned = dict(data.assigned_schedules)
+    assigned['최지원'] = [('일요일', 603, 660, '10:03-11:00 정리')]
+    off_grid, _ = data.with_schedules(assigned)
+    assert not off_grid.availability.is_exact('일요일') and off_grid.availability.is_exact('토요일')
+
+    on_grid, changed_days = off_grid.with_schedules({**assigned, '최지원': [('일요일', 600, 660, '10:00-11:00 정리')]})
+    assert changed_days == ['일요일'] and on_grid.availability.exact
+    assert not off_grid.availability.is_exact('일요일')
+
+
+def test_parse_helpers():
+    assert parse_helpers('김준민, 박주영(리더)') == ['김준민', '박주영']
+    assert parse_helpers(' - ') == []
+    assert parse_helpers('미정') == []
+    assert parse_helpers('') == []
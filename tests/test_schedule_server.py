@@ -0,0 +1,176 @@
+import asyncio
+import csv
+import importlib
+import json
+import os
+import threading
+from urllib.parse import quote
+
+import pytest
+
+server = importlib.import_module('2_schedule_server')
+
+SCHEDULE_HEADER = ['요일', '시작', '종료', '', '일정', '', '', '', '', '', '', '배정된 도우미']
+ROSTER_ROWS = [
+    ['', '', '', '', ''],
+    ['팀', '기획팀', '기획팀', '시설팀', '식사팀'],
+    ['이름', '김철수', '이민수', '박영희', '최지원'],
+    ['금', '', '', '', ''],
+    ['토', '1', '1', '1', ''],
+    ['일', '1', '', '', '1'],
+]
+
+
+def _schedule_row(day, start, end, event, helpers):
+    return [day, start, end, '', event, '', '', '', '', '', '', helpers]
+
+
+def _write_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        csv.writer(f).writerows(rows)
+
+
+@pytest.fixture
+def store(tmp_path):
+    schedule_path, helpers_path = str(tmp_path / 'schedule.csv'), str(tmp_path / 'helpers.csv')
+    _write_csv(schedule_path, [SCHEDULE_HEADER,
+                               _schedule_row('토요일', '10:00', '11:00', '접수', '김철수, 박영희(리더)')])
+    _write_csv(helpers_path, ROSTER_ROWS)
+    store = server.ScheduleStore(schedule_path, helpers_path)
+    store.load()
+    return store
+
+
+async def _http(port, raw):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(body.decode('utf-8'))
+
+
+def _get(path):
+    return f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode('ascii')
+
+
+def _with_http_server(store, client):
+    async def main():
+        http_server = await server.start_http_server(store, '127.0.0.1', 0)
+        try:
+            return await client(http_server.sockets[0].getsockname()[1])
+        finally:
+            http_server.close()
+            await http_server.wait_closed()
+    return asyncio.run(main())
+
+
+def test_http_round_trip(store):
+    async def client(port):
+        return [await _http(port, _get(f"/query?q={quote('토 10:30')}")),
+                await _http(port, _get(f"/query?q={quote('김철수')}")),
+                await _http(port, _get('/status')),
+                await _http(port, _get('/nope')),
+                await _http(port, b"POST /query HTTP/1.1\r\n\r\n")]
+
+    available, person, status, missing, post = _with_http_server(store, client)
+
+    assert available == (200, {'query': '토 10:30', 'type': 'available', 'ok': True, 'day': '토요일',
+                               'time_range': '10:30', 'count': 1, 'teams': {'기획팀': ['이민수']}})
+    assert person[0] == 200 and person[1]['schedules'] == {'토요일': ['10:00-11:00 접수']}
+    assert status[0] == 200 and status[1]['assigned_helpers'] == 2 and status[1]['roster_helpers'] == 4
+    assert missing[0] == 404 and post[0] == 405
+
+
+def test_http_rejects_oversized_request_line(store):
+    oversized = f"GET /query?q={'a' * server.MAX_REQUEST_LINE} HTTP/1.1\r\n\r\n".encode('utf-8')
+
+    async def client(port):
+        return await _http(port, oversized), await _http(port, b"GET\r\n\r\n")
+
+    (status, payload), (malformed, _) = _with_http_server(store, client)
+
+    assert status == 400 and payload['ok'] is False
+    assert malformed == 400
+
+
+def test_http_reports_query_errors_as_500(store, monkeypatch):
+    def broken_query(data, text):
+        raise RuntimeError("색인이 깨졌습니다")
+    monkeypatch.setattr(server, 'run_query', broken_query)
+
+    async def client(port):
+        return await _http(port, _get(f"/query?q={quote('김철수')}")), await _http(port, _get('/status'))
+
+    (status, payload), (status_after, _) = _with_http_server(store, client)
+
+    assert status == 500 and payload == {'ok': False, 'error': "서버 내부 오류: 색인이 깨졌습니다"}
+    assert status_after == 200  # 서버는 계속 응답합니다.
+
+
+def test_socket_round_trip(store, tmp_path):
+    socket_path = str(tmp_path / 'schedule.sock')
+
+    async def main():
+        socket_server = await server.start_socket_server(store, socket_path)
+        try:
+            reader, writer = await asyncio.open_unix_connection(socket_path)
+            lines = []
+            for query in ('이민수', '', '중복', 'status'):
+                writer.write(f"{query}\n".encode('utf-8'))
+            writer.write("종료\n".encode('utf-8'))
+            await writer.drain()
+            while line := await reader.readline():
+                lines.append(json.loads(line))
+            writer.close()
+            return lines
+        finally:
+            socket_server.close()
+            await socket_server.wait_closed()
+
+    person, overlaps, status = asyncio.run(main())
+
+    assert person['status'] == 'unassigned'
+    assert overlaps['overlaps'] == {}
+    assert status['reload_count'] == 0
+
+
+def test_reload_rebuilds_changed_day_off_the_event_loop(store, monkeypatch):
+    old_data = store.data
+    rebuild_threads = []
+    with_schedules = server.ScheduleData.with_schedules
+
+    def recording_with_schedules(data, assigned_schedules):
+        rebuild_threads.append(threading.current_thread())
+        return with_schedules(data, assigned_schedules)
+    monkeypatch.setattr(server.ScheduleData, 'with_schedules', recording_with_schedules)
+
+    _write_csv(store.schedule_path, [SCHEDULE_HEADER,
+                                     _schedule_row('토요일', '10:00', '11:00', '접수', '김철수, 박영희(리더)'),
+                                     _schedule_row('일요일', '10:00', '11:00', '정리', '최지원')])
+    mtime = os.path.getmtime(store.schedule_path) + 5
+    os.utime(store.schedule_path, (mtime, mtime))
+
+    asyncio.run(store.reload_if_changed())
+
+    assert rebuild_threads and rebuild_threads[0] is not threading.main_thread()
+    assert store.reload_count == 1 and store.last_error is None
+    assert store.data is not old_data
+    assert server.run_query(store.data, '일 10:30')['teams'] == {'기획팀': ['김철수']}
+    assert server.run_query(old_data, '일 10:30')['teams'] == {'기획팀': ['김철수'], '식사팀': ['최지원']}
+    asyncio.run(store.reload_if_changed())  # 바뀐 것이 없으면 다시 읽지 않습니다.
+    assert store.reload_count == 1
+
+
+def test_failed_reload_keeps_old_data(store):
+    old_data = store.data
+    with open(store.helpers_path, 'w', encoding='utf-8') as f:
+        f.write('')
+    mtime = os.path.getmtime(store.helpers_path) + 5
+    os.utime(store.helpers_path, (mtime, mtime))
+
+    asyncio.run(store.reload_if_changed())
+
+    assert store.data is old_data and store.last_error
+    assert store.reload_count == 0
@@ -0,0 +1,61 @@
+from cue_common import import_manifest, sheet_source
+
+
+class FakeWorksheet:
+    def __init__(self, title, values):
+        self.title = title
+        self._values = values
+
+    def get_all_values(self):
+        return self._values
+
+
+class FakeSpreadsheet:
+    title = '통합 큐시트'
+
+    def __init__(self, sheets, modified_time):
+        self._sheets = sheets
+        self._modified_time = modified_time
+
+    def get_lastUpdateTime(self):
+        return self._modified_time
+
+    def worksheet(self, title):
+        return FakeWorksheet(title, self._sheets[title])
+
+    def values_batch_get(self, ranges):
+        return {'valueRanges': [{'values': self._sheets[sheet_source._sheet_name_from_range(r)]} for r in ranges]}
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self._spreadsheet = spreadsheet
+
+    def open_by_key(self, spreadsheet_id):
+        return self._spreadsheet
+
+
+def test_record_then_replay_keeps_values_and_modified_time(tmp_path):
+    live = FakeSpreadsheet({'8.13(수)': [['a', 'b'], ['c']], '명단': [['x']]}, '2025-08-01T00:00:00Z')
+    recording = sheet_source.open_spreadsheet('S', lambda: FakeClient(live), mode=sheet_source.MODE_RECORD,
+                                              snapshot_dir=str(tmp_path))
+    recording.worksheet('8.13(수)').get_all_values()
+    recording.values_batch_get(["'명단'!A1:Z"])
+
+    replay = sheet_source.open_spreadsheet('S', None, mode=sheet_source.MODE_REPLAY, snapshot_dir=str(tmp_path))
+    assert replay.title == '통합 큐시트'
+    assert replay.get_lastUpdateTime() == '2025-08-01T00:00:00Z'
+    assert replay.worksheet('8.13(수)').get_all_values() == [['a', 'b'], ['c', '']]
+    assert replay.values_batch_get(["'명단'!A1:Z"])['valueRanges'][0]['values'] == [['x']]
+
+
+def test_record_mode_never_skips_unmodified_sheets(tmp_path, monkeypatch):
+    csv_path = str(tmp_path / 'sheet.csv')
+    open(csv_path, 'w').close()
+    manifest = {'spreadsheets': {}}
+    import_manifest.record_sheet(manifest, 'S', '시트', csv_path, 'h', 't', 1)
+
+    monkeypatch.setenv('CUE_SHEET_SOURCE', 'live')
+    assert import_manifest.is_revision_unchanged(manifest, 'S', '시트', 't', csv_path)
+    monkeypatch.setenv('CUE_SHEET_SOURCE', 'record')
+    assert not import_manifest.is_revision_unchanged(manifest, 'S', '시트', 't', csv_path)
@@ -0,0 +1,42 @@
+import pytest
+
+from cue_common.timeofday import format_ampm, format_hhmm, parse_minutes
+
+
+@pytest.mark.parametrize('text, minutes', [
+    ('7:30', 450),
+    (' 7:30 ', 450),
+    ('07:05', 425),
+    ('오후 21:00', 1260),
+    ('오후 5:30', 1050),
+    ('PM 5:30', 1050),
+    ('pm 5:30', 1050),
+    ('PM 12:15', 735),
+    ('AM 12:15', 15),
+    ('오전 12:00', 0),
+    ('오전 9:00', 540),
+    ('0:00', 0),
+    ('23:59', 1439),
+    ('시작 13:00 (변동)', 780),
+])
+def test_parse_minutes(text, minutes):
+    assert parse_minutes(text) == minutes
+
+
+@pytest.mark.parametrize('value', ['', '미정', '24:00', '12:60', '7시 30분', None, float('nan'), 730])
+def test_parse_minutes_rejects_non_times(value):
+    assert parse_minutes(value) is None
+
+
+def test_format_round_trips_through_parse():
+    for minutes in (0, 15, 450, 720, 735, 1050, 1439):
+        assert parse_minutes(format_hhmm(minutes)) == minutes
+        assert parse_minutes(format_ampm(minutes)) == minutes
+
+
+def test_format_examples():
+    assert format_hhmm(1050) == '17:30'
+    assert format_ampm(1050) == 'PM 5:30'
+    assert format_ampm(15) == 'AM 12:15'
+    assert format_ampm(735) == 'PM 12:15'
+    assert format_hhmm(24 * 60 + 5) == '00:05'  # 자정을 넘긴 값은 다음 날 시각으로